@@ -1,5 +1,4 @@
 from decouple import config
-from typing import Final
 
 SOFTWARE_ACRONYM = "Scior Tester"
 SOFTWARE_NAME = "Tester for the Identification of Ontological Categories for OWL Ontologies"
@@ -11,9 +10,10 @@ NAMESPACE_TAXONOMY = "http://taxonomy.model/"
 
 CLASSES_DATA_FILE_NAME = "data"
 HASH_FILE_NAME = "hash_sha256_register.csv"
+QUARANTINE_FILE_NAME = "quarantine.csv"
 BLOCK_SIZE = 65536
 
-EXCEPTIONS_LIST = ["lindeberg2022simple-ontorights", "van-ee2021modular"]
+EXCEPTIONS_LIST = ["lindeberg2022simple-ontorights"]
 """
 EXCEPTIONS_LIST = [
     "ahmad2018aviation",
@@ -47,22 +47,69 @@ EXCEPTIONS_LIST = [
 
 """
 ------------------------------------------------------------
-Constants
+Configured constants
 ------------------------------------------------------------
-"""
-CATALOG_FOLDER: Final[str] = config("CATALOG_FOLDER")
-AUTOMATIC: Final[bool] = bool(config("AUTOMATIC"))
-COMPLETE: Final[bool] = bool(config("COMPLETE"))
 
+The constants below are read from the environment (or from the .env file) only when they are first accessed (PEP 562),
+so that importing the package does not require its configuration.
 """
-------------------------------------------------------------
-TEST_2 constants
-------------------------------------------------------------
-"""
 
-MINIMUM_ALLOWED_NUMBER_CLASSES: Final[int] = int(config("MINIMUM_ALLOWED_NUMBER_CLASSES"))
-PERCENTAGE_INITIAL: Final[int] = int(config("PERCENTAGE_INITIAL"))
-PERCENTAGE_FINAL: Final[int] = int(config("PERCENTAGE_FINAL"))
-PERCENTAGE_RATE: Final[int] = int(config("PERCENTAGE_RATE"))
-NUMBER_OF_EXECUTIONS_PER_DATASET_PER_PERCENTAGE: Final[int] = \
-    int(config("NUMBER_OF_EXECUTIONS_PER_DATASET_PER_PERCENTAGE"))
+CONFIGURED_CONSTANTS = {
+    "CATALOG_FOLDER": lambda: config("CATALOG_FOLDER"),
+    "AUTOMATIC": lambda: bool(config("AUTOMATIC")),
+    "COMPLETE": lambda: bool(config("COMPLETE")),
+    "OUTPUT_BACKEND": lambda: config("OUTPUT_BACKEND", default="files"),
+    "CLASSES_OUTPUT_FORMAT": lambda: config("CLASSES_OUTPUT_FORMAT", default="yaml"),
+
+    # TEST_2 constants
+    "MINIMUM_ALLOWED_NUMBER_CLASSES": lambda: int(config("MINIMUM_ALLOWED_NUMBER_CLASSES")),
+    "PERCENTAGE_INITIAL": lambda: int(config("PERCENTAGE_INITIAL")),
+    "PERCENTAGE_FINAL": lambda: int(config("PERCENTAGE_FINAL")),
+    "PERCENTAGE_RATE": lambda: int(config("PERCENTAGE_RATE")),
+    "NUMBER_OF_EXECUTIONS_PER_DATASET_PER_PERCENTAGE":
+        lambda: int(config("NUMBER_OF_EXECUTIONS_PER_DATASET_PER_PERCENTAGE")),
+
+    # Result writer constants
+    "RESULT_WRITER_BUFFER_ROWS": lambda: config("RESULT_WRITER_BUFFER_ROWS", default=1000, cast=int),
+    "RESULT_WRITER_FLUSH_INTERVAL": lambda: config("RESULT_WRITER_FLUSH_INTERVAL", default=5.0, cast=float),  # in s
+
+    # Parsed graphs cache constants
+    "GRAPH_CACHE_ENABLED": lambda: config("GRAPH_CACHE_ENABLED", default=True, cast=bool),
+    "GRAPH_CACHE_FOLDER": lambda: config("GRAPH_CACHE_FOLDER", default="graph_cache"),
+    "GRAPH_CACHE_SIZE_LIMIT": lambda: config("GRAPH_CACHE_SIZE_LIMIT", default=1024, cast=int),  # in MB
+
+    # Scheduler constants (estimated time of an execution, in s, and batches' target time, in s)
+    "SCHEDULER_EXECUTION_OVERHEAD": lambda: config("SCHEDULER_EXECUTION_OVERHEAD", default=0.05, cast=float),
+    "SCHEDULER_CLASS_TIME": lambda: config("SCHEDULER_CLASS_TIME", default=0.001, cast=float),
+    "SCHEDULER_COST_EXPONENT": lambda: config("SCHEDULER_COST_EXPONENT", default=1.5, cast=float),
+    "SCHEDULER_BATCH_TIME": lambda: config("SCHEDULER_BATCH_TIME", default=0.5, cast=float),
+
+    # Isolated Scior executions constants (timeout in s and memory limit in MB, where 0 means no limit)
+    "ISOLATION_TIMEOUT": lambda: config("ISOLATION_TIMEOUT", default=0.0, cast=float),
+    "ISOLATION_MEMORY_LIMIT": lambda: config("ISOLATION_MEMORY_LIMIT", default=0, cast=int),
+    "ISOLATION_POLLING_INTERVAL": lambda: config("ISOLATION_POLLING_INTERVAL", default=0.01, cast=float),  # in s
+
+    # Quarantine constants (time budgets of a dataset's build and of a taxonomy's executions, in s, 0 for no budget)
+    "QUARANTINE_BUILD_TIME_BUDGET": lambda: config("QUARANTINE_BUILD_TIME_BUDGET", default=0.0, cast=float),
+    "QUARANTINE_RUN_TIME_BUDGET": lambda: config("QUARANTINE_RUN_TIME_BUDGET", default=0.0, cast=float),
+
+    # Memory metrics constants
+    "MEMORY_SAMPLING_INTERVAL": lambda: config("MEMORY_SAMPLING_INTERVAL", default=0.01, cast=float),  # in s
+
+    # Logging constants
+    "LOG_CONSOLE_LEVEL": lambda: config("LOG_CONSOLE_LEVEL", default="INFO"),
+    "LOG_FILE_LEVEL": lambda: config("LOG_FILE_LEVEL", default="DEBUG"),
+    "LOG_JSON_RECORDS": lambda: config("LOG_JSON_RECORDS", default=False, cast=bool)
+}
+
+
+def __getattr__(name):
+    """ Reads a configured constant when it is first accessed and keeps its value. """
+
+    if name not in CONFIGURED_CONSTANTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = CONFIGURED_CONSTANTS[name]()
+    globals()[name] = value
+
+    return value
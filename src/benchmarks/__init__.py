@@ -0,0 +1,11 @@
+""" Benchmark suite of the Scior-Tester, executed on synthetic catalogs and with a stub in place of Scior.
+
+    Usage (from the repository's root folder):
+    - python ./src/benchmarks/run_benchmarks.py [-h]
+    - python ./src/benchmarks/check_import_time.py [-h]
+"""
+
+# Configuration of the benchmarked executions, used for the variables not already set in the environment
+BENCHMARK_ENVIRONMENT = {"CATALOG_FOLDER": "catalog", "AUTOMATIC": "True", "COMPLETE": "True",
+                         "MINIMUM_ALLOWED_NUMBER_CLASSES": "10", "PERCENTAGE_INITIAL": "10", "PERCENTAGE_FINAL": "90",
+                         "PERCENTAGE_RATE": "40", "NUMBER_OF_EXECUTIONS_PER_DATASET_PER_PERCENTAGE": "3"}
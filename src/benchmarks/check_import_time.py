@@ -0,0 +1,172 @@
+""" Benchmark of the Tester's startup, which fails (with exit code 1) when the startup regresses.
+
+    Every scenario is executed in new Python interpreters, whose wall times are measured, and the interpreter's own
+    startup time is discounted. A scenario fails when it loads any of the heavy packages it must not load (e.g.,
+    printing the version must not load rdflib or Scior) or, if a baseline is informed, when its time exceeds the
+    baseline's time by more than the tolerance.
+
+    Usage (from the repository's root folder): python ./src/benchmarks/check_import_time.py [-h]
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from datetime import datetime
+
+# The repository's root folder, for the src package
+REPOSITORY_FOLDER = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, REPOSITORY_FOLDER)
+
+from src import SOFTWARE_VERSION
+from src.benchmarks import BENCHMARK_ENVIRONMENT
+
+# Packages that are slow to import and that must only be loaded by the code paths that use them
+HEAVY_PACKAGES = ["rdflib", "owlrl", "scior", "pandas", "numpy", "yaml", "psutil", "pyarrow"]
+
+MAIN_MODULE_PATH = os.path.join(REPOSITORY_FOLDER, "src", "scior_tester.py")
+
+# Code executed by every scenario and the heavy packages it may load
+STARTUP_SCENARIOS = {
+    "cli_version": (f"import runpy, sys\n"
+                    f"sys.argv = ['scior_tester.py', '--version']\n"
+                    f"try:\n"
+                    f"    runpy.run_path({MAIN_MODULE_PATH!r}, run_name='__main__')\n"
+                    f"except SystemExit:\n"
+                    f"    pass\n", []),
+    "build_modules": ("import src.modules.build.build_dataset\n", ["rdflib"]),
+    "run_modules": ("import src.modules.run.test1, src.modules.run.test2\n", ["rdflib"])
+}
+
+# Code appended to the scenarios for listing the loaded packages
+LIST_PACKAGES_CODE = "print(json.dumps(sorted({module_name.split('.')[0] for module_name in sys.modules})))\n"
+
+
+def run_python_code(code, environment, work_folder):
+    """ Executes the code in a new Python interpreter, in the work folder (which receives the log files).
+        Returns its wall time (in seconds) and its standard output. """
+
+    start = time.perf_counter()
+    completed_process = subprocess.run([sys.executable, "-c", code], env=environment, cwd=work_folder,
+                                       capture_output=True, text=True)
+    wall_time = time.perf_counter() - start
+
+    if completed_process.returncode != 0:
+        raise RuntimeError(completed_process.stderr.strip().splitlines()[-1])
+
+    return wall_time, completed_process.stdout
+
+
+def check_startup_scenario(scenario_name, repetitions, environment, work_folder, interpreter_time):
+    """ Returns the result of the scenario, with its loaded heavy packages and its minimum time (the least affected
+        by the machine's load) without the interpreter's startup time. """
+
+    scenario_code, allowed_packages = STARTUP_SCENARIOS[scenario_name]
+
+    _, output = run_python_code("import json, sys\n" + scenario_code + LIST_PACKAGES_CODE, environment, work_folder)
+    loaded_packages = json.loads(output.strip().splitlines()[-1])
+    forbidden_packages = [package_name for package_name in HEAVY_PACKAGES
+                          if (package_name in loaded_packages) and (package_name not in allowed_packages)]
+
+    wall_times = [run_python_code(scenario_code, environment, work_folder)[0] for _ in range(repetitions)]
+
+    return {"scenario": scenario_name, "wall_times": wall_times,
+            "startup_time": max(0.0, min(wall_times) - interpreter_time),
+            "forbidden_packages": forbidden_packages}
+
+
+def find_regressions(results, baseline_file_path, tolerance, minimum_difference):
+    """ Returns the messages of the scenarios that loaded forbidden packages or whose startup time exceeds the
+        baseline's (if informed) by more than the tolerance and by more than the minimum difference (in seconds). """
+
+    baseline_results = {}
+    if baseline_file_path:
+        with open(baseline_file_path, 'r', encoding='utf-8') as baseline_file:
+            baseline_results = {result["scenario"]: result for result in json.load(baseline_file)["results"]}
+
+    regressions = []
+    for result in results:
+        if result["forbidden_packages"]:
+            regressions.append(f"Scenario {result['scenario']} loads {', '.join(result['forbidden_packages'])}.")
+
+        baseline_result = baseline_results.get(result["scenario"])
+        if baseline_result is None:
+            continue
+        difference = result["startup_time"] - baseline_result["startup_time"]
+        if (result["startup_time"] > baseline_result["startup_time"] * tolerance) and (difference > minimum_difference):
+            regressions.append(f"Scenario {result['scenario']} starts in {result['startup_time']:.4f}s, "
+                               f"{difference:.4f}s more than the baseline's {baseline_result['startup_time']:.4f}s.")
+
+    return regressions
+
+
+def treat_import_time_arguments():
+    arguments_parser = argparse.ArgumentParser(prog="check_import_time",
+                                               description="Startup time benchmark of the Scior-Tester.")
+
+    arguments_parser.add_argument("-s", "--scenarios", type=str, nargs="+", choices=list(STARTUP_SCENARIOS),
+                                  default=list(STARTUP_SCENARIOS), help="Scenarios to be executed (default: all).")
+    arguments_parser.add_argument("-r", "--repetitions", type=int, default=10,
+                                  help="Number of repetitions of every scenario (default: 10).")
+    arguments_parser.add_argument("-o", "--output", type=str, default="import_time_results.json",
+                                  help="JSON file in which the results are saved (default: import_time_results.json).")
+    arguments_parser.add_argument("--baseline", type=str, help="JSON file of previous results for comparison.")
+    arguments_parser.add_argument("--tolerance", type=float, default=1.5,
+                                  help="Maximum ratio between a scenario's startup time and the baseline's "
+                                       "(default: 1.5).")
+    arguments_parser.add_argument("--minimum-difference", type=float, default=0.02,
+                                  help="Differences to the baseline's startup times below this value (in seconds) are "
+                                       "not regressions, as they are within the measurements' noise (default: 0.02).")
+
+    return arguments_parser.parse_args()
+
+
+if __name__ == '__main__':
+
+    import_time_arguments = treat_import_time_arguments()
+
+    scenarios_environment = {**BENCHMARK_ENVIRONMENT, **os.environ}
+    scenarios_environment["PYTHONPATH"] = os.pathsep.join(
+        [REPOSITORY_FOLDER] + ([os.environ["PYTHONPATH"]] if os.environ.get("PYTHONPATH") else []))
+
+    scenarios_work_folder = tempfile.mkdtemp(prefix="scior_tester_import_time_")
+    import_time_results = []
+    try:
+        interpreter_times = [run_python_code("pass", scenarios_environment, scenarios_work_folder)[0]
+                             for _ in range(import_time_arguments.repetitions)]
+
+        for startup_scenario in import_time_arguments.scenarios:
+            try:
+                scenario_result = check_startup_scenario(startup_scenario, import_time_arguments.repetitions,
+                                                         scenarios_environment, scenarios_work_folder,
+                                                         min(interpreter_times))
+            except RuntimeError as error:
+                print(f"Scenario {startup_scenario} failed: {error}")
+                sys.exit(1)
+            print(f"Scenario {startup_scenario}: {scenario_result['startup_time']:.4f}s.")
+            import_time_results.append(scenario_result)
+    finally:
+        shutil.rmtree(scenarios_work_folder, ignore_errors=True)
+
+    with open(import_time_arguments.output, 'w', encoding='utf-8') as output_file:
+        json.dump({"software_version": SOFTWARE_VERSION,
+                   "created": datetime.now().isoformat(timespec="seconds"),
+                   "python_version": platform.python_version(),
+                   "platform": platform.platform(),
+                   "interpreter_time": min(interpreter_times),
+                   "configuration": vars(import_time_arguments),
+                   "results": import_time_results}, output_file, indent=2)
+
+    import_time_regressions = find_regressions(import_time_results, import_time_arguments.baseline,
+                                               import_time_arguments.tolerance,
+                                               import_time_arguments.minimum_difference)
+    for regression in import_time_regressions:
+        print(regression)
+
+    if import_time_regressions:
+        sys.exit(1)
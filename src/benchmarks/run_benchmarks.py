@@ -0,0 +1,254 @@
+""" Benchmarks of the Tester's build and test functions on synthetic catalogs of increasing scales.
+
+    Scior is replaced by a stub (see scior_stub.py), so that only the Tester's own costs are measured. The wall and
+    CPU times (the latter only of the main process) of every repetition are saved in a JSON file, which can be
+    informed as the baseline of a later execution for comparing the results.
+
+    Usage (from the repository's root folder): python ./src/benchmarks/run_benchmarks.py [-h]
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+from datetime import datetime
+
+# The repository's root folder, for the src package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.benchmarks import BENCHMARK_ENVIRONMENT
+
+# Set before the configured constants of the src package are read
+for (variable_name, variable_value) in BENCHMARK_ENVIRONMENT.items():
+    os.environ.setdefault(variable_name, variable_value)
+
+# The stub must be installed before the test modules are imported
+from src.benchmarks.scior_stub import install_scior_stub
+
+install_scior_stub()
+
+import src.scior_tester as scior_tester
+from src import CATALOG_FOLDER, SOFTWARE_VERSION, LOG_FILE_LEVEL, LOG_JSON_RECORDS
+from src.benchmarks.synthetic_catalog import SyntheticTaxonomyShape, generate_synthetic_catalog
+from src.modules.build.build_directories_structure import get_list_ttl_files
+from src.modules.build.build_taxonomy_classes_information import calculate_class_taxonomy_information
+from src.modules.build.build_taxonomy_files import create_full_taxonomy_graph, split_taxonomy_graph, \
+    generate_isolated_taxonomy_files
+from src.modules.tester.graph_cache import configure_graph_cache
+from src.modules.tester.hash_functions import create_sha256_hash_register
+from src.modules.tester.logger_config import initialize_logger, configure_logger
+from src.modules.tester.utils_graph import TaxonomyIndex
+from src.modules.tester.utils_rdf import load_graph_safely
+
+BENCHMARKS_NAMES = ["build", "isolated_taxonomy_files", "taxonomy_information", "test1", "test2"]
+
+
+def measure(function, *arguments):
+    """ Executes the function and returns its wall and CPU times (in seconds). """
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    function(*arguments)
+    return time.perf_counter() - wall_start, time.process_time() - cpu_start
+
+
+def create_repetition_folder(scale_folder, benchmark_name, repetition):
+    """ Creates an empty folder for a single repetition of a benchmark and makes it the current working directory,
+        in which the Tester creates its internal catalog. """
+
+    repetition_folder = os.path.join(scale_folder, f"{benchmark_name}_{repetition:02d}")
+    os.makedirs(repetition_folder)
+    os.chdir(repetition_folder)
+
+    return repetition_folder
+
+
+def get_datasets_taxonomy_graphs(source_catalog_folder):
+    """ Returns the full taxonomy graph of every dataset of the synthetic catalog, indexed by the dataset's file. """
+
+    taxonomy_graphs = {}
+    for dataset_name in sorted(os.listdir(source_catalog_folder)):
+        ontology_file = os.path.join(source_catalog_folder, dataset_name, "ontology.ttl")
+        taxonomy_graphs[ontology_file] = create_full_taxonomy_graph(load_graph_safely(ontology_file))
+
+    return taxonomy_graphs
+
+
+def benchmark_build(scale_folder, source_catalog_folder, repetition, jobs):
+    create_repetition_folder(scale_folder, "build", repetition)
+    return measure(scior_tester.build_scior_tester, source_catalog_folder, jobs)
+
+
+def benchmark_isolated_taxonomy_files(scale_folder, source_catalog_folder, repetition, jobs):
+    repetition_folder = create_repetition_folder(scale_folder, "isolated_taxonomy_files", repetition)
+    taxonomy_graphs = get_datasets_taxonomy_graphs(source_catalog_folder)
+
+    def generate_all_isolated_taxonomy_files():
+        for (ontology_file, taxonomy_graph) in taxonomy_graphs.items():
+            saving_path = os.path.join(repetition_folder, ontology_file.split(os.path.sep)[-2])
+            os.makedirs(saving_path)
+            generate_isolated_taxonomy_files(taxonomy_graph, saving_path, ontology_file,
+                                             create_sha256_hash_register())
+
+    return measure(generate_all_isolated_taxonomy_files)
+
+
+def benchmark_taxonomy_information(scale_folder, source_catalog_folder, repetition, jobs):
+    create_repetition_folder(scale_folder, "taxonomy_information", repetition)
+    taxonomies_indexes = [TaxonomyIndex(taxonomy_graph)
+                          for full_taxonomy_graph in get_datasets_taxonomy_graphs(source_catalog_folder).values()
+                          for taxonomy_graph in split_taxonomy_graph(full_taxonomy_graph)]
+
+    def calculate_all_taxonomy_information():
+        for taxonomy_index in taxonomies_indexes:
+            calculate_class_taxonomy_information(taxonomy_index)
+
+    return measure(calculate_all_taxonomy_information)
+
+
+def benchmark_test(test_name, scale_folder, built_catalog_folder, repetition, jobs):
+    create_repetition_folder(scale_folder, test_name, repetition)
+    shutil.copytree(built_catalog_folder, CATALOG_FOLDER)
+    return measure(scior_tester.run_scior, True, True, test_name.replace("test", "tt00"), jobs, 0)
+
+
+def benchmark_test1(scale_folder, built_catalog_folder, repetition, jobs):
+    return benchmark_test("test1", scale_folder, built_catalog_folder, repetition, jobs)
+
+
+def benchmark_test2(scale_folder, built_catalog_folder, repetition, jobs):
+    return benchmark_test("test2", scale_folder, built_catalog_folder, repetition, jobs)
+
+
+def summarize_times(times):
+    return {"min": min(times), "median": statistics.median(times), "mean": statistics.mean(times)}
+
+
+def compare_with_baseline(results, baseline_file_path):
+    """ Prints the ratio between the median wall times of the results and the ones of a previously saved JSON file. """
+
+    with open(baseline_file_path, 'r', encoding='utf-8') as baseline_file:
+        baseline_results = {(result["benchmark"], result["scale"]): result
+                            for result in json.load(baseline_file)["results"]}
+
+    for result in results:
+        baseline_result = baseline_results.get((result["benchmark"], result["scale"]))
+        if baseline_result is None:
+            continue
+        ratio = result["wall_time"]["median"] / baseline_result["wall_time"]["median"]
+        print(f"Benchmark {result['benchmark']} (scale {result['scale']}): median wall time "
+              f"{result['wall_time']['median']:.4f}s, {ratio:.2f}x the baseline's.")
+
+
+def treat_benchmark_arguments():
+    arguments_parser = argparse.ArgumentParser(prog="run_benchmarks",
+                                               description="Benchmarks of the Scior-Tester on synthetic catalogs.")
+
+    arguments_parser.add_argument("--scales", type=int, nargs="+", default=[25, 100, 400],
+                                  help="Numbers of classes of every synthetic dataset (default: 25 100 400).")
+    arguments_parser.add_argument("--datasets", type=int, default=4, help="Number of datasets (default: 4).")
+    arguments_parser.add_argument("--depth", type=int, default=6, help="Maximum depth of the taxonomies (default: 6).")
+    arguments_parser.add_argument("--fan-out", type=int, default=4,
+                                  help="Maximum number of direct subclasses of a class (default: 4).")
+    arguments_parser.add_argument("--multiple-inheritance", type=float, default=0.1,
+                                  help="Probability of a class having a second superclass (default: 0.1).")
+    arguments_parser.add_argument("--components", type=int, default=2,
+                                  help="Number of disconnected taxonomies of every dataset (default: 2).")
+    arguments_parser.add_argument("--seed", type=int, default=0, help="Seed of the synthetic catalogs (default: 0).")
+    arguments_parser.add_argument("-b", "--benchmarks", type=str, nargs="+", choices=BENCHMARKS_NAMES,
+                                  default=BENCHMARKS_NAMES, help="Benchmarks to be executed (default: all).")
+    arguments_parser.add_argument("-r", "--repetitions", type=int, default=3,
+                                  help="Number of repetitions of every benchmark (default: 3).")
+    arguments_parser.add_argument("-j", "--jobs", type=int, default=1,
+                                  help="Number of worker processes of the build and of the tests (default: 1).")
+    arguments_parser.add_argument("-o", "--output", type=str, default="benchmark_results.json",
+                                  help="JSON file in which the results are saved (default: benchmark_results.json).")
+    arguments_parser.add_argument("--baseline", type=str, help="JSON file of previous results for comparison.")
+    arguments_parser.add_argument("--keep-files", action='store_true',
+                                  help="Keep the generated catalogs and outputs in the working folder.")
+
+    return arguments_parser.parse_args()
+
+
+def run_benchmarks(arguments):
+    """ Executes the requested benchmarks for every scale and returns the results. """
+
+    benchmarks_functions = {"build": benchmark_build,
+                            "isolated_taxonomy_files": benchmark_isolated_taxonomy_files,
+                            "taxonomy_information": benchmark_taxonomy_information,
+                            "test1": benchmark_test1,
+                            "test2": benchmark_test2}
+
+    work_folder = tempfile.mkdtemp(prefix="scior_tester_benchmarks_")
+    initial_folder = os.getcwd()
+    os.chdir(work_folder)
+    initialize_logger()
+    # The executions' progress is only saved in the log file, while the benchmarks' summary is printed
+    configure_logger("WARNING", LOG_FILE_LEVEL, LOG_JSON_RECORDS)
+    configure_graph_cache(enabled=False)
+
+    results = []
+    try:
+        for scale in arguments.scales:
+            shape = SyntheticTaxonomyShape(scale, arguments.depth, arguments.fan_out, arguments.multiple_inheritance,
+                                           arguments.components)
+            scale_folder = os.path.join(work_folder, f"scale_{scale}")
+            source_catalog_folder = os.path.join(scale_folder, "source_catalog")
+            generate_synthetic_catalog(source_catalog_folder, arguments.datasets, shape, arguments.seed)
+
+            # The tests are executed on a catalog built in advance
+            built_folder = os.path.join(scale_folder, "built")
+            os.makedirs(built_folder)
+            os.chdir(built_folder)
+            scior_tester.build_scior_tester(source_catalog_folder, arguments.jobs)
+            built_catalog_folder = os.path.join(built_folder, CATALOG_FOLDER)
+            number_taxonomies = len(get_list_ttl_files(built_catalog_folder))
+
+            for benchmark_name in arguments.benchmarks:
+                catalog_folder = built_catalog_folder if benchmark_name.startswith("test") else source_catalog_folder
+                wall_times, cpu_times = [], []
+                for repetition in range(1, arguments.repetitions + 1):
+                    wall_time, cpu_time = benchmarks_functions[benchmark_name](scale_folder, catalog_folder,
+                                                                               repetition, arguments.jobs)
+                    wall_times.append(wall_time)
+                    cpu_times.append(cpu_time)
+
+                results.append({"benchmark": benchmark_name, "scale": scale, "datasets": arguments.datasets,
+                                "taxonomies": number_taxonomies, "classes": scale * arguments.datasets,
+                                "wall_times": wall_times, "cpu_times": cpu_times,
+                                "wall_time": summarize_times(wall_times), "cpu_time": summarize_times(cpu_times)})
+                print(f"Benchmark {benchmark_name} (scale {scale}): median wall time "
+                      f"{statistics.median(wall_times):.4f}s.")
+    finally:
+        os.chdir(initial_folder)
+        if arguments.keep_files:
+            print(f"Benchmarks' files kept in {work_folder}.")
+        else:
+            shutil.rmtree(work_folder, ignore_errors=True)
+
+    return results
+
+
+if __name__ == '__main__':
+
+    benchmark_arguments = treat_benchmark_arguments()
+    benchmark_results = run_benchmarks(benchmark_arguments)
+
+    with open(benchmark_arguments.output, 'w', encoding='utf-8') as output_file:
+        json.dump({"software_version": SOFTWARE_VERSION,
+                   "created": datetime.now().isoformat(timespec="seconds"),
+                   "python_version": platform.python_version(),
+                   "platform": platform.platform(),
+                   "cpu_count": os.cpu_count(),
+                   "configuration": {**vars(benchmark_arguments),
+                                     "environment": {variable_name: os.environ[variable_name]
+                                                     for variable_name in BENCHMARK_ENVIRONMENT}},
+                   "results": benchmark_results}, output_file, indent=2)
+
+    if benchmark_arguments.baseline:
+        compare_with_baseline(benchmark_results, benchmark_arguments.baseline)
@@ -0,0 +1,106 @@
+""" Stub of Scior's run_scior_tester, used for measuring the Tester's own costs in the benchmarks.
+
+    The stub returns outputs with the same structure of the ones of Scior (the classes' dataclasses, the time register,
+    the consolidated statistics, the knowledge matrix, and the software's version) in time linear to the size of the
+    received graph. Input classes are reported with their asserted gUFO type and all other classes as unknown.
+"""
+import sys
+import types
+
+from rdflib import RDF, OWL
+
+from src import NAMESPACE_GUFO
+
+SCIOR_STUB_VERSION = "0.0.0-benchmark"
+
+GUFO_TYPES = ["gufo:Category", "gufo:Kind", "gufo:Mixin", "gufo:Phase", "gufo:PhaseMixin", "gufo:Role",
+              "gufo:RoleMixin", "gufo:SubKind"]
+
+STATISTICS_DIFFERENCES = ["tu_classes_types_v_d", "pk_classes_types_v_d", "tk_classes_types_v_d",
+                          "tu_classes_types_p_d", "pk_classes_types_p_d", "tk_classes_types_p_d",
+                          "unknown_classif_types_v_d", "known_classif_types_v_d",
+                          "unknown_classif_types_p_d", "known_classif_types_p_d"]
+
+
+class OntologyDataClassStub(object):
+    """ Has the attributes of Scior's OntologyDataClass that are read by the Tester. """
+
+    def __init__(self, uri, is_type, can_type, not_type):
+        self.uri: str = uri
+        self.is_type: list = is_type
+        self.can_type: list = can_type
+        self.not_type: list = not_type
+        self.incompleteness_info: dict = {"is_incomplete": False, "detected_in": []}
+
+
+class StatisticsStub(object):
+    """ Has the classes and classifications statistics attributes read by the Tester. """
+
+    def __init__(self, total_classes_number, known_classes_number):
+        unknown_classes_number = total_classes_number - known_classes_number
+        known_percentage = 100 * known_classes_number / total_classes_number if total_classes_number else 0
+
+        self.total_classes_number: int = total_classes_number
+        self.tu_classes_types_v: int = unknown_classes_number
+        self.pk_classes_types_v: int = 0
+        self.tk_classes_types_v: int = known_classes_number
+        self.tu_classes_types_p: float = 100 - known_percentage
+        self.pk_classes_types_p: float = 0
+        self.tk_classes_types_p: float = known_percentage
+
+        self.total_classif_types_v: int = total_classes_number * len(GUFO_TYPES)
+        self.unknown_classif_types_v: int = unknown_classes_number * len(GUFO_TYPES)
+        self.known_classif_types_v: int = known_classes_number * len(GUFO_TYPES)
+        self.unknown_classif_types_p: float = 100 - known_percentage
+        self.known_classif_types_p: float = known_percentage
+
+
+class ConsolidatedStatisticsStub(object):
+    """ Has the consolidated statistics attributes read by the Tester. """
+
+    def __init__(self, statistics_before, statistics_after):
+        self.classes_stats_b = statistics_before
+        self.classes_stats_a = statistics_after
+        self.classif_stats_b = statistics_before
+        self.classif_stats_a = statistics_after
+        for attribute_name in STATISTICS_DIFFERENCES:
+            setattr(self, attribute_name, 0)
+
+
+def run_scior_tester(global_configurations, ontology_graph):
+    """ Replaces scior.run_scior_tester, with the same arguments and returned values. """
+
+    classes_uris = sorted(str(class_uri) for class_uri in ontology_graph.subjects(RDF.type, OWL.Class))
+    asserted_types = {str(subject): str(gufo_type).replace(NAMESPACE_GUFO, "gufo:")
+                      for (subject, gufo_type) in ontology_graph.subject_objects(RDF.type)
+                      if str(gufo_type).startswith(NAMESPACE_GUFO)}
+
+    ontology_dataclass_list = []
+    for class_uri in classes_uris:
+        if class_uri in asserted_types:
+            is_type = [asserted_types[class_uri]]
+            ontology_dataclass_list.append(OntologyDataClassStub(
+                class_uri, is_type, [], [gufo_type for gufo_type in GUFO_TYPES if gufo_type not in is_type]))
+        else:
+            ontology_dataclass_list.append(OntologyDataClassStub(class_uri, [], list(GUFO_TYPES), []))
+
+    statistics = StatisticsStub(len(classes_uris), len(asserted_types))
+    time_register = {"execution_time": 0.0, "loading_time": 0.0}
+    knowledge_matrix = [["class_name"] + GUFO_TYPES] + \
+                       [[dataclass.uri] + [int(gufo_type in dataclass.is_type) for gufo_type in GUFO_TYPES]
+                        for dataclass in ontology_dataclass_list]
+
+    return ontology_dataclass_list, time_register, ConsolidatedStatisticsStub(statistics, statistics), \
+        knowledge_matrix, SCIOR_STUB_VERSION
+
+
+def install_scior_stub():
+    """ Makes the stub the implementation of run_scior_tester imported by the Tester's modules. Must be called before
+        the test modules are imported. Worker processes started by fork inherit the stub. """
+
+    scior_stub_module = types.ModuleType("scior")
+    scior_stub_module.run_scior_tester = run_scior_tester
+    sys.modules["scior"] = scior_stub_module
+
+    if "src.modules.run.test1" in sys.modules:
+        sys.modules["src.modules.run.test1"].run_scior_tester = run_scior_tester
@@ -0,0 +1,127 @@
+""" Generator of synthetic catalogs, whose datasets' ontology.ttl files use the OntoUML vocabulary read by the build
+    (i.e., classes with name and stereotype and generalizations with general and specific classes). """
+import os
+import random
+
+VOCABULARY_NAMESPACE = "https://purl.org/ontouml-models/vocabulary/"
+SYNTHETIC_NAMESPACE = "https://example.org/synthetic/"
+
+# Stereotypes sampled for the classes. None corresponds to a class without stereotype.
+SYNTHETIC_STEREOTYPES = ["kind", "subkind", "role", "phase", "category", "mixin", "rolemixin", "phasemixin",
+                         "relator", "collective", "quality", "historicalRole", "event", None]
+
+
+class SyntheticTaxonomyShape(object):
+    """ Shape of the taxonomies of a synthetic dataset.
+
+        number_classes: number of classes in the dataset, split as evenly as possible among the components.
+        depth: maximum number of levels of a taxonomy (a single root class has depth 1).
+        fan_out: maximum number of direct subclasses of a class.
+        multiple_inheritance: probability of a class having a second superclass (in an upper level).
+        number_components: number of disconnected taxonomies in the dataset.
+        isolated_classes: number of classes without generalizations, which are not part of any taxonomy.
+    """
+
+    def __init__(self, number_classes=100, depth=6, fan_out=4, multiple_inheritance=0.1, number_components=2,
+                 isolated_classes=1):
+        self.number_classes: int = number_classes
+        self.depth: int = depth
+        self.fan_out: int = fan_out
+        self.multiple_inheritance: float = multiple_inheritance
+        self.number_components: int = number_components
+        self.isolated_classes: int = isolated_classes
+
+
+def create_component_generalizations(component_classes, shape, random_generator):
+    """ Returns the (general, specific) pairs of a single taxonomy with the received classes.
+        Every class is placed in a level below the level of all its superclasses, so the taxonomy is acyclic. """
+
+    levels = {component_classes[0]: 0}
+    classes_by_level = [[component_classes[0]]]
+    number_subclasses = {component_classes[0]: 0}
+    # Classes that can still receive subclasses without exceeding the depth and the fan-out
+    open_classes = [component_classes[0]] if shape.depth > 1 else []
+    generalizations = []
+
+    for class_name in component_classes[1:]:
+        if open_classes:
+            general_position = random_generator.randrange(len(open_classes))
+            general = open_classes[general_position]
+        else:
+            # All possible superclasses are full, so the fan-out limit is exceeded
+            general_position = None
+            general = random_generator.choice(classes_by_level[max(0, min(shape.depth, len(classes_by_level)) - 2)])
+
+        levels[class_name] = levels[general] + 1
+        number_subclasses[class_name] = 0
+        number_subclasses[general] += 1
+        generalizations.append((general, class_name))
+
+        if levels[class_name] == len(classes_by_level):
+            classes_by_level.append([])
+        classes_by_level[levels[class_name]].append(class_name)
+
+        if (general_position is not None) and (number_subclasses[general] >= shape.fan_out):
+            open_classes[general_position] = open_classes[-1]
+            open_classes.pop()
+        if levels[class_name] < shape.depth - 1:
+            open_classes.append(class_name)
+
+        if open_classes and (levels[class_name] > 1) and (random_generator.random() < shape.multiple_inheritance):
+            # The second superclass must be in an upper level and, when possible, respect the fan-out
+            second_general_position = random_generator.randrange(len(open_classes))
+            second_general = open_classes[second_general_position]
+            if (levels[second_general] < levels[class_name]) and (second_general != general):
+                number_subclasses[second_general] += 1
+                generalizations.append((second_general, class_name))
+                if number_subclasses[second_general] >= shape.fan_out:
+                    open_classes[second_general_position] = open_classes[-1]
+                    open_classes.pop()
+
+    return generalizations
+
+
+def generate_synthetic_ontology(ontology_file_path, shape: SyntheticTaxonomyShape, seed=0):
+    """ Generates an ontology.ttl file with the received shape. The same file is generated for the same seed. """
+
+    random_generator = random.Random(seed)
+
+    classes_names = [f"Class {class_number}" for class_number in range(shape.number_classes)]
+    components = [classes_names[component::shape.number_components] for component in range(shape.number_components)]
+    isolated_classes_names = [f"Isolated Class {class_number}" for class_number in range(shape.isolated_classes)]
+
+    lines = [f"@prefix voc: <{VOCABULARY_NAMESPACE}> .", f"@prefix syn: <{SYNTHETIC_NAMESPACE}> .", ""]
+
+    for class_name in classes_names + isolated_classes_names:
+        class_triples = [f'syn:{class_name.replace(" ", "_")} a voc:Class', f'voc:name "{class_name}"@en']
+        stereotype = random_generator.choice(SYNTHETIC_STEREOTYPES)
+        if stereotype is not None:
+            class_triples.append(f"voc:stereotype voc:{stereotype}")
+        lines.append(" ;\n    ".join(class_triples) + " .")
+
+    generalization_number = 0
+    for component_classes in components:
+        if not component_classes:
+            continue
+        for general, specific in create_component_generalizations(component_classes, shape, random_generator):
+            generalization_number += 1
+            lines.append(f"syn:generalization_{generalization_number} a voc:Generalization ;\n"
+                         f"    voc:general syn:{general.replace(' ', '_')} ;\n"
+                         f"    voc:specific syn:{specific.replace(' ', '_')} .")
+
+    os.makedirs(os.path.dirname(ontology_file_path), exist_ok=True)
+    with open(ontology_file_path, 'w', encoding='utf-8') as file:
+        file.write("\n".join(lines) + "\n")
+
+
+def generate_synthetic_catalog(catalog_path, number_datasets, shape: SyntheticTaxonomyShape, seed=0):
+    """ Generates a catalog with number_datasets datasets (folders with an ontology.ttl file) of the same shape,
+        but with different random classes' stereotypes and generalizations. Returns the datasets' folders. """
+
+    datasets_folders = []
+    for dataset_number in range(number_datasets):
+        dataset_folder = os.path.join(catalog_path, f"synthetic{dataset_number:03d}")
+        generate_synthetic_ontology(os.path.join(dataset_folder, "ontology.ttl"), shape, f"{seed}_{dataset_number}")
+        datasets_folders.append(dataset_folder)
+
+    return datasets_folders
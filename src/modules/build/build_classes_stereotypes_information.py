@@ -1,12 +1,11 @@
 """ Functions related to stereotypes. """
-import os.path
-
 from rdflib import RDF
 
-from src.modules.build import *
+from src.modules.build.ontouml_vocabulary import VOCABULARY_CLASS_URI, VOCABULARY_NAME_URI, VOCABULARY_STEREOTYPE_URI
 from src.modules.build.build_taxonomy_files import clean_class_name
-from src.modules.tester.logger_config import initialize_logger
-from src.modules.tester.utils_rdf import load_graph_safely
+from src.modules.tester.logger_config import get_logger
+
+logger = get_logger()
 
 
 def get_gufo_stereotype(class_stereotype_original):
@@ -24,18 +23,16 @@ def get_gufo_stereotype(class_stereotype_original):
     return "other"
 
 
-def collect_stereotypes_classes_information(source_owl_file_path, dataset_classes_information, catalog_size, current):
+def collect_stereotypes_classes_information(ontology_graph, dataset_name, dataset_classes_information,
+                                            catalog_size, current):
     """ Read all classes information related to stereotypes and updates the catalog_information
-        :param source_owl_file_path: full path to *.ttl file
+        :param ontology_graph: already loaded graph of the dataset's *.ttl file
+        :param dataset_name: name of the dataset
         :param dataset_classes_information:
         :param catalog_size: size of the whole catalog
         :param current: number of current dataset
     """
 
-    logger = initialize_logger()
-
-    ontology_graph = load_graph_safely(source_owl_file_path)
-
     class_inf = {}
     for owl_class in ontology_graph.subjects(RDF.type, VOCABULARY_CLASS_URI):
 
@@ -64,5 +61,4 @@ def collect_stereotypes_classes_information(source_owl_file_path, dataset_classe
                 class_in_list.stereotype_original = class_inf[class_in_list.name][0]
                 class_in_list.stereotype_gufo = class_inf[class_in_list.name][1]
 
-    dataset = source_owl_file_path.split(os.path.sep)[-2]
-    logger.info(f"Stereotypes information {current}/{catalog_size} collected from dataset {dataset}")
+    logger.info(f"Stereotypes information {current}/{catalog_size} collected from dataset {dataset_name}")
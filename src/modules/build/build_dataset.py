@@ -0,0 +1,101 @@
+""" Functions that build all files of a single catalog dataset. """
+import os
+import time
+
+from src.modules.build.build_classes_stereotypes_information import collect_stereotypes_classes_information
+from src.modules.build.build_directories_structure import create_test_directory_folders_structure
+from src.modules.build.build_information_classes import saves_dataset_csv_classes_data
+from src.modules.build.build_taxonomy_classes_information import collect_taxonomies_information
+from src.modules.build.build_taxonomy_files import create_taxonomy_ttl_files
+from src.modules.tester.hash_functions import create_sha256_hash_register, generate_sha256_hash, \
+    filter_sha256_hash_register
+from src.modules.tester.logger_config import get_logger
+from src.modules.tester.profiling import profile_stage, profile_dataset, set_profiling_context, \
+    collect_profile_records
+from src.modules.tester.utils_rdf import load_graph_safely
+
+logger = get_logger()
+
+
+def build_dataset(dataset, internal_catalog_folder, catalog_size, current):
+    """ Builds the taxonomies and data files of a single dataset inside the internal catalog folder.
+        As it does not touch any file shared with other datasets, it can be executed in a worker process.
+        Returns the dataset's own hash register, its rows for the taxonomies.csv file, and its profiling records.
+    """
+
+    dataset_name = dataset.split(os.path.sep)[-2]
+    dataset_folder = internal_catalog_folder + dataset_name
+    logger.info(f"### Starting dataset {current}/{catalog_size}: {dataset_name} ###\n")
+    set_profiling_context(dataset_name)
+
+    with profile_dataset("build", dataset_name), profile_stage("other"):
+        create_test_directory_folders_structure(dataset_folder, catalog_size, current)
+        hash_register = create_sha256_hash_register()
+
+        # The source file is parsed only once and its graph is used by all following steps
+        with profile_stage("parse"):
+            source_graph = load_graph_safely(dataset)
+
+        # Building taxonomies files and collecting information from classes
+        _, taxonomy_graphs, hash_register = create_taxonomy_ttl_files(source_graph, dataset, dataset_folder,
+                                                                      hash_register)
+        # Builds dataset_classes_information and collects attributes name, prefixed_name, and all taxonomic info
+        dataset_classes_information = collect_taxonomies_information(taxonomy_graphs, dataset_name, catalog_size,
+                                                                     current)
+        # Collects stereotype_original and stereotype_gufo for dataset_classes_information
+        with profile_stage("stereotype_collection"):
+            collect_stereotypes_classes_information(source_graph, dataset_name, dataset_classes_information,
+                                                    catalog_size, current)
+
+        with profile_stage("csv_write"):
+            hash_register, taxonomies_rows = saves_dataset_csv_classes_data(dataset_classes_information,
+                                                                            dataset_folder, catalog_size, current,
+                                                                            dataset, hash_register)
+
+    return hash_register, taxonomies_rows, collect_profile_records()
+
+
+def build_dataset_measured(dataset, internal_catalog_folder, catalog_size, current):
+    """ Builds the dataset as build_dataset, without interrupting the build if it fails (i.e., if it raises an
+        exception or exits on an I/O error).
+        Returns build_dataset's results (None if it failed), the measured time (in seconds), and the failure's
+        description (None if it succeeded).
+    """
+
+    start = time.perf_counter()
+    try:
+        dataset_results = build_dataset(dataset, internal_catalog_folder, catalog_size, current)
+    except Exception as error:
+        logger.error(f"Build of dataset {current}/{catalog_size} failed: {type(error).__name__}: {error}")
+        return None, time.perf_counter() - start, f"{type(error).__name__}: {error}"
+    except SystemExit as error:
+        # The build functions exit on I/O errors (e.g., files that cannot be read or written), after logging them
+        logger.error(f"Build of dataset {current}/{catalog_size} aborted with exit code {error.code}.")
+        return None, time.perf_counter() - start, f"build aborted with exit code {error.code} (error in the log file)"
+
+    return dataset_results, time.perf_counter() - start, None
+
+
+def get_dataset_hash_register(hash_register, dataset_name):
+    """ Returns the entries of the hash register that correspond to files generated for the given dataset. """
+
+    return filter_sha256_hash_register(hash_register, lambda entry: entry[0].split(os.path.sep)[-2] == dataset_name)
+
+
+def is_dataset_up_to_date(dataset, dataset_hash_register):
+    """ Verifies if the files registered for a dataset were generated from its current source file and were not
+        modified or removed since then. In this case, the dataset does not need to be built again.
+    """
+
+    if not len(dataset_hash_register):
+        return False
+
+    source_file_hash = generate_sha256_hash(dataset)
+
+    for file_name, file_hash, _, registered_source_file_hash in dataset_hash_register:
+        if registered_source_file_hash != source_file_hash:
+            return False
+        if not os.path.exists(file_name) or generate_sha256_hash(file_name) != file_hash:
+            return False
+
+    return True
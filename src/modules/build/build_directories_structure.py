@@ -3,12 +3,14 @@ import os
 import glob
 import shutil
 
-from src.modules.tester.logger_config import initialize_logger
+from src import CLASSES_DATA_FILE_NAME
+from src.modules.tester.logger_config import get_logger
+
+logger = get_logger()
 
 
 def get_list_ttl_files(directory_path, name="*") -> list:
     """ Receives the path of a directory and returns a list of all *.ttl files in all sub-folders. """
-    logger = initialize_logger()
     file_names = []
 
     # checking whether folder/directory exists
@@ -23,8 +25,6 @@ def get_list_ttl_files(directory_path, name="*") -> list:
 
 
 def create_folder(path, ok_message="The folder was created", existed_message="", clear_if_exists: bool = False):
-    logger = initialize_logger()
-
     if os.path.exists(path):
         if existed_message:
             logger.info(f"{existed_message}: {path}.")
@@ -33,7 +33,8 @@ def create_folder(path, ok_message="The folder was created", existed_message="",
 
     if not os.path.exists(path):
         try:
-            os.makedirs(path)
+            # Tolerates the folder being concurrently created by a worker process
+            os.makedirs(path, exist_ok=True)
             logger.info(f"{ok_message}: {path}.")
         except OSError as error:
             logger.error(f"Directory {path} could not be created. Program aborted.\n"
@@ -54,3 +55,23 @@ def create_test_directory_folders_structure(dataset_folder, catalog_size, curren
     create_folder(dataset_folder,
                   ok_message=f"Directory {current}/{catalog_size} created",
                   existed_message=f"Directory {current}/{catalog_size} already exists")
+
+
+def remove_dataset_build_files(dataset_folder):
+    """ Removes the taxonomy and classes data files previously built for a dataset, keeping its test results. """
+    dataset_name = dataset_folder.split(os.path.sep)[-1]
+
+    for file_name in glob.glob(os.path.join(dataset_folder, f"{dataset_name}_tx*.ttl")) + \
+            glob.glob(os.path.join(dataset_folder, f"{CLASSES_DATA_FILE_NAME}_{dataset_name}_tx*.csv")):
+        os.remove(file_name)
+        logger.debug(f"Outdated file removed: {file_name}.")
+
+
+def remove_dataset_folder(dataset_folder):
+    """ Removes the folder of a dataset that is no longer part of the catalog. """
+    try:
+        shutil.rmtree(dataset_folder)
+        logger.info(f"Directory of removed dataset deleted: {dataset_folder}.")
+    except OSError as error:
+        logger.error(f"Directory {dataset_folder} could not be deleted.\n"
+                     f"System error reported: {error}")
@@ -1,13 +1,18 @@
 """ Functions related to the statistics building, collection and saving. """
 import csv
+import glob
+import io
 import operator
 import os.path
 
 from src import CLASSES_DATA_FILE_NAME, NAMESPACE_TAXONOMY
-from src.modules.tester.hash_functions import register_sha256_hash_information
-from src.modules.tester.logger_config import initialize_logger
+from src.modules.tester.hash_functions import register_sha256_hash_information, write_file_and_generate_sha256_hash
+from src.modules.tester.logger_config import get_logger
 from src.modules.tester.utils_general import write_csv_row
-from src.modules.tester.utils_graph import get_all_superclasses, get_all_subclasses
+
+logger = get_logger()
+
+TAXONOMIES_CSV_HEADER = ["taxonomy_name", "dataset_name", "num_mapped_classes", "num_other_classes", "num_classes"]
 
 
 class InformationStructure(object):
@@ -36,25 +41,21 @@ class InformationStructure(object):
         return [self.name, self.stereotype_original, self.stereotype_gufo, self.is_root, self.is_leaf,
                 self.is_intermediate, self.number_superclasses, self.number_subclasses]
 
-    def build_position(self, taxonomy_nodes):
-        self.is_root = self.prefixed_name in taxonomy_nodes["roots"]
-        self.is_leaf = self.prefixed_name in taxonomy_nodes["leaves"]
+    def build_position(self, taxonomy_index):
+        self.is_root = self.prefixed_name in taxonomy_index.roots
+        self.is_leaf = self.prefixed_name in taxonomy_index.leaves
         self.is_intermediate = (not self.is_root) and (not self.is_leaf)
 
-    def build_numbers(self, taxonomy_nodes, taxonomy_graph):
-        self.number_superclasses = len(get_all_superclasses(taxonomy_graph, taxonomy_nodes, self.prefixed_name))
-        self.number_subclasses = len(get_all_subclasses(taxonomy_graph, taxonomy_nodes, self.prefixed_name))
-
 
 def saves_dataset_csv_classes_data(catalog_information, dataset_path, catalog_size, current,
                                    source_owl_file_path, hash_register):
-    """ Saves dataset classes information in CSV format. """
+    """ Saves dataset classes information in CSV format.
+        Returns the updated hash register and the dataset's rows for the taxonomies.csv file.
+    """
 
-    logger = initialize_logger()
     csv_header = ["class_name", "ontouml_stereotype", "gufo_classification", "is_root", "is_leaf",
                   "is_intermediate", "number_superclasses", "number_subclasses"]
-    taxonomies_file_name = os.path.join(dataset_path.rsplit(os.path.sep, 1)[0], f"taxonomies.csv")
-    taxonomies_header = ["taxonomy_name", "dataset_name", "num_mapped_classes", "num_other_classes", "num_classes"]
+    taxonomies_rows = []
 
     for idx, sublist in enumerate(catalog_information):
         dataset_name = dataset_path.split(os.path.sep)[-1]
@@ -65,20 +66,23 @@ def saves_dataset_csv_classes_data(catalog_information, dataset_path, catalog_si
         num_other_classes = 0
         num_mapped_classes = 0
         try:
-            with open(csv_file_full_path, 'w', encoding='utf-8', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow(csv_header)
+            # The file content is created in memory, so that its hash is computed while it is written
+            csv_content = io.StringIO(newline='')
+            writer = csv.writer(csv_content)
+            writer.writerow(csv_header)
 
-                for class_information in sorted_catalog_information:
-                    writer.writerow(class_information.convert_to_row())
-                    if class_information.stereotype_gufo == 'other':
-                        num_other_classes += 1
-                    else:
-                        num_mapped_classes += 1
+            for class_information in sorted_catalog_information:
+                writer.writerow(class_information.convert_to_row())
+                if class_information.stereotype_gufo == 'other':
+                    num_other_classes += 1
+                else:
+                    num_mapped_classes += 1
 
-            taxonomies_row = [f"{dataset_name}_tx{idx + 1:03d}.ttl", dataset_name,
-                              num_mapped_classes, num_other_classes, num_mapped_classes + num_other_classes]
-            write_csv_row(taxonomies_file_name, taxonomies_header, taxonomies_row)
+            csv_file_hash = write_file_and_generate_sha256_hash(csv_file_full_path,
+                                                                csv_content.getvalue().encode('utf-8'))
+
+            taxonomies_rows.append([f"{dataset_name}_tx{idx + 1:03d}.ttl", dataset_name,
+                                    num_mapped_classes, num_other_classes, num_mapped_classes + num_other_classes])
 
             logger.info(f"CSV file {current}/{catalog_size} saved: {csv_file_full_path}")
         except OSError as error:
@@ -86,6 +90,41 @@ def saves_dataset_csv_classes_data(catalog_information, dataset_path, catalog_si
                          f"System error reported: {error}")
             exit(1)
 
-        hash_register = register_sha256_hash_information(hash_register, csv_file_full_path, source_owl_file_path)
+        hash_register = register_sha256_hash_information(hash_register, csv_file_full_path, source_owl_file_path,
+                                                         csv_file_hash)
+
+    return hash_register, taxonomies_rows
+
+
+def saves_catalog_csv_taxonomies_data(taxonomies_rows, internal_catalog_folder):
+    """ Appends the received rows to the catalog's taxonomies.csv file. """
+
+    taxonomies_file_name = os.path.join(internal_catalog_folder, "taxonomies.csv")
+
+    for taxonomies_row in taxonomies_rows:
+        write_csv_row(taxonomies_file_name, TAXONOMIES_CSV_HEADER, taxonomies_row)
+
+
+def read_dataset_taxonomies_rows(dataset_path):
+    """ Recreates the dataset's rows for the taxonomies.csv file from its already saved classes data CSV files. """
+
+    dataset_name = dataset_path.split(os.path.sep)[-1]
+    csv_files_pattern = os.path.join(dataset_path, f"{CLASSES_DATA_FILE_NAME}_{dataset_name}_tx*.csv")
+    taxonomies_rows = []
+
+    for csv_file_full_path in sorted(glob.glob(csv_files_pattern)):
+        taxonomy_name = os.path.basename(csv_file_full_path)[len(CLASSES_DATA_FILE_NAME) + 1:-len(".csv")] + ".ttl"
+
+        num_other_classes = 0
+        num_mapped_classes = 0
+        with open(csv_file_full_path, 'r', encoding='utf-8', newline='') as f:
+            for class_row in csv.DictReader(f):
+                if class_row["gufo_classification"] == 'other':
+                    num_other_classes += 1
+                else:
+                    num_mapped_classes += 1
+
+        taxonomies_rows.append([taxonomy_name, dataset_name,
+                                num_mapped_classes, num_other_classes, num_mapped_classes + num_other_classes])
 
-    return hash_register
+    return taxonomies_rows
@@ -1,45 +1,42 @@
 """ Fills the statistics with taxonomy information. """
-import os.path
-
 from src import NAMESPACE_TAXONOMY
 from src.modules.build.build_information_classes import InformationStructure
-from src.modules.tester.utils_graph import generates_nodes_lists
-from src.modules.tester.logger_config import initialize_logger
-from src.modules.tester.utils_rdf import load_graph_safely
+from src.modules.tester.utils_graph import TaxonomyIndex
+from src.modules.tester.logger_config import get_logger
+from src.modules.tester.profiling import profile_stage
+
+logger = get_logger()
 
 
-def calculate_class_taxonomy_information(taxonomy_graph, taxonomy_nodes):
+def calculate_class_taxonomy_information(taxonomy_index):
     """ Saving position of the classes in the taxonomy for statistics. """
 
     list_classes_statistics = []
+    numbers_superclasses, numbers_subclasses = taxonomy_index.get_closure_counts()
 
-    for dataset_class in taxonomy_nodes["all"]:
+    for class_id, dataset_class in enumerate(taxonomy_index.classes):
         dataset_class = dataset_class.removeprefix(NAMESPACE_TAXONOMY)
 
-        class_taxonomy_information = InformationStructure(name=dataset_class)
-        class_taxonomy_information.build_position(taxonomy_nodes)
-        class_taxonomy_information.build_numbers(taxonomy_nodes, taxonomy_graph)
+        class_taxonomy_information = InformationStructure(name=dataset_class,
+                                                          number_superclasses=numbers_superclasses[class_id],
+                                                          number_subclasses=numbers_subclasses[class_id])
+        class_taxonomy_information.build_position(taxonomy_index)
 
         list_classes_statistics.append(class_taxonomy_information)
 
     return list_classes_statistics
 
 
-def collect_taxonomies_information(taxonomies_paths, catalog_size, current):
-    """ Populates the statistics lists with taxonomy information. """
+def collect_taxonomies_information(taxonomy_graphs, dataset_name, catalog_size, current):
+    """ Populates the statistics lists with taxonomy information from the dataset's in-memory taxonomy graphs. """
 
-    logger = initialize_logger()
     all_classes_information = []
 
-    for path in taxonomies_paths:
-        taxonomy_graph = load_graph_safely(path)
-        taxonomy_prefixed_nodes_list = generates_nodes_lists(taxonomy_graph)
-        all_classes_information.append(
-            calculate_class_taxonomy_information(taxonomy_graph, taxonomy_prefixed_nodes_list)
-        )
+    with profile_stage("closure_statistics"):
+        for taxonomy_graph in taxonomy_graphs:
+            all_classes_information.append(calculate_class_taxonomy_information(TaxonomyIndex(taxonomy_graph)))
 
-    if taxonomies_paths:
-        dataset_name = taxonomies_paths[0].split(os.path.sep)[-2]
+    if taxonomy_graphs:
         logger.info(f"Taxonomies information {current}/{catalog_size} collected from dataset {dataset_name}")
 
     return all_classes_information
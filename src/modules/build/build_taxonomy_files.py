@@ -1,16 +1,16 @@
 import os.path
 
-from rdflib import RDF, Graph, RDFS, OWL
-from copy import deepcopy
+from rdflib import RDF, Graph, RDFS, OWL, URIRef
 
 from src import NAMESPACE_TAXONOMY
-from src.modules.build import *
-from src.modules.run.test1 import write_csv_row
-from src.modules.tester.hash_functions import register_sha256_hash_information
-from src.modules.tester.logger_config import initialize_logger
-from src.modules.tester.utils_rdf import load_graph_safely
-from src.modules.tester.utils_graph import generates_nodes_lists, get_all_related_nodes
-from src.modules.tester.utils_general import lists_subtraction
+from src.modules.build.ontouml_vocabulary import VOCABULARY_CLASS_URI, VOCABULARY_GENERALIZATION_URI, \
+    VOCABULARY_GENERAL_URI, VOCABULARY_SPECIFIC_URI, VOCABULARY_NAME_URI
+from src.modules.tester.hash_functions import register_sha256_hash_information, write_file_and_generate_sha256_hash
+from src.modules.tester.logger_config import get_logger
+from src.modules.tester.profiling import profile_stage
+from src.modules.tester.utils_graph import TaxonomyIndex
+
+logger = get_logger()
 
 
 def clean_class_name(class_raw_name: str) -> str:
@@ -30,10 +30,9 @@ def clean_class_name(class_raw_name: str) -> str:
     return class_clean_name
 
 
-def create_full_taxonomy_graph(owl_file_path):
-    """ Extract the dataset model's taxonomy into a new graph. """
+def create_full_taxonomy_graph(source_graph):
+    """ Extract the dataset model's taxonomy (from the already loaded source graph) into a new graph. """
 
-    source_graph = load_graph_safely(owl_file_path)
     taxonomy_graph = Graph()
 
     # Isolated classes are ignored for the creation of the taxonomy.ttl file.
@@ -73,71 +72,82 @@ def create_full_taxonomy_graph(owl_file_path):
     return taxonomy_graph
 
 
-def create_taxonomy_ttl_files(source_owl_file_path, dataset_folder_path, hash_register):
-    """ Generates and saves files taxonomy.ttl - rdf-s graph with the model's taxonomy - for a dataset. """
+def create_taxonomy_ttl_files(source_graph, source_owl_file_path, dataset_folder_path, hash_register):
+    """ Generates and saves files taxonomy.ttl - rdf-s graph with the model's taxonomy - for a dataset.
+        Returns the saved files' paths, the in-memory taxonomy graphs (in the same order), and the hash register.
+    """
 
     # get the full graph
-    full_taxonomy_graph = create_full_taxonomy_graph(source_owl_file_path)
+    with profile_stage("taxonomy_extraction"):
+        full_taxonomy_graph = create_full_taxonomy_graph(source_graph)
     # generate isolated files
-    taxonomy_files, hash_register = generate_isolated_taxonomy_files(
+    taxonomy_files, taxonomy_graphs, hash_register = generate_isolated_taxonomy_files(
         full_taxonomy_graph, dataset_folder_path, source_owl_file_path, hash_register)
 
-    return taxonomy_files, hash_register
+    return taxonomy_files, taxonomy_graphs, hash_register
 
 
 def safe_save_taxonomy_graph(taxonomy_graph, complete_taxonomy_file_path):
-    """ Safely save the taxonomy graph to a file. """
-
-    logger = initialize_logger()
+    """ Safely save the taxonomy graph to a file. Returns the saved file's hash. """
 
     try:
-        taxonomy_graph.serialize(complete_taxonomy_file_path, encoding='utf-8')
+        taxonomy_file_hash = write_file_and_generate_sha256_hash(complete_taxonomy_file_path,
+                                                                 taxonomy_graph.serialize(encoding='utf-8'))
         logger.info(f"Taxonomy file saved: {complete_taxonomy_file_path}")
     except OSError as error:
         logger.error(f"Could not save {complete_taxonomy_file_path} file. Exiting program.\n"
                      f"System error reported: {error}")
         exit(1)
 
+    return taxonomy_file_hash
+
 
-def remove_classes_from_graph(source_graph, classes_to_remove_list):
-    """ Receives a graph and a list of classes that are part of this graph and that must be removed.
-        Removes all classes in the list and returns a new graph without them.
+def split_taxonomy_graph(source_taxonomy_graph):
+    """ Splits the graph into one graph per separated taxonomy (i.e., per connected component of classes).
+        Every triple is assigned to the component of its subject (or object) class in a single sweep over the graph.
+        Triples that do not involve any class are kept in all taxonomy graphs.
+
+        Taxonomies are ordered by their alphabetically first root class. Taxonomies without root classes (i.e.,
+        composed only of cyclic specializations) are placed after all others.
     """
 
-    reduced_graph = deepcopy(source_graph)
+    source_taxonomy_index = TaxonomyIndex(source_taxonomy_graph)
+    components = source_taxonomy_index.get_connected_components(sorted(source_taxonomy_index.roots))
+
+    component_of_class = {}
+    for component_label, component in enumerate(components):
+        for class_uri in component:
+            component_of_class[class_uri] = component_label
 
-    for class_to_remove in classes_to_remove_list:
-        uriref_to_remove = URIRef(class_to_remove)
-        reduced_graph.remove((uriref_to_remove, None, None))
-        reduced_graph.remove((None, None, uriref_to_remove))
+    taxonomy_graphs = [Graph() for _ in components]
+    for triple in source_taxonomy_graph:
+        component_label = component_of_class.get(str(triple[0]), component_of_class.get(str(triple[2])))
+        if component_label is not None:
+            taxonomy_graphs[component_label].add(triple)
+        else:
+            for taxonomy_graph in taxonomy_graphs:
+                taxonomy_graph.add(triple)
 
-    return reduced_graph
+    return taxonomy_graphs
 
 
 def generate_isolated_taxonomy_files(source_taxonomy_graph, saving_path, source_owl_file_path, hash_register):
-    """ Uses recursion for isolate all separated taxonomies inside a single graph
-        and saves each one of them as a separated file with the name taxonomy_X.ttl,
-        where X is the number of the taxonomy.
+    """ Isolates all separated taxonomies inside a single graph and saves each one of them as a separated file
+        with the name taxonomy_X.ttl, where X is the number of the taxonomy.
+        Returns the saved files' paths, the taxonomy graphs, and the hash register.
     """
 
-    source_taxonomy_nodes = generates_nodes_lists(source_taxonomy_graph)
-    source_taxonomy_roots = source_taxonomy_nodes["roots"]
-    source_taxonomy_roots.sort()
     dataset_name = saving_path.split(os.path.sep)[-1]
+    with profile_stage("component_split"):
+        taxonomy_graphs = split_taxonomy_graph(source_taxonomy_graph)
 
     files = []
-    idx = 0
-    while len(source_taxonomy_roots) > 0:
-        related_classes = get_all_related_nodes(source_taxonomy_graph, source_taxonomy_nodes,
-                                                source_taxonomy_roots[0], remove_itself=False)
-        not_related_classes = lists_subtraction(source_taxonomy_nodes["all"], related_classes)
-        reduced_graph = remove_classes_from_graph(source_taxonomy_graph, not_related_classes)
-        source_taxonomy_roots = lists_subtraction(source_taxonomy_roots, related_classes)
-
+    for idx, taxonomy_graph in enumerate(taxonomy_graphs):
         taxonomy_file_path = os.path.join(saving_path, f"{dataset_name}_tx{idx + 1:03d}.ttl")
-        safe_save_taxonomy_graph(reduced_graph, taxonomy_file_path)
-        hash_register = register_sha256_hash_information(hash_register, taxonomy_file_path, source_owl_file_path)
+        with profile_stage("taxonomy_files_write"):
+            taxonomy_file_hash = safe_save_taxonomy_graph(taxonomy_graph, taxonomy_file_path)
+        hash_register = register_sha256_hash_information(hash_register, taxonomy_file_path, source_owl_file_path,
+                                                         taxonomy_file_hash)
         files.append(taxonomy_file_path)
-        idx += 1
 
-    return files, hash_register
+    return files, taxonomy_graphs, hash_register
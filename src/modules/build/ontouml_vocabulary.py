@@ -1,3 +1,4 @@
+""" URIs of the OntoUML vocabulary used in the catalog's ontology.ttl files. """
 from rdflib import URIRef
 
 VOCABULARY_CLASS_URI = URIRef("https://purl.org/ontouml-models/vocabulary/Class")
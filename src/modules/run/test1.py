@@ -1,15 +1,24 @@
 """ Baseline dictionary definition. """
 import csv
+import json
 import os
-import yaml
 import platform
-import psutil
+import time
+
+from rdflib import URIRef, RDF
 
 from src import NAMESPACE_TAXONOMY, NAMESPACE_GUFO, MINIMUM_ALLOWED_NUMBER_CLASSES, PERCENTAGE_INITIAL, \
     PERCENTAGE_FINAL, PERCENTAGE_RATE, NUMBER_OF_EXECUTIONS_PER_DATASET_PER_PERCENTAGE
-from src.modules.tester.logger_config import initialize_logger
+from src.modules.tester.isolation import ExecutionFailure, IsolatedExecutionError, run_supervised
+from src.modules.tester.logger_config import get_logger
+from src.modules.tester.memory_metrics import measure_memory
+from src.modules.tester.profiling import profile_stage, set_profiling_context, collect_profile_records
 from src.modules.tester.utils_general import write_csv_row, write_dictionary
 from src.modules.build.build_directories_structure import create_folder
+from src.modules.tester.utils_rdf import load_graph_once, create_overlay_graph
+from src.modules.tester.utils_serialization import save_classes_output, get_classes_output_extension
+
+logger = get_logger()
 
 
 class ClassDef(object):
@@ -18,6 +27,44 @@ class ClassDef(object):
         self.stereotype = class_stereotype
 
 
+class ExecutionResult(object):
+    """ Used for returning the outcome of a single Scior execution to the process that records it. """
+
+    def __init__(self, execution_number, input_class):
+        self.execution_number: int = execution_number
+        self.input_class: ClassDef = input_class
+
+        # Only set when Scior does not report an inconsistency
+        self.is_consistent: bool = False
+        self.software_version: str = None
+        self.time_register: dict = None
+        self.statistics_row: list = None
+        self.has_divergency: bool = False
+
+        # Only set when the isolated Scior call was stopped by its supervisor
+        self.failure: ExecutionFailure = None
+
+        # Stages' times of the execution, when profiling is enabled
+        self.profile_records: list = []
+        # Wall time of the whole execution (in s)
+        self.elapsed_time: float = 0.0
+
+
+class OntologyDataclassIndex(object):
+    """ Index of the dataclasses returned by a Scior execution, built once per execution and shared by the writers of
+        its results. Maps every class URI to its dataclass and to the sets of its is, can, and not types. """
+
+    def __init__(self, ontology_dataclass_list):
+        self.ontology_dataclass_list: list = ontology_dataclass_list
+        self.dataclasses: dict = {}
+        self.types_sets: dict = {}
+
+        for dataclass in ontology_dataclass_list:
+            self.dataclasses[dataclass.uri] = dataclass
+            self.types_sets[dataclass.uri] = (set(dataclass.is_type), set(dataclass.can_type),
+                                              set(dataclass.not_type))
+
+
 def load_baseline_dictionary(csv_file_name):
     list_input_classes = []
 
@@ -31,8 +78,11 @@ def load_baseline_dictionary(csv_file_name):
     return list_input_classes
 
 
-def save_platform_information(dataset_folder, file_name, software_version, env_vars=False):
-    """ Saves platform information into the file """
+def save_platform_information(dataset_folder, file_name, software_version, env_vars=False, seed=None):
+    """ Saves platform information into the file. The seed is only saved together with the env_vars. """
+
+    import psutil
+
     csv_header = ["scior_version", "python_version", "operating_system", "processor", "installed_ram"]
     csv_row = [software_version,
                platform.python_version(),
@@ -44,6 +94,9 @@ def save_platform_information(dataset_folder, file_name, software_version, env_v
                        "percentage_rate", "number_of_executions_per_dataset_per_percentage"]
         csv_row += [MINIMUM_ALLOWED_NUMBER_CLASSES, PERCENTAGE_INITIAL, PERCENTAGE_FINAL,
                     PERCENTAGE_RATE, NUMBER_OF_EXECUTIONS_PER_DATASET_PER_PERCENTAGE]
+        if seed is not None:
+            csv_header.append("seed")
+            csv_row.append(seed)
 
     with open(os.path.join(dataset_folder, file_name), 'w', newline='', encoding='utf-8') as f:
         writer = csv.writer(f)
@@ -54,8 +107,6 @@ def save_platform_information(dataset_folder, file_name, software_version, env_v
 def remaps_to_gufo(class_name, gufo_lower_type: str, no_namespace: bool = False):
     """ Receives a gufo_lower_type and returns a valid_gufo_type """
 
-    logger = initialize_logger()
-
     mapped_stereotype = ""
     list_for_capitalization = ["category", "kind", "mixin", "phase", "role", "sortal"]
     dict_for_mapping = {"phasemixin": "PhaseMixin", "rolemixin": "RoleMixin", "subkind": "SubKind",
@@ -79,6 +130,16 @@ def create_inconsistency_csv_output(inconsistencies_file_name, file_name, execut
     write_csv_row(inconsistencies_file_name, csv_header, csv_row)
 
 
+def create_failure_csv_output(failures_file_name, file_name, percentage_number, execution_number, failure):
+    """ Creates and updates a CSV file with a list of all executions whose isolated Scior call was stopped (e.g., by
+        a timeout), their outcomes, and their measured times and memory. The percentage is only informed by TEST_2. """
+    csv_header = ["taxonomy_name", "percentage", "execution_number", "outcome", "elapsed_time", "peak_rss_mb",
+                  "details"]
+    csv_row = [file_name[1:-18] + file_name[-9:-4] + ".ttl", percentage_number, execution_number, failure.outcome,
+               failure.elapsed_time, failure.peak_rss_mb, failure.details]
+    write_csv_row(failures_file_name, csv_header, csv_row)
+
+
 def create_summary_csv_output(test_results_folder, file_name, execution_number, input_class):
     """ Creates and updates a CSV file with a list of all executions, the respective input classes
     and their stereotypes. """
@@ -88,13 +149,10 @@ def create_summary_csv_output(test_results_folder, file_name, execution_number,
     write_csv_row(statistics, csv_header, csv_row)
 
 
-def create_statistics_csv_output(ontology_dataclass_list, consolidated_statistics, test_results_folder,
-                                 file_name, execution_number):
+def create_statistics_csv_output(statistics_row, test_results_folder, file_name):
     csv_header = create_csv_header()
-    number_incomplete_classes = calculate_incompleteness_values(ontology_dataclass_list)
-    csv_row = populate_csv_row(consolidated_statistics, execution_number, number_incomplete_classes)
     statistics = os.path.join(test_results_folder, f"statistics{file_name}")
-    write_csv_row(statistics, csv_header, csv_row)
+    write_csv_row(statistics, csv_header, statistics_row)
 
 
 def calculate_incompleteness_values(ontology_dataclass_list):
@@ -110,27 +168,32 @@ def create_times_csv_output(time_register, test_results_folder, file_name, execu
     write_dictionary(times_output_complete_path, time_keys, time_register)
 
 
-def create_classes_yaml_output(input_class, ontology_dataclass_list, test_results_folder, file_name):
-    """ Receives an ontology_dataclass_list and saves its information in yaml format. """
+def create_classes_yaml_output(input_class, dataclass_index, test_results_folder, file_name,
+                               output_backend=None, output_key=None, classes_format="yaml"):
+    """ Receives an OntologyDataclassIndex and saves its information in yaml (or in the informed) format.
+        If an output backend is informed, the information is appended to its classes table instead. """
+
+    if output_backend is not None:
+        append_classes_output_rows(output_backend, output_key, convert_dataclass_index_to_dictionary_list(
+            [input_class], dataclass_index))
+        return
 
     yaml_folder = os.path.join(test_results_folder, "results")
     create_folder(yaml_folder, "Results directory created")
     classes_output_complete_path = os.path.join(yaml_folder, file_name)
 
-    ontology_dictionary_list = convert_ontology_dataclass_list_to_dictionary_list(
-        [input_class], ontology_dataclass_list)
+    ontology_dictionary_list = convert_dataclass_index_to_dictionary_list([input_class], dataclass_index)
 
-    with open(classes_output_complete_path, 'w', encoding='utf-8') as file:
-        yaml.dump_all(ontology_dictionary_list, file, sort_keys=True)
+    save_classes_output(ontology_dictionary_list, classes_output_complete_path, classes_format)
 
 
-def convert_ontology_dataclass_list_to_dictionary_list(input_class_list, ontology_dataclass_list):
-    """ Receives an ontology_dataclass_list and returns a dictionary to be printed in yaml format. """
+def convert_dataclass_index_to_dictionary_list(input_class_list, dataclass_index):
+    """ Receives an OntologyDataclassIndex and returns a dictionary to be printed in yaml format. """
 
     ontology_dictionary_list = []
-    input_long_names = [NAMESPACE_TAXONOMY + input_class.name for input_class in input_class_list]
+    input_long_names = {NAMESPACE_TAXONOMY + input_class.name for input_class in input_class_list}
 
-    for ontology_dataclass in ontology_dataclass_list:
+    for ontology_dataclass in dataclass_index.ontology_dataclass_list:
         short_dataclass_name = ontology_dataclass.uri.removeprefix(NAMESPACE_TAXONOMY)
         ontology_dictionary = {short_dataclass_name: {
                 "input": ontology_dataclass.uri in input_long_names,
@@ -146,39 +209,58 @@ def convert_ontology_dataclass_list_to_dictionary_list(input_class_list, ontolog
     return ontology_dictionary_list
 
 
-def get_final_list(class_name_prefixed, class_gufo_stereotype, ontology_dataclass_list):
+def append_classes_output_rows(output_backend, output_key, ontology_dictionary_list):
+    """ Appends the classes' information (as returned by convert_dataclass_index_to_dictionary_list) to the
+        output backend's classes table. Lists of types are saved in JSON format. """
+
+    rows = []
+    for ontology_dictionary in ontology_dictionary_list:
+        for class_name, class_information in ontology_dictionary.items():
+            rows.append([class_name, class_information["input"], json.dumps(class_information["is_type"]),
+                         json.dumps(class_information["can_type"]), json.dumps(class_information["not_type"]),
+                         class_information["is_incomplete"], json.dumps(class_information["detected_in"])])
+
+    output_backend.append_rows("classes", output_key, rows)
+
+
+def get_final_list(class_name_prefixed, class_gufo_stereotype, dataclass_index):
     final_list = "undeclared"
-    logger = initialize_logger()
-
-    for dataclass in ontology_dataclass_list:
-        if dataclass.uri == class_name_prefixed:
-            if class_gufo_stereotype in dataclass.is_type:
-                final_list = "is"
-            elif class_gufo_stereotype in dataclass.can_type:
-                final_list = "can"
-            elif class_gufo_stereotype in dataclass.not_type:
-                final_list = "not"
-            else:
-                logger.error("Not found in any list.")
-                exit(1)
+    if class_name_prefixed in dataclass_index.types_sets:
+        is_types, can_types, not_types = dataclass_index.types_sets[class_name_prefixed]
+        if class_gufo_stereotype in is_types:
+            final_list = "is"
+        elif class_gufo_stereotype in can_types:
+            final_list = "can"
+        elif class_gufo_stereotype in not_types:
+            final_list = "not"
+        else:
+            logger.error("Not found in any list.")
+            exit(1)
 
     return final_list
 
 
-def create_classes_results_csv_output(input_classes_list, ontology_dataclass_list, test_folder,
-                                      divergences_file_name, file_name):
+def create_classes_results_csv_output(input_classes_list, dataclass_index, test_folder, file_name,
+                                      output_backend=None, output_key=None):
+    """ Creates the results CSV file and returns a boolean indicating if any input class was classified in
+        a way that diverges from its original classification.
+        If an output backend is informed, the results are appended to its results table instead. """
     final_row_list = []
     has_divergency = False
 
     for input_class in input_classes_list:
         class_name_prefixed = NAMESPACE_TAXONOMY + input_class.name
         class_gufo_stereotype = "gufo:" + remaps_to_gufo(input_class.name, input_class.stereotype, True)
-        final_list = get_final_list(class_name_prefixed, class_gufo_stereotype, ontology_dataclass_list)
+        final_list = get_final_list(class_name_prefixed, class_gufo_stereotype, dataclass_index)
         final_row = [input_class.name, input_class.stereotype, final_list]
         if final_list == "not":
             has_divergency = True
         final_row_list.append(final_row)
 
+    if output_backend is not None:
+        output_backend.append_rows("results", output_key, final_row_list)
+        return has_divergency
+
     classes_output_complete_path = os.path.join(test_folder, "results", file_name)
     csv_header = ["class_name", "class_original_classification", "classification_final_list"]
     with open(classes_output_complete_path, 'w', newline='', encoding='utf-8') as f:
@@ -187,13 +269,27 @@ def create_classes_results_csv_output(input_classes_list, ontology_dataclass_lis
         for final_row in final_row_list:
             writer.writerow(final_row)
 
-    if has_divergency:
-        write_csv_row(divergences_file_name,
-                      ["taxonomy_name", "result_file"],
-                      [file_name.split("_")[1] + "_" + file_name.split("_")[4][0:5] + ".ttl", file_name])
+    return has_divergency
+
+
+def create_divergences_csv_output(divergences_file_name, file_name):
+    """ Creates and updates a CSV file with a list of all results files that contain divergences. """
+    write_csv_row(divergences_file_name,
+                  ["taxonomy_name", "result_file"],
+                  [file_name.split("_")[1] + "_" + file_name.split("_")[4][0:5] + ".ttl", file_name])
+
 
+def create_matrix_output(knowledge_matrix, test_folder, file_name, output_backend=None, output_key=None):
+    """ Saves the knowledge matrix in a CSV file or, if an output backend is informed, appends its cells to the
+        backend's matrix table. """
+
+    if output_backend is not None:
+        output_backend.append_rows("matrix", output_key,
+                                   [[row_number, column_number, str(value)]
+                                    for row_number, row in enumerate(knowledge_matrix)
+                                    for column_number, value in enumerate(row)])
+        return
 
-def create_matrix_output(knowledge_matrix, test_folder, file_name):
     knowledge_matrix_path = os.path.join(test_folder, "results", file_name)
 
     with open(knowledge_matrix_path, 'w', newline='', encoding='utf-8') as f:
@@ -201,6 +297,126 @@ def create_matrix_output(knowledge_matrix, test_folder, file_name):
         writer.writerows(knowledge_matrix)
 
 
+"""
+--------------------------------
+Functions for executions
+--------------------------------
+"""
+
+
+def run_scior_tester(global_configurations, ontology_graph, memory_metrics=None):
+    """ Executes Scior, in a supervised child process if the isolation is enabled (in which case the memory metrics
+        of the call are added to memory_metrics). Its package (and its dependencies, as pandas) is only imported when
+        the first test is executed, so that it is not loaded by the other modes. """
+
+    from scior import run_scior_tester as scior_run_scior_tester
+
+    return run_supervised(scior_run_scior_tester, global_configurations, ontology_graph,
+                          memory_metrics=memory_metrics)
+
+
+def execute_scior_test1(global_configurations, taxonomy_file, input_class, execution_number, input_classes,
+                        test_results_folder, draft_file_name, output_backend=None, classes_format="yaml"):
+    """ Executes Scior using a single input class and creates the files that belong only to this execution
+        (or appends their data to the output backend, if informed). The complete* files are saved in classes_format.
+        Files shared with other executions are not written here, as this function may run in a worker process.
+        Returns the ExecutionResult to be recorded by record_scior_test1.
+    """
+
+    execution_result = ExecutionResult(execution_number, input_class)
+    execution_start = time.perf_counter()
+    set_profiling_context(taxonomy_file.split(os.path.sep)[-2], os.path.basename(taxonomy_file))
+
+    with profile_stage("parse"):
+        taxonomy_graph = load_graph_once(taxonomy_file)
+
+    with measure_memory() as memory_metrics:
+        with profile_stage("graph_copy"):
+            working_graph = create_overlay_graph(taxonomy_graph)
+            triple_subject = URIRef(NAMESPACE_TAXONOMY + input_class.name)
+            class_gufo_type = remaps_to_gufo(input_class.name, input_class.stereotype)
+            triple_object = URIRef(class_gufo_type)
+            working_graph.add((triple_subject, RDF.type, triple_object))
+            working_graph.bind("gufo", NAMESPACE_GUFO)
+
+        try:
+            with profile_stage("scior_call"):
+                ontology_dataclass_list, time_register, consolidated_statistics, knowledge_matrix, software_version = \
+                    run_scior_tester(global_configurations, working_graph, memory_metrics)
+        except IsolatedExecutionError as error:
+            execution_result.failure = error.failure
+            execution_result.profile_records = collect_profile_records()
+            execution_result.elapsed_time = time.perf_counter() - execution_start
+            return execution_result
+        except:
+            execution_result.profile_records = collect_profile_records()
+            execution_result.elapsed_time = time.perf_counter() - execution_start
+            return execution_result
+
+    time_register.update(memory_metrics)
+
+    # Creating resulting files
+    with profile_stage("result_writing"):
+        dataclass_index = OntologyDataclassIndex(ontology_dataclass_list)
+        output_key = (os.path.basename(taxonomy_file), None, execution_number)
+        create_classes_yaml_output(input_class, dataclass_index, test_results_folder,
+                                   file_name=f"complete{draft_file_name[:-4]}_ex{execution_number:03d}"
+                                             f"{get_classes_output_extension(classes_format)}",
+                                   output_backend=output_backend, output_key=output_key,
+                                   classes_format=classes_format)
+        execution_result.has_divergency = create_classes_results_csv_output(
+            input_classes, dataclass_index, test_results_folder,
+            file_name=f"simple{draft_file_name[:-4]}_ex{execution_number:03d}.csv",
+            output_backend=output_backend, output_key=output_key)
+        create_matrix_output(knowledge_matrix, test_results_folder,
+                             file_name=f"matrix{draft_file_name[:-4]}_ex{execution_number:03d}.csv",
+                             output_backend=output_backend, output_key=output_key)
+
+        execution_result.is_consistent = True
+        execution_result.software_version = software_version
+        execution_result.time_register = time_register
+        execution_result.statistics_row = populate_csv_row(consolidated_statistics, execution_number,
+                                                           calculate_incompleteness_values(ontology_dataclass_list))
+
+    execution_result.profile_records = collect_profile_records()
+    execution_result.elapsed_time = time.perf_counter() - execution_start
+    return execution_result
+
+
+def record_scior_test1(execution_result, tests_total, test_results_folder, draft_file_name,
+                       inconsistencies_file_name, divergences_file_name, failures_file_name=None):
+    """ Writes the result of an execution into the files shared with other executions.
+        Must be called in the main process and in execution order. """
+
+    execution_number = execution_result.execution_number
+    input_class = execution_result.input_class
+
+    if execution_result.failure is not None:
+        logger.error(f"{execution_result.failure.outcome.upper()}! Test {execution_number}/{tests_total} "
+                     f"for input class {input_class.name} stopped: {execution_result.failure.details}.")
+        create_failure_csv_output(failures_file_name, draft_file_name, None, execution_number,
+                                  execution_result.failure)
+        return
+
+    if not execution_result.is_consistent:
+        logger.error(f"INCONSISTENCY found! Test {execution_number}/{tests_total} "
+                     f"for input class {input_class.name} interrupted.")
+        create_inconsistency_csv_output(inconsistencies_file_name, draft_file_name, execution_number, input_class)
+        return
+
+    logger.info(f"Test {execution_number}/{tests_total} "
+                f"for input class {input_class.name} successfully executed.")
+    if execution_number == 1:
+        save_platform_information(test_results_folder,
+                                  f"settings{draft_file_name[:-10]}.csv", execution_result.software_version)
+    if execution_result.has_divergency:
+        create_divergences_csv_output(divergences_file_name,
+                                      f"simple{draft_file_name[:-4]}_ex{execution_number:03d}.csv")
+    create_times_csv_output(execution_result.time_register, test_results_folder, draft_file_name, execution_number)
+    create_statistics_csv_output(execution_result.statistics_row, test_results_folder, draft_file_name)
+    create_summary_csv_output(test_results_folder, draft_file_name, execution_number, input_class)
+
+
 """
 --------------------------------
 Functions for statistics
@@ -1,9 +1,28 @@
 """ Functions related to Test 2 """
 import csv
 import os
-import yaml
+import random
+import time
+
+from rdflib import URIRef, RDF
 
 import src.modules.run.test1 as test1
+from src import NAMESPACE_TAXONOMY, NAMESPACE_GUFO, PERCENTAGE_INITIAL, PERCENTAGE_FINAL, PERCENTAGE_RATE, \
+    NUMBER_OF_EXECUTIONS_PER_DATASET_PER_PERCENTAGE
+from src.modules.tester.logger_config import get_logger
+from src.modules.tester.profiling import profile_stage, set_profiling_context, collect_profile_records
+from src.modules.tester.utils_serialization import save_classes_output, get_classes_output_extension
+
+logger = get_logger()
+
+
+class ExecutionResultT2(test1.ExecutionResult):
+    """ Used for returning the outcome of a single Test 2 execution to the process that records it. """
+
+    def __init__(self, percentage_number, execution_number, input_classes):
+        super().__init__(execution_number, None)
+        self.percentage_number: int = percentage_number
+        self.input_classes: list = input_classes
 
 
 def create_inconsistency_csv_output_t2(inconsistencies_file_name, file_name, percentage_number, execution_number):
@@ -13,21 +32,33 @@ def create_inconsistency_csv_output_t2(inconsistencies_file_name, file_name, per
     test1.write_csv_row(inconsistencies_file_name, csv_header, csv_row)
 
 
-def create_classes_yaml_output_t2(input_class_list, ontology_dataclass_list, test_results_folder, file_name):
-    """ Receives an ontology_dataclass_list and saves its information in yaml format. """
+def create_classes_yaml_output_t2(input_class_list, dataclass_index, test_results_folder, file_name,
+                                  output_backend=None, output_key=None, classes_format="yaml"):
+    """ Receives an OntologyDataclassIndex and saves its information in yaml (or in the informed) format.
+        If an output backend is informed, the information is appended to its classes table instead. """
+
+    if output_backend is not None:
+        test1.append_classes_output_rows(output_backend, output_key,
+                                         test1.convert_dataclass_index_to_dictionary_list(
+                                             input_class_list, dataclass_index))
+        return
 
     yaml_folder = os.path.join(test_results_folder, "results")
     test1.create_folder(yaml_folder, "Results directory created")
     classes_output_complete_path = os.path.join(yaml_folder, file_name)
 
-    ontology_dictionary_list = test1.convert_ontology_dataclass_list_to_dictionary_list(
-        input_class_list, ontology_dataclass_list)
+    ontology_dictionary_list = test1.convert_dataclass_index_to_dictionary_list(input_class_list, dataclass_index)
 
-    with open(classes_output_complete_path, 'w', encoding='utf-8') as file:
-        yaml.dump_all(ontology_dictionary_list, file, sort_keys=True)
+    save_classes_output(ontology_dictionary_list, classes_output_complete_path, classes_format)
 
 
-def create_times_csv_output_t2(time_register, test_results_folder, file_name, percentage_number, execution_number):
+def create_times_csv_output_t2(time_register, test_results_folder, file_name, percentage_number, execution_number,
+                               output_backend=None, output_key=None):
+    if output_backend is not None:
+        output_backend.append_rows("times", output_key,
+                                   [[time_name, time_register[time_name]] for time_name in sorted(time_register)])
+        return
+
     times_output_complete_path = os.path.join(test_results_folder,
                                     f"times{file_name[:-4]}_ex{execution_number:03d}_pc{percentage_number:03d}.csv")
     time_keys = list(time_register.keys())
@@ -49,10 +80,182 @@ def populate_csv_row(consolidated_statistics, percentage_number, execution_numbe
 
 
 def create_statistics_csv_output_t2(ontology_dataclass_list, consolidated_statistics, test_results_folder,
-                                    file_name, percentage_number, execution_number):
+                                    file_name, percentage_number, execution_number,
+                                    output_backend=None, output_key=None):
     csv_header = create_csv_header()
     number_incomplete_classes = test1.calculate_incompleteness_values(ontology_dataclass_list)
     csv_row = populate_csv_row(consolidated_statistics, percentage_number, execution_number, number_incomplete_classes)
+
+    if output_backend is not None:
+        # The percentage and execution columns are already part of the output key
+        output_backend.append_rows("statistics", output_key, [csv_row[2:]],
+                                   columns=[(column_name, "float") for column_name in csv_header[2:]])
+        return
+
     statistics = os.path.join(test_results_folder,
                               f"statistics{file_name[:-4]}_ex{execution_number:03d}_pc{percentage_number:03d}.csv")
     test1.write_csv_row(statistics, csv_header, csv_row)
+
+
+"""
+--------------------------------
+Functions for the executions plan
+--------------------------------
+"""
+
+
+def create_test2_plan(input_classes, taxonomy_filename, seed):
+    """ Creates the list of all Test 2 executions of a taxonomy, each one with its own sample of input classes.
+        Every item of the returned list is a tuple (percentage_number, execution_number, sample_list).
+
+        The random generator is seeded with the run's seed and the taxonomy's file name. Hence, the same samples are
+        obtained for a taxonomy independently of the other taxonomies and of the process in which they are generated.
+    """
+
+    random_generator = random.Random(f"{seed}_{taxonomy_filename}")
+    model_size = len(input_classes)
+    test2_plan = []
+
+    current_percentage = PERCENTAGE_INITIAL
+    while current_percentage <= PERCENTAGE_FINAL:
+        number_of_input_classes = round(model_size * current_percentage / 100)
+
+        for current_execution in range(1, NUMBER_OF_EXECUTIONS_PER_DATASET_PER_PERCENTAGE + 1):
+            sample_list = random_generator.sample(input_classes, number_of_input_classes)
+            test2_plan.append((current_percentage, current_execution, sample_list))
+
+        current_percentage += PERCENTAGE_RATE
+
+    return test2_plan
+
+
+def save_test2_plan(test2_plan, seed, test_results_folder, file_name):
+    """ Saves the executions plan of a taxonomy, listing the input classes sampled for every execution. """
+
+    csv_header = ["seed", "percentage", "execution_number", "input_class_name"]
+    plan_file_path = os.path.join(test_results_folder, f"plan{file_name}")
+
+    with open(plan_file_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(csv_header)
+        for (percentage_number, execution_number, sample_list) in test2_plan:
+            for input_class in sample_list:
+                writer.writerow([seed, percentage_number, execution_number, input_class.name])
+
+
+"""
+--------------------------------
+Functions for executions
+--------------------------------
+"""
+
+
+def execute_scior_test2(global_configurations, taxonomy_file, test2_plan_item, input_classes,
+                        test_results_folder, draft_file_name, output_backend=None, classes_format="yaml"):
+    """ Executes Scior for a single item of the Test 2 plan and creates the files that belong only to it
+        (or appends their data to the output backend, if informed). The complete* files are saved in classes_format.
+        Files shared with other executions are not written here, as this function may run in a worker process.
+        Returns the ExecutionResultT2 to be recorded by record_scior_test2.
+    """
+
+    percentage_number, execution_number, sample_list = test2_plan_item
+    execution_result = ExecutionResultT2(percentage_number, execution_number, sample_list)
+    execution_start = time.perf_counter()
+    execution_suffix = f"_ex{execution_number:03d}_pc{percentage_number:03d}"
+    set_profiling_context(taxonomy_file.split(os.path.sep)[-2], os.path.basename(taxonomy_file))
+
+    with profile_stage("parse"):
+        taxonomy_graph = test1.load_graph_once(taxonomy_file)
+
+    with test1.measure_memory() as memory_metrics:
+        with profile_stage("graph_copy"):
+            working_graph = test1.create_overlay_graph(taxonomy_graph)
+            working_graph.bind("gufo", NAMESPACE_GUFO)
+
+            for input_class in sample_list:
+                triple_subject = URIRef(NAMESPACE_TAXONOMY + input_class.name)
+                class_gufo_type = test1.remaps_to_gufo(input_class.name, input_class.stereotype)
+                triple_object = URIRef(class_gufo_type)
+                working_graph.add((triple_subject, RDF.type, triple_object))
+
+        try:
+            with profile_stage("scior_call"):
+                ontology_dataclass_list, time_register, consolidated_statistics, knowledge_matrix, software_version = \
+                    test1.run_scior_tester(global_configurations, working_graph, memory_metrics)
+        except test1.IsolatedExecutionError as error:
+            execution_result.failure = error.failure
+            execution_result.profile_records = collect_profile_records()
+            execution_result.elapsed_time = time.perf_counter() - execution_start
+            return execution_result
+        except:
+            execution_result.profile_records = collect_profile_records()
+            execution_result.elapsed_time = time.perf_counter() - execution_start
+            return execution_result
+
+    time_register.update(memory_metrics)
+
+    # Creating resulting files
+    with profile_stage("result_writing"):
+        dataclass_index = test1.OntologyDataclassIndex(ontology_dataclass_list)
+        output_key = (os.path.basename(taxonomy_file), percentage_number, execution_number)
+        create_classes_yaml_output_t2(sample_list, dataclass_index, test_results_folder,
+                                      file_name=f"complete{draft_file_name[:-4]}{execution_suffix}"
+                                                f"{get_classes_output_extension(classes_format)}",
+                                      output_backend=output_backend, output_key=output_key,
+                                      classes_format=classes_format)
+        execution_result.has_divergency = test1.create_classes_results_csv_output(
+            input_classes, dataclass_index, test_results_folder,
+            file_name=f"simple{draft_file_name[:-4]}{execution_suffix}.csv",
+            output_backend=output_backend, output_key=output_key)
+        test1.create_matrix_output(knowledge_matrix, test_results_folder,
+                                   file_name=f"matrix{draft_file_name[:-4]}{execution_suffix}.csv",
+                                   output_backend=output_backend, output_key=output_key)
+        create_times_csv_output_t2(time_register, test_results_folder, draft_file_name,
+                                   percentage_number, execution_number,
+                                   output_backend=output_backend, output_key=output_key)
+        create_statistics_csv_output_t2(ontology_dataclass_list, consolidated_statistics, test_results_folder,
+                                        draft_file_name, percentage_number, execution_number,
+                                        output_backend=output_backend, output_key=output_key)
+
+    execution_result.is_consistent = True
+    execution_result.software_version = software_version
+    execution_result.profile_records = collect_profile_records()
+    execution_result.elapsed_time = time.perf_counter() - execution_start
+
+    return execution_result
+
+
+def record_scior_test2(execution_result, seed, taxonomy_filename, test_results_folder, draft_file_name,
+                       inconsistencies_file_name, divergences_file_name, failures_file_name=None):
+    """ Writes the result of a Test 2 execution into the files shared with other executions.
+        Must be called in the main process and in the plan's order. """
+
+    percentage_number = execution_result.percentage_number
+    execution_number = execution_result.execution_number
+    end = "\n" if execution_number == NUMBER_OF_EXECUTIONS_PER_DATASET_PER_PERCENTAGE else ""
+
+    if execution_result.failure is not None:
+        logger.error(f"{execution_result.failure.outcome.upper()}: {taxonomy_filename} "
+                     f"- percentage {percentage_number} - excecution {execution_number}. "
+                     f"Current execution stopped: {execution_result.failure.details}.{end}")
+        test1.create_failure_csv_output(failures_file_name, draft_file_name, percentage_number, execution_number,
+                                        execution_result.failure)
+        return
+
+    if not execution_result.is_consistent:
+        logger.error(f"INCONSISTENCY found: {taxonomy_filename} "
+                     f"- percentage {percentage_number} - excecution {execution_number}. "
+                     f"Current execution interrupted.{end}")
+        create_inconsistency_csv_output_t2(inconsistencies_file_name, draft_file_name, percentage_number,
+                                           execution_number)
+        return
+
+    logger.info(f"Test dataset {taxonomy_filename} - percentage {percentage_number} - "
+                f"excecution {execution_number} successfully executed "
+                f"({len(execution_result.input_classes)} input classes).{end}")
+    if (execution_number == 1) and (percentage_number == PERCENTAGE_INITIAL):
+        test1.save_platform_information(test_results_folder, f"settings{draft_file_name[:-10]}.csv",
+                                        execution_result.software_version, env_vars=True, seed=seed)
+    if execution_result.has_divergency:
+        execution_suffix = f"_ex{execution_number:03d}_pc{percentage_number:03d}"
+        test1.create_divergences_csv_output(divergences_file_name, f"simple{draft_file_name[:-4]}{execution_suffix}.csv")
@@ -0,0 +1,134 @@
+""" Checkpoint journal of the test units (i.e., the executions, identified by taxonomy, percentage, and execution
+    number) whose results were completely recorded, used for resuming interrupted test runs.
+
+    A unit is registered in the journal only after all its rows in the shared result files were written, as the active
+    result writer session writes the journal's rows after the rows of all other files. Hence, all rows of a registered
+    unit are present in the result files, and rows of units that are not registered (i.e., that were only partially
+    written when the run was interrupted) can be removed from them before the units are executed again.
+"""
+import csv
+import os
+import re
+import shutil
+import tempfile
+
+from src.modules.tester.logger_config import get_logger
+from src.modules.tester.result_writer import get_active_result_writer, repair_torn_tail
+
+logger = get_logger()
+
+CHECKPOINT_HEADER = ["taxonomy_name", "percentage", "execution_number", "seed"]
+
+# Execution and percentage numbers in the names of the files listed in the divergences files
+RESULT_FILE_UNIT_PATTERN = re.compile(r"_ex(\d{3})(?:_pc(\d{3}))?\.csv$")
+
+
+class CheckpointJournal(object):
+    """ Keeps the set of completed units and appends the newly completed ones to the journal file.
+        A journal without file name only keeps the units in memory. """
+
+    def __init__(self, file_name=None, resume=False):
+        self.file_name: str = file_name
+        self.resume: bool = resume
+        self.completed_units: set = set()
+        self.seed: int = None
+
+    def is_completed(self, taxonomy_name, percentage, execution_number) -> bool:
+        return (taxonomy_name, percentage, execution_number) in self.completed_units
+
+    def register_completed(self, taxonomy_name, percentage, execution_number):
+        """ Registers a unit whose results were all recorded in the result files. """
+
+        self.completed_units.add((taxonomy_name, percentage, execution_number))
+        row = [taxonomy_name, "" if percentage is None else percentage, execution_number,
+               "" if self.seed is None else self.seed]
+
+        if self.file_name is None:
+            return
+
+        result_writer = get_active_result_writer()
+        if result_writer is not None:
+            result_writer.write_row(self.file_name, CHECKPOINT_HEADER, row, flush_last=True)
+        else:
+            is_new_file = not os.path.exists(self.file_name)
+            with open(self.file_name, 'a', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                if is_new_file:
+                    writer.writerow(CHECKPOINT_HEADER)
+                writer.writerow(row)
+
+
+def open_checkpoint_journal(catalog_folder, test_name, resume):
+    """ Returns the test run's checkpoint journal. When resuming, the units (and the seed) of the existing journal are
+        loaded. Otherwise, the existing journal is removed, as the run starts from the beginning. """
+
+    checkpoint_journal = CheckpointJournal(os.path.join(catalog_folder, f"checkpoint_{test_name}.csv"), resume)
+
+    if not os.path.exists(checkpoint_journal.file_name):
+        return checkpoint_journal
+
+    if not resume:
+        os.remove(checkpoint_journal.file_name)
+        return checkpoint_journal
+
+    repair_torn_tail(checkpoint_journal.file_name)
+    with open(checkpoint_journal.file_name, 'r', newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            percentage = int(row["percentage"]) if row["percentage"] else None
+            checkpoint_journal.completed_units.add((row["taxonomy_name"], percentage, int(row["execution_number"])))
+            if row["seed"]:
+                checkpoint_journal.seed = int(row["seed"])
+
+    logger.info(f"Resuming test run. {len(checkpoint_journal.completed_units)} completed executions found in "
+                f"the checkpoint journal {checkpoint_journal.file_name}.\n")
+
+    return checkpoint_journal
+
+
+def reconcile_csv_file(file_name, keep_row_function):
+    """ Removes from a CSV result file the rows for which keep_row_function returns False (i.e., rows of units that
+        were not completed). The header row is always kept. """
+
+    if not os.path.exists(file_name):
+        return
+
+    repair_torn_tail(file_name)
+    with open(file_name, 'r', newline='', encoding='utf-8') as f:
+        rows = list(csv.reader(f))
+
+    kept_rows = rows[:1] + [row for row in rows[1:] if keep_row_function(row)]
+    if len(kept_rows) == len(rows):
+        return
+
+    # Written in a temporary file and then renamed, so that an interruption does not leave an invalid file
+    file_descriptor, temporary_path = tempfile.mkstemp(dir=os.path.dirname(file_name))
+    with os.fdopen(file_descriptor, 'w', newline='', encoding='utf-8') as f:
+        csv.writer(f).writerows(kept_rows)
+    shutil.copymode(file_name, temporary_path)
+    os.replace(temporary_path, file_name)
+
+    logger.info(f"{len(rows) - len(kept_rows)} rows of not completed executions removed from {file_name}.")
+
+
+def reconcile_catalog_result_files(checkpoint_journal, inconsistencies_file_name, divergences_file_name,
+                                   failures_file_name=None):
+    """ Removes from the inconsistencies, divergences, and failures files of a test run the rows of units that were
+        not completed. Rows of the inconsistencies file identify the unit by the taxonomy name, the percentage (only
+        for TEST_2), and the execution number. Rows of the divergences file identify it by the result file's name.
+        Rows of the failures file always have a percentage column, which is empty for TEST_1. """
+
+    def is_inconsistency_completed(row):
+        if len(row) == 3:
+            return checkpoint_journal.is_completed(row[0], int(row[1]), int(row[2]))
+        return checkpoint_journal.is_completed(row[0], None, int(row[1]))
+
+    def is_divergence_completed(row):
+        unit_match = RESULT_FILE_UNIT_PATTERN.search(row[1])
+        percentage = int(unit_match.group(2)) if unit_match.group(2) else None
+        return checkpoint_journal.is_completed(row[0], percentage, int(unit_match.group(1)))
+
+    reconcile_csv_file(inconsistencies_file_name, is_inconsistency_completed)
+    reconcile_csv_file(divergences_file_name, is_divergence_completed)
+    if failures_file_name is not None:
+        reconcile_csv_file(failures_file_name, lambda row: checkpoint_journal.is_completed(
+            row[0], int(row[1]) if row[1] else None, int(row[2])))
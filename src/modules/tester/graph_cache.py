@@ -0,0 +1,161 @@
+""" Persistent on-disk cache of parsed graphs, keyed by the SHA-256 hash of the parsed file.
+
+    Graphs are stored in a compact binary format: a table with all distinct RDF terms and the triples as a flat array
+    of indexes into this table. Loading a cached graph is, hence, much faster than parsing the original Turtle file.
+    The cache size is limited and the least recently used graphs are evicted first.
+"""
+import os
+import pickle
+import tempfile
+
+from array import array
+from rdflib import Graph, URIRef, BNode, Literal
+
+from src import GRAPH_CACHE_ENABLED, GRAPH_CACHE_FOLDER, GRAPH_CACHE_SIZE_LIMIT
+from src.modules.tester.logger_config import get_logger
+
+logger = get_logger()
+
+# Must be increased every time the format of the cached files is changed
+GRAPH_CACHE_FORMAT_VERSION = 1
+GRAPH_CACHE_FILE_EXTENSION = f".v{GRAPH_CACHE_FORMAT_VERSION}.graph"
+
+URIREF_TERM = 0
+BNODE_TERM = 1
+LITERAL_TERM = 2
+
+graph_cache_configuration = {"enabled": GRAPH_CACHE_ENABLED,
+                             "folder": GRAPH_CACHE_FOLDER,
+                             "size_limit": GRAPH_CACHE_SIZE_LIMIT}
+
+
+def configure_graph_cache(enabled=None, folder=None, size_limit=None):
+    """ Overrides the graph cache configurations read from the environment. """
+
+    if enabled is not None:
+        graph_cache_configuration["enabled"] = enabled
+    if folder is not None:
+        graph_cache_configuration["folder"] = folder
+    if size_limit is not None:
+        graph_cache_configuration["size_limit"] = size_limit
+
+
+def is_graph_cache_enabled() -> bool:
+    return graph_cache_configuration["enabled"]
+
+
+def get_cached_graph_path(file_hash):
+    return os.path.join(graph_cache_configuration["folder"], file_hash + GRAPH_CACHE_FILE_EXTENSION)
+
+
+def encode_term(term):
+    if isinstance(term, URIRef):
+        return URIREF_TERM, str(term), None, None
+    if isinstance(term, BNode):
+        return BNODE_TERM, str(term), None, None
+    return LITERAL_TERM, str(term), term.language, str(term.datatype) if term.datatype else None
+
+
+def decode_term(encoded_term):
+    term_type, value, language, datatype = encoded_term
+    if term_type == URIREF_TERM:
+        return URIRef(value)
+    if term_type == BNODE_TERM:
+        return BNode(value)
+    return Literal(value, lang=language, datatype=URIRef(datatype) if datatype else None)
+
+
+def load_cached_graph(file_hash):
+    """ Returns the cached graph for the given file hash or None if it is not available in the cache. """
+
+    cached_graph_path = get_cached_graph_path(file_hash)
+
+    try:
+        with open(cached_graph_path, 'rb') as f:
+            cached_content = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError) as error:
+        logger.warning(f"Ignoring invalid cached graph {cached_graph_path}. Reported error: {error}")
+        return None
+
+    terms = [decode_term(encoded_term) for encoded_term in cached_content["terms"]]
+    triples_indexes = array("L")
+    triples_indexes.frombytes(cached_content["triples"])
+
+    cached_graph = Graph()
+    for prefix, namespace in cached_content["namespaces"]:
+        cached_graph.bind(prefix, namespace, override=True)
+    cached_graph.addN((terms[triples_indexes[idx]], terms[triples_indexes[idx + 1]], terms[triples_indexes[idx + 2]],
+                       cached_graph) for idx in range(0, len(triples_indexes), 3))
+
+    # Updating the modification time, used for the LRU eviction. The file may have been evicted by another process.
+    try:
+        os.utime(cached_graph_path)
+    except FileNotFoundError:
+        pass
+
+    return cached_graph
+
+
+def save_cached_graph(graph, file_hash):
+    """ Saves the graph into the cache and evicts the least recently used graphs if the size limit is exceeded. """
+
+    cache_folder = graph_cache_configuration["folder"]
+
+    terms_indexes = {}
+    terms = []
+    triples_indexes = array("L")
+
+    for triple in graph:
+        for term in triple:
+            term_index = terms_indexes.get(term)
+            if term_index is None:
+                term_index = terms_indexes[term] = len(terms)
+                terms.append(encode_term(term))
+            triples_indexes.append(term_index)
+
+    cached_content = {"terms": terms,
+                      "triples": triples_indexes.tobytes(),
+                      "namespaces": [(prefix, str(namespace)) for prefix, namespace in graph.namespaces()]}
+
+    try:
+        os.makedirs(cache_folder, exist_ok=True)
+        # Written in a temporary file and then renamed, as other processes may be reading the same cached graph
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=cache_folder)
+        with os.fdopen(file_descriptor, 'wb') as f:
+            pickle.dump(cached_content, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_path, get_cached_graph_path(file_hash))
+    except OSError as error:
+        logger.warning(f"Could not save graph in the cache folder {cache_folder}. Reported error: {error}")
+        return
+
+    evict_cached_graphs()
+
+
+def evict_cached_graphs():
+    """ Removes the least recently used cached graphs up to when the cache size is below its limit (in MB). """
+
+    cache_folder = graph_cache_configuration["folder"]
+    size_limit = graph_cache_configuration["size_limit"] * 1024 * 1024
+
+    cached_files = []
+    for file_name in os.listdir(cache_folder):
+        if file_name.endswith(GRAPH_CACHE_FILE_EXTENSION):
+            try:
+                file_stat = os.stat(os.path.join(cache_folder, file_name))
+            except FileNotFoundError:
+                # Evicted by another process after the folder was listed
+                continue
+            cached_files.append((file_stat.st_mtime, file_stat.st_size, file_name))
+
+    cache_size = sum(file_size for (_, file_size, _) in cached_files)
+    for (_, file_size, file_name) in sorted(cached_files):
+        if cache_size <= size_limit:
+            break
+        try:
+            os.remove(os.path.join(cache_folder, file_name))
+        except FileNotFoundError:
+            pass
+        cache_size -= file_size
+        logger.debug(f"Cached graph {file_name} evicted from the graph cache.")
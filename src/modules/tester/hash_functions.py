@@ -2,17 +2,55 @@
 import csv
 import hashlib
 import os
-import pandas as pd
 
 from src import BLOCK_SIZE
-from src.modules.tester.logger_config import initialize_logger
+from src.modules.tester.logger_config import get_logger
+from src.modules.tester.profiling import profile_stage
+
+logger = get_logger()
+
+HASH_REGISTER_HEADER = ["file_name", "file_hash", "source_file_name", "source_file_hash"]
+
+
+class HashRegister(object):
+    """ Register of the generated files' hashes and of the hashes of the source files they were generated from.
+        Entries are indexed by the generated file's hash, so lookups and insertions take constant time, and are
+        kept in insertion order in an append-only buffer that is written to the disk in batches.
+        The hash of each source file is computed only once.
+    """
+
+    def __init__(self):
+        self.entries: dict = {}
+        self.buffer: list = []
+        self.source_hashes: dict = {}
+
+    def __len__(self):
+        return len(self.buffer)
+
+    def __iter__(self):
+        return iter(self.buffer)
+
+    def get_source_hash(self, source_file_path) -> str:
+        if source_file_path not in self.source_hashes:
+            self.source_hashes[source_file_path] = generate_sha256_hash(source_file_path)
+        return self.source_hashes[source_file_path]
+
+    def add_entry(self, entry) -> bool:
+        """ Adds an entry (a row of the register file). Only the first entry of a repeated file hash is kept. """
+
+        if entry[1] in self.entries:
+            return False
+
+        self.entries[entry[1]] = entry
+        self.buffer.append(entry)
+        return True
 
 
 def generate_sha256_hash(file_path):
     """ Receives the complete path of a file and returns its sha256 hash. """
 
     file_hash = hashlib.sha256()
-    with open(file_path, 'rb') as f:
+    with profile_stage("hashing"), open(file_path, 'rb') as f:
         fb = f.read(BLOCK_SIZE)
         while len(fb) > 0:
             file_hash.update(fb)
@@ -21,35 +59,103 @@ def generate_sha256_hash(file_path):
     return file_hash.hexdigest()
 
 
-def write_sha256_hash_register(hash_register, hash_register_file_path):
-    """ Writes into hash register file. """
+def write_file_and_generate_sha256_hash(file_path, file_content: bytes):
+    """ Writes the content into the file and returns its sha256 hash, with no need to read the file back. """
+
+    with open(file_path, 'wb') as f:
+        f.write(file_content)
+
+    with profile_stage("hashing"):
+        return hashlib.sha256(file_content).hexdigest()
+
+
+def create_sha256_hash_register():
+    """ Returns a new empty hash register. """
+
+    return HashRegister()
+
 
-    logger = initialize_logger()
+def merge_sha256_hash_registers(hash_registers):
+    """ Merges the received hash registers in the given order into a single one.
+        As in register_sha256_hash_information, only the first entry of a repeated file hash is kept.
+    """
 
+    merged_register = create_sha256_hash_register()
+    for hash_register in hash_registers:
+        for entry in hash_register:
+            merged_register.add_entry(entry)
+
+    return merged_register
+
+
+def filter_sha256_hash_register(hash_register, filter_function):
+    """ Returns a new hash register with the entries of the received one that satisfy the filter function. """
+
+    filtered_register = create_sha256_hash_register()
+    for entry in hash_register:
+        if filter_function(entry):
+            filtered_register.add_entry(entry)
+
+    return filtered_register
+
+
+def read_sha256_hash_register(hash_register_file_path):
+    """ Reads the hash register file, returning an empty register if it does not exist.
+        As every build appends its entries (and header) to the file, only the last entry of each file is kept.
+    """
+
+    if not os.path.exists(hash_register_file_path):
+        logger.debug(f"Hash register file {hash_register_file_path} not found. Starting with an empty register.")
+        return create_sha256_hash_register()
+
+    entries_by_file_name = {}
     try:
-        hash_register.to_csv(hash_register_file_path, mode="a", index=False)
+        with open(hash_register_file_path, 'r', encoding='utf-8', newline='') as f:
+            for entry in csv.reader(f):
+                if len(entry) == len(HASH_REGISTER_HEADER) and entry != HASH_REGISTER_HEADER:
+                    entries_by_file_name.pop(entry[0], None)
+                    entries_by_file_name[entry[0]] = entry
+    except (OSError, csv.Error) as e:
+        logger.warning(f"Hash register file {hash_register_file_path} could not be read and was ignored.\n"
+                       f"System error reported: {e}")
+        return create_sha256_hash_register()
+
+    hash_register = create_sha256_hash_register()
+    for entry in entries_by_file_name.values():
+        hash_register.add_entry(entry)
+
+    return hash_register
+
+
+def write_sha256_hash_register(hash_register, hash_register_file_path, append=True):
+    """ Writes into hash register file all entries in the register's buffer in a single batch.
+        If append is False, the file is overwritten.
+    """
+
+    try:
+        with open(hash_register_file_path, "a" if append else "w", encoding='utf-8', newline='') as f:
+            writer = csv.writer(f, lineterminator=os.linesep)
+            writer.writerow(HASH_REGISTER_HEADER)
+            writer.writerows(hash_register.buffer)
     except OSError as e:
         logger.error(f"Hash file could not be created in {hash_register_file_path}. Program aborted.\n"
                      f"System error reported: {e}")
         exit(1)
 
 
-def register_sha256_hash_information(hash_register, generated_file_path, source_file_path):
-    """ Register the hash of the generated file source for tracking purposes. """
-
-    logger = initialize_logger()
+def register_sha256_hash_information(hash_register, generated_file_path, source_file_path, generated_file_hash=None):
+    """ Register the hash of the generated file source for tracking purposes.
+        The generated file's hash can be informed when already known (e.g., when computed while writing the file).
+    """
 
-    generated_file_hash = generate_sha256_hash(generated_file_path)
+    if generated_file_hash is None:
+        generated_file_hash = generate_sha256_hash(generated_file_path)
 
-    if generated_file_hash in hash_register["file_hash"].values:
+    if generated_file_hash in hash_register.entries:
         logger.debug(f"File {source_file_path} already registered in hash register file.")
     else:
-        source_file_hash = generate_sha256_hash(source_file_path)
-        entry = {'file_name': [generated_file_path],
-                 'file_hash': [generated_file_hash],
-                 'source_file_name': [source_file_path],
-                 'source_file_hash': [source_file_hash]}
-        hash_register = pd.concat([hash_register, pd.DataFrame.from_dict(entry)])
+        hash_register.add_entry([generated_file_path, generated_file_hash,
+                                 source_file_path, hash_register.get_source_hash(source_file_path)])
 
     logger.debug(f"New hash entry for {generated_file_hash} successfully created.")
     return hash_register
@@ -2,14 +2,18 @@
 
 import argparse
 
-from src import AUTOMATIC, COMPLETE
-from src.modules.tester.logger_config import initialize_logger
+from src import AUTOMATIC, COMPLETE, OUTPUT_BACKEND, CLASSES_OUTPUT_FORMAT, LOG_CONSOLE_LEVEL, LOG_FILE_LEVEL, \
+    LOG_JSON_RECORDS, ISOLATION_TIMEOUT, ISOLATION_MEMORY_LIMIT
+from src.modules.tester.output_backends import OUTPUT_BACKENDS
+from src.modules.tester.utils_serialization import CLASSES_OUTPUT_FORMATS
+from src.modules.tester.logger_config import get_logger, LOG_LEVELS
+
+logger = get_logger()
 
 
 def treat_arguments(software_acronym, software_name, software_version, software_url):
     """ Treats user's command line input arguments. """
 
-    logger = initialize_logger()
     logger.debug("Parsing user's command line input arguments...")
 
     about_message = software_acronym + " - version " + software_version
@@ -28,12 +32,88 @@ def treat_arguments(software_acronym, software_name, software_version, software_
     arguments_parser.add_argument("-b", "--build", action='store_true',
                                   help="Build test datasets' structure and files.")
 
+    arguments_parser.add_argument("--incremental", action='store_true',
+                                  help="Build only the datasets whose source files changed since the last build.")
+
     arguments_parser.add_argument("-r1", "--run1", action='store_true',
                                   help="Execute the TEST_1 for the built datasets.")
 
     arguments_parser.add_argument("-r2", "--run2", action='store_true',
                                   help="Execute the TEST_2 for the built datasets.")
 
+    arguments_parser.add_argument("--resume", action='store_true',
+                                  help="Resume an interrupted test run, skipping the executions it already completed.")
+
+    arguments_parser.add_argument("-j", "--jobs", type=int, default=1, action="store",
+                                  help="Number of worker processes used for building the datasets and for "
+                                       "executing the tests (default: 1).")
+
+    arguments_parser.add_argument("-s", "--seed", type=int, action="store",
+                                  help="Seed used for sampling the input classes of TEST_2. "
+                                       "A random seed is generated and saved if not informed.")
+
+    arguments_parser.add_argument("-o", "--output-backend", type=str, choices=OUTPUT_BACKENDS,
+                                  default=OUTPUT_BACKEND, action="store",
+                                  help="Backend for the outputs of every single execution of the tests: one file "
+                                       "per output (default), a SQLite database, or Parquet tables.")
+
+    arguments_parser.add_argument("--classes-format", type=str, choices=CLASSES_OUTPUT_FORMATS,
+                                  default=CLASSES_OUTPUT_FORMAT, action="store",
+                                  help="Format of the files with the classes' results of every execution (complete* "
+                                       "files): YAML (default) or JSON Lines.")
+
+    arguments_parser.add_argument("--no-graph-cache", action='store_true',
+                                  help="Always parse the Turtle files, without using the parsed graphs cache.")
+
+    arguments_parser.add_argument("--profile", action='store_true',
+                                  help="Save the wall and CPU times of every stage of the build or run, per dataset "
+                                       "and taxonomy, in an aggregate CSV file in the catalog folder.")
+
+    arguments_parser.add_argument("--cprofile", action='store_true',
+                                  help="Together with the profiling, save a cProfile dump per dataset in the folder "
+                                       "'profiles' of the catalog folder. Implies --profile.")
+
+    arguments_parser.add_argument("--memory", action='store_true',
+                                  help="Add the RSS before and after and the peak RSS of every execution of the tests "
+                                       "to the times files. With --isolate, only the Scior call is measured, in its "
+                                       "isolated process.")
+
+    arguments_parser.add_argument("--tracemalloc", type=int, default=0, metavar="N", action="store",
+                                  help="Together with the memory metrics, add the peak of the memory allocated by "
+                                       "Python and its N top allocation sites to the times files. Slows down the "
+                                       "executions. Implies --memory.")
+
+    arguments_parser.add_argument("--isolate", action='store_true',
+                                  help="Execute every Scior call of the tests in a supervised child process, which is "
+                                       "stopped if it exceeds the timeout or the memory limit. Stopped executions are "
+                                       "saved in the failures file and the run continues.")
+
+    arguments_parser.add_argument("--timeout", type=float, default=ISOLATION_TIMEOUT, metavar="SECONDS",
+                                  action="store",
+                                  help="Maximum wall time of every isolated Scior call (default: no limit). "
+                                       "Implies --isolate.")
+
+    arguments_parser.add_argument("--memory-limit", type=int, default=ISOLATION_MEMORY_LIMIT, metavar="MB",
+                                  action="store",
+                                  help="Maximum RSS of the process of every isolated Scior call (default: no limit). "
+                                       "Implies --isolate.")
+
+    arguments_parser.add_argument("--retry-quarantined", type=str, nargs="*", metavar="NAME", action="store",
+                                  help="Lift the quarantine of the named datasets and taxonomies (or of all "
+                                       "quarantined ones, if no names are informed), so that they are built and "
+                                       "tested again. They are quarantined again if they still fail.")
+
+    arguments_parser.add_argument("--console-log-level", type=str.upper, choices=LOG_LEVELS,
+                                  default=LOG_CONSOLE_LEVEL.upper(), action="store",
+                                  help="Minimum level of the messages printed in the console (default: INFO).")
+
+    arguments_parser.add_argument("--file-log-level", type=str.upper, choices=LOG_LEVELS,
+                                  default=LOG_FILE_LEVEL.upper(), action="store",
+                                  help="Minimum level of the messages saved in the log file (default: DEBUG).")
+
+    arguments_parser.add_argument("--json-log", action='store_true', default=LOG_JSON_RECORDS,
+                                  help="Save the log file's messages as compact JSON objects, one per line.")
+
     # Automation level
 
     automation_group = arguments_parser.add_mutually_exclusive_group()
@@ -76,7 +156,25 @@ def treat_arguments(software_acronym, software_name, software_version, software_
                              "run2": arguments.run2,
                              "is_automatic": arguments.automatic,
                              "is_complete": arguments.complete,
-                             "catalog_path": arguments.catalog_path}
+                             "catalog_path": arguments.catalog_path,
+                             "jobs": arguments.jobs,
+                             "seed": arguments.seed,
+                             "graph_cache": not arguments.no_graph_cache,
+                             "incremental": arguments.incremental,
+                             "output_backend": arguments.output_backend,
+                             "classes_format": arguments.classes_format,
+                             "resume": arguments.resume,
+                             "profile": arguments.profile or arguments.cprofile,
+                             "cprofile": arguments.cprofile,
+                             "memory": arguments.memory or (arguments.tracemalloc > 0),
+                             "tracemalloc": arguments.tracemalloc,
+                             "isolate": arguments.isolate or (arguments.timeout > 0) or (arguments.memory_limit > 0),
+                             "timeout": arguments.timeout,
+                             "memory_limit": arguments.memory_limit,
+                             "retry_quarantined": arguments.retry_quarantined,
+                             "console_log_level": arguments.console_log_level,
+                             "file_log_level": arguments.file_log_level,
+                             "json_log": arguments.json_log}
 
     logger.debug(f"Arguments Parsed. Obtained values are: {global_configurations}")
 
@@ -0,0 +1,155 @@
+""" Supervised execution of Scior calls in isolated processes.
+
+    When enabled, every Scior call is performed in a child process, started by fork (so its arguments, as the working
+    graph, are not copied), while the calling process supervises it. The child is killed when its wall time exceeds
+    the timeout or when its resident set size (RSS) exceeds the memory limit, and the call fails with an
+    IsolatedExecutionError describing the outcome (timeout, memory_limit, or crash, when the child dies without
+    returning a result). A call that raises an exception in the child raises it again in the calling process, so such
+    calls keep being treated as before (e.g., as inconsistencies).
+
+    The RSS of the child includes the memory shared with the calling process, so the memory limit must be higher than
+    the calling process' RSS.
+
+    When the memory metrics are enabled, they are measured in the child (as the supervisor only waits for its result)
+    and sent back with the call's result.
+"""
+import multiprocessing
+import time
+
+from contextlib import nullcontext
+
+from src import ISOLATION_POLLING_INTERVAL
+
+MEGABYTE = 1024 * 1024
+
+isolation_enabled = False
+execution_timeout = 0.0
+memory_limit = 0
+
+
+class ExecutionFailure(object):
+    """ Outcome of a Scior call stopped by its supervisor, with the measured time (in s) and peak RSS (in MB). """
+
+    def __init__(self, outcome, elapsed_time, peak_rss_mb, details):
+        self.outcome: str = outcome
+        self.elapsed_time: float = elapsed_time
+        self.peak_rss_mb: float = peak_rss_mb
+        self.details: str = details
+
+
+class IsolatedExecutionError(Exception):
+    """ Raised when an isolated Scior call is stopped or its process dies without returning a result. """
+
+    def __init__(self, failure):
+        super().__init__(f"{failure.outcome}: {failure.details}")
+        self.failure: ExecutionFailure = failure
+
+
+def configure_isolation(enabled, timeout=0.0, memory_limit_mb=0):
+    """ Enables or disables the isolation of the Scior calls, with their timeout (in s) and memory limit (in MB).
+        Non-positive values mean no limit. Must be called before the creation of worker processes, which inherit
+        the configuration. """
+
+    global isolation_enabled, execution_timeout, memory_limit
+
+    isolation_enabled = enabled
+    execution_timeout = timeout if enabled else 0.0
+    memory_limit = memory_limit_mb if enabled else 0
+
+
+def is_isolation_enabled() -> bool:
+    return isolation_enabled
+
+
+def run_supervised(function, *arguments, memory_metrics=None):
+    """ Returns function(*arguments), which is executed in a supervised child process if the isolation is enabled.
+        If the memory metrics are enabled, the metrics of the isolated call are added to memory_metrics (if informed).
+    """
+
+    if not isolation_enabled:
+        return function(*arguments)
+
+    import psutil
+    from src.modules.tester.memory_metrics import is_memory_metrics_enabled
+
+    context = multiprocessing.get_context("fork")
+    receiver, sender = context.Pipe(duplex=False)
+    child_process = context.Process(target=run_isolated_call,
+                                    args=(sender, function, arguments,
+                                          is_memory_metrics_enabled() and (memory_metrics is not None)),
+                                    daemon=True)
+
+    start = time.perf_counter()
+    child_process.start()
+    # Only the child keeps the sending end, so the receiver reaches its end if the child dies
+    sender.close()
+    monitored_process = psutil.Process(child_process.pid)
+    peak_rss = 0
+    failure_outcome = None
+    failure_details = ""
+
+    try:
+        while True:
+            if receiver.poll(ISOLATION_POLLING_INTERVAL):
+                try:
+                    is_successful, returned_value, call_memory_metrics = receiver.recv()
+                except EOFError:
+                    child_process.join()
+                    failure_outcome = "crash"
+                    failure_details = f"process exited with code {child_process.exitcode}"
+                break
+
+            try:
+                peak_rss = max(peak_rss, monitored_process.memory_info().rss)
+            except psutil.Error:
+                # The child is exiting, which is detected by the next poll
+                continue
+
+            elapsed_time = time.perf_counter() - start
+            if (memory_limit > 0) and (peak_rss > memory_limit * MEGABYTE):
+                failure_outcome = "memory_limit"
+                failure_details = f"RSS exceeded {memory_limit} MB"
+                break
+            if (execution_timeout > 0) and (elapsed_time > execution_timeout):
+                failure_outcome = "timeout"
+                failure_details = f"wall time exceeded {execution_timeout}s"
+                break
+    finally:
+        if child_process.is_alive():
+            child_process.kill()
+        child_process.join()
+        receiver.close()
+
+    if failure_outcome is not None:
+        raise IsolatedExecutionError(ExecutionFailure(failure_outcome, round(time.perf_counter() - start, 3),
+                                                      round(peak_rss / MEGABYTE, 3), failure_details))
+
+    if not is_successful:
+        raise RuntimeError(returned_value)
+
+    if memory_metrics is not None:
+        memory_metrics.update(call_memory_metrics)
+
+    return returned_value
+
+
+def run_isolated_call(connection, function, arguments, measure_memory_metrics):
+    """ Executed in the child process. Sends (True, returned value, memory metrics) or (False, error description,
+        memory metrics) to the supervisor. The memory metrics are empty if they are not measured.
+        Exceptions are sent as descriptions, as they may not be transferable. """
+
+    from src.modules.tester.memory_metrics import measure_execution_memory
+
+    call_memory_metrics = {}
+    try:
+        with measure_execution_memory() if measure_memory_metrics else nullcontext({}) as call_memory_metrics:
+            returned_value = function(*arguments)
+        call_result = (True, returned_value, call_memory_metrics)
+    except BaseException as error:
+        call_result = (False, f"{type(error).__name__}: {error}", call_memory_metrics)
+
+    try:
+        connection.send(call_result)
+    except Exception as error:
+        connection.send((False, f"The result could not be returned ({type(error).__name__}: {error}).", {}))
+    connection.close()
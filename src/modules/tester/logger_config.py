@@ -1,24 +1,59 @@
-""" Logging configurations. """
+""" Logging configurations.
 
+    All modules log through a single logger, acquired once per module (with get_logger) when the module is imported.
+    The logger's only handler puts the records in a queue, from which a background thread (a QueueListener) writes
+    them to the console and to the log file, so that logging does not block the executions. The queue is inherited by
+    the worker processes, whose records are also written by the main process' thread.
+"""
+
+import atexit
+import json
 import logging
+import logging.handlers
+import multiprocessing
 import os
 
-from src.modules.tester.utils_general import get_date_time
+from src import LOG_CONSOLE_LEVEL, LOG_FILE_LEVEL, LOG_JSON_RECORDS
+
+LOGGER_NAME = "Scior Tester"
+LOG_LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR"]
+
+log_listener = None
+log_listener_pid = None
+log_queue_handler = None
+
+
+class JsonFormatter(logging.Formatter):
+    """ Formats every record as a compact JSON object, in a single line. """
+
+    def format(self, record):
+        return json.dumps({"time": self.formatTime(record), "level": record.levelname,
+                           "message": record.getMessage(), "function": record.funcName,
+                           "file": record.filename, "process": record.process}, separators=(",", ":"))
+
+
+def get_logger():
+    """ Returns the Scior Tester Logger, whose records are only written after it is initialized. """
+
+    return logging.getLogger(LOGGER_NAME)
 
 
 def initialize_logger():
-    """ Initialize Scior Tester Logger. """
+    """ Initialize Scior Tester Logger. Its background writer is created only in the first call and is stopped at the
+        program's exit, after writing all pending records. """
+
+    global log_listener, log_listener_pid, log_queue_handler
 
-    # Create a custom logger
-    new_logger = logging.getLogger("Scior Tester")
-    new_logger.setLevel(logging.DEBUG)
+    new_logger = get_logger()
 
-    # Creates a new logger only if SciorTester does not exist
-    if not logging.getLogger("Scior Tester").hasHandlers():
+    # Creates a new writer only if SciorTester's writer does not exist
+    if log_listener is None:
+
+        # Imported here, as utils_general depends on the result writer, which depends on this module
+        from src.modules.tester.utils_general import get_date_time
 
         # Creating CONSOLE handler
         console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.INFO)
 
         # If directory "/log" does not exist, create it
         log_dir = "logs"
@@ -31,17 +66,47 @@ def initialize_logger():
 
         # Creating FILE handler
         file_handler = logging.FileHandler(os.path.join(log_dir, f"{get_date_time()}.log"))
-        file_handler.setLevel(logging.DEBUG)
 
-        # Create formatters and add it to handlers
-        console_format = logging.Formatter('%(levelname)s - %(message)s')
-        file_format = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s [func: %(funcName)s '
-                                        'in %(filename)s]')
-        console_handler.setFormatter(console_format)
-        file_handler.setFormatter(file_format)
+        # The queue is shared with the worker processes started by fork
+        log_queue = multiprocessing.Queue()
+        log_queue_handler = logging.handlers.QueueHandler(log_queue)
+        new_logger.addHandler(log_queue_handler)
+        log_listener = logging.handlers.QueueListener(log_queue, console_handler, file_handler,
+                                                      respect_handler_level=True)
+        log_listener_pid = os.getpid()
 
-        # Add handlers to the logger
-        new_logger.addHandler(console_handler)
-        new_logger.addHandler(file_handler)
+        configure_logger(LOG_CONSOLE_LEVEL, LOG_FILE_LEVEL, LOG_JSON_RECORDS)
+        log_listener.start()
+        atexit.register(stop_logger)
 
     return new_logger
+
+
+def configure_logger(console_level, file_level, json_records=False):
+    """ Sets the minimum levels of the records written to the console and to the log file, and whether the records
+        are written to the log file as JSON objects. Records below both levels are discarded before being queued. """
+
+    console_handler, file_handler = log_listener.handlers
+
+    console_handler.setLevel(console_level)
+    file_handler.setLevel(file_level)
+    get_logger().setLevel(min(console_handler.level, file_handler.level))
+
+    # Create formatters and add it to handlers
+    console_handler.setFormatter(logging.Formatter('%(levelname)s - %(message)s'))
+    if json_records:
+        file_handler.setFormatter(JsonFormatter())
+    else:
+        file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s [func: %(funcName)s '
+                                                    'in %(filename)s]'))
+
+
+def stop_logger():
+    """ Writes the pending records and stops the background writer. Only the process that created it stops it. """
+
+    global log_listener
+
+    if (log_listener is not None) and (log_listener_pid == os.getpid()):
+        get_logger().removeHandler(log_queue_handler)
+        log_listener.stop()
+        log_listener = None
@@ -0,0 +1,125 @@
+""" Per-execution memory metrics, saved together with Scior's times.
+
+    When enabled, the resident set size (RSS) of the process executing the tests is measured before and after each
+    execution, and a sampler thread keeps its peak during the execution. Optionally, tracemalloc is used for reporting
+    the peak of the memory allocated by Python and the source lines that allocated most of the memory still in use at
+    the end of the execution.
+
+    The metrics are added to the execution's time register, so they are saved as extra columns of the times files.
+
+    When the Scior calls are isolated (see the isolation module), only the Scior call is measured, inside its child
+    process, which sends the metrics back with the call's result. The RSS of the child includes the memory it shares
+    with the supervising process.
+"""
+import os
+import threading
+import tracemalloc
+
+from contextlib import contextmanager, nullcontext
+
+from src import MEMORY_SAMPLING_INTERVAL
+from src.modules.tester.isolation import is_isolation_enabled
+
+MEGABYTE = 1024 * 1024
+
+memory_metrics_enabled = False
+top_allocation_sites = 0
+
+
+class PeakRssSampler(threading.Thread):
+    """ Samples the RSS of the process until stopped, keeping its highest value. """
+
+    def __init__(self, process, sampling_interval):
+        super().__init__(daemon=True)
+        self.process = process
+        self.sampling_interval: float = sampling_interval
+        self.peak_rss: int = 0
+        self.stop_event: threading.Event = threading.Event()
+
+    def run(self):
+        while True:
+            self.peak_rss = max(self.peak_rss, self.process.memory_info().rss)
+            if self.stop_event.wait(self.sampling_interval):
+                break
+
+    def stop(self) -> int:
+        self.stop_event.set()
+        self.join()
+        return self.peak_rss
+
+
+def configure_memory_metrics(enabled, number_allocation_sites=0):
+    """ Enables or disables the memory metrics. If number_allocation_sites is positive, tracemalloc is also used and
+        the informed number of top allocation sites is reported. Must be called before the creation of worker
+        processes, which inherit the configuration. """
+
+    global memory_metrics_enabled, top_allocation_sites
+
+    memory_metrics_enabled = enabled
+    top_allocation_sites = number_allocation_sites if enabled else 0
+
+
+def is_memory_metrics_enabled() -> bool:
+    return memory_metrics_enabled
+
+
+def measure_memory():
+    """ Returns a context manager that yields a dictionary, which is filled with the memory metrics of the execution
+        performed inside it when the context is exited. The dictionary stays empty if the metrics are disabled.
+        If the Scior calls are isolated, nothing is measured here, and the dictionary must be filled with the metrics
+        of the isolated call (see isolation.run_supervised). """
+
+    if (not memory_metrics_enabled) or is_isolation_enabled():
+        return nullcontext({})
+
+    return measure_execution_memory()
+
+
+@contextmanager
+def measure_execution_memory():
+    import psutil
+
+    memory_metrics = {}
+    process = psutil.Process(os.getpid())
+
+    if top_allocation_sites:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        # Only the allocations performed during the execution are considered
+        tracemalloc.clear_traces()
+        tracemalloc.reset_peak()
+
+    rss_before = process.memory_info().rss
+    sampler = PeakRssSampler(process, MEMORY_SAMPLING_INTERVAL)
+    sampler.start()
+    try:
+        yield memory_metrics
+    finally:
+        peak_rss = sampler.stop()
+        rss_after = process.memory_info().rss
+
+        memory_metrics["rss_before_mb"] = round(rss_before / MEGABYTE, 3)
+        memory_metrics["rss_after_mb"] = round(rss_after / MEGABYTE, 3)
+        memory_metrics["rss_peak_mb"] = round(max(peak_rss, rss_before, rss_after) / MEGABYTE, 3)
+
+        if top_allocation_sites:
+            memory_metrics.update(get_tracemalloc_metrics())
+
+
+def get_tracemalloc_metrics():
+    """ Returns the peak of the memory traced during the execution and its top allocation sites, described as
+        'file:line size_in_MB'. Sites that did not allocate memory are reported as empty values. """
+
+    _, traced_peak = tracemalloc.get_traced_memory()
+    snapshot = tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+    statistics = snapshot.statistics("lineno")
+
+    tracemalloc_metrics = {"tracemalloc_peak_mb": round(traced_peak / MEGABYTE, 3)}
+    for site_number in range(top_allocation_sites):
+        site_description = ""
+        if site_number < len(statistics):
+            frame = statistics[site_number].traceback[0]
+            site_description = f"{frame.filename}:{frame.lineno} {statistics[site_number].size / MEGABYTE:.3f}"
+        tracemalloc_metrics[f"top_allocation_site_{site_number + 1:02d}"] = site_description
+
+    return tracemalloc_metrics
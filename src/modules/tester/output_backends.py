@@ -0,0 +1,229 @@
+""" Pluggable backends for the outputs generated for every single Scior execution.
+
+    With the default "files" backend, each execution generates its own files (e.g., complete*.yaml, simple*.csv,
+    and matrix*.csv). The other backends append the same data to a few tables per test run, in which every row is
+    identified by the taxonomy name, the percentage (only for TEST_2), and the execution number:
+    - "sqlite": a single SQLite database file, shared by all worker processes (in WAL mode).
+    - "parquet": one folder per table, in which every process writes its own Parquet part files.
+      Requires the optional pyarrow package.
+"""
+import os
+import shutil
+import sqlite3
+
+from multiprocessing.util import Finalize
+
+from src.modules.tester.logger_config import get_logger
+
+logger = get_logger()
+
+OUTPUT_BACKENDS = ["files", "sqlite", "parquet"]
+
+# Maximum number of rows of a table kept in memory before writing a Parquet part file
+PARQUET_PART_ROWS = 100000
+
+KEY_COLUMNS = [("taxonomy_name", "string"), ("percentage", "int"), ("execution_number", "int")]
+
+OUTPUT_TABLES = {
+    "classes": KEY_COLUMNS + [("class_name", "string"), ("input", "bool"), ("is_type", "string"),
+                              ("can_type", "string"), ("not_type", "string"), ("is_incomplete", "bool"),
+                              ("detected_in", "string")],
+    "results": KEY_COLUMNS + [("class_name", "string"), ("class_original_classification", "string"),
+                              ("classification_final_list", "string")],
+    "matrix": KEY_COLUMNS + [("row_number", "int"), ("column_number", "int"), ("value", "string")],
+    "times": KEY_COLUMNS + [("time_name", "string"), ("time_value", "float")],
+    # The remaining columns of the statistics table are the ones of the statistics csv files' header
+    "statistics": KEY_COLUMNS
+}
+
+SQLITE_TYPES = {"string": "TEXT", "int": "INTEGER", "float": "REAL", "bool": "INTEGER"}
+
+# Writers opened by the processes, indexed by the process id and the backend's location.
+# Forked worker processes inherit the entries of their parent, which are ignored.
+open_writers = {}
+finalized_processes = set()
+
+
+class OutputBackend(object):
+    """ Identifies the backend and location of a run's outputs. Only these attributes are sent to worker processes,
+        which open their own writers when they first append rows. """
+
+    def __init__(self, backend_name, location):
+        self.backend_name: str = backend_name
+        self.location: str = location
+
+    def append_rows(self, table_name, output_key, rows, columns=None):
+        """ Appends the rows (lists of values) to the table, prefixing them with the output key (a tuple with the
+            taxonomy name, the percentage, and the execution number). The columns are only informed for tables whose
+            columns are not fixed, as the statistics table. """
+
+        if columns is None:
+            columns = OUTPUT_TABLES[table_name]
+        else:
+            columns = OUTPUT_TABLES[table_name] + columns
+
+        get_output_writer(self).append_rows(table_name, columns, [list(output_key) + list(row) for row in rows])
+
+
+class SQLiteOutputWriter(object):
+    """ Appends rows to the tables of a SQLite database. Each process uses its own connection. """
+
+    def __init__(self, location):
+        self.connection = sqlite3.connect(location, timeout=600)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.created_tables = set()
+
+    def create_table(self, table_name, columns):
+        columns_definitions = ", ".join(f'"{name}" {SQLITE_TYPES[column_type]}' for (name, column_type) in columns)
+        key_names = ", ".join(name for (name, _) in KEY_COLUMNS)
+        with self.connection:
+            self.connection.execute(f'CREATE TABLE IF NOT EXISTS "{table_name}" ({columns_definitions})')
+            self.connection.execute(f'CREATE INDEX IF NOT EXISTS "{table_name}_key" ON "{table_name}" ({key_names})')
+        self.created_tables.add(table_name)
+
+    def append_rows(self, table_name, columns, rows):
+        if table_name not in self.created_tables:
+            self.create_table(table_name, columns)
+
+        placeholders = ", ".join("?" for _ in columns)
+        with self.connection:
+            self.connection.executemany(f'INSERT INTO "{table_name}" VALUES ({placeholders})', rows)
+
+    def close(self):
+        self.connection.close()
+
+
+class ParquetOutputWriter(object):
+    """ Buffers rows in memory and writes them as Parquet part files, whose names contain the process id. """
+
+    def __init__(self, location):
+        self.location: str = location
+        self.buffers: dict = {}
+        self.columns: dict = {}
+        self.parts_number: int = 0
+
+    def append_rows(self, table_name, columns, rows):
+        if table_name not in self.buffers:
+            self.buffers[table_name] = []
+            self.columns[table_name] = columns
+
+        self.buffers[table_name].extend(rows)
+
+        if len(self.buffers[table_name]) >= PARQUET_PART_ROWS:
+            self.write_part(table_name)
+
+    def write_part(self, table_name):
+        columns = self.columns[table_name]
+        rows = self.buffers[table_name]
+        if not rows:
+            return
+
+        pyarrow = import_pyarrow()
+        arrow_types = {"string": pyarrow.string(), "int": pyarrow.int64(), "float": pyarrow.float64(),
+                       "bool": pyarrow.bool_()}
+        arrays = [pyarrow.array([row[idx] for row in rows], type=arrow_types[column_type])
+                  for idx, (_, column_type) in enumerate(columns)]
+        table = pyarrow.Table.from_arrays(arrays, names=[name for (name, _) in columns])
+
+        table_folder = os.path.join(self.location, table_name)
+        os.makedirs(table_folder, exist_ok=True)
+        self.parts_number += 1
+        pyarrow.parquet.write_table(table, os.path.join(table_folder,
+                                                        f"part-{os.getpid()}-{self.parts_number:05d}.parquet"))
+        rows.clear()
+
+    def close(self):
+        for table_name in self.buffers:
+            self.write_part(table_name)
+
+
+def import_pyarrow():
+    """ Returns the pyarrow package, which is imported only when the parquet backend is used (as importing it is
+        slow), or None if it is not installed. """
+
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        return None
+
+    return pyarrow
+
+
+def create_output_backend(backend_name, catalog_folder, test_name, clear_if_exists=True):
+    """ Returns the OutputBackend for a test run or None when the outputs are saved with the default files backend.
+        The outputs of a previous run with the same name are removed if clear_if_exists is True.
+    """
+
+    if backend_name == "files":
+        return None
+
+    if backend_name == "parquet" and import_pyarrow() is None:
+        logger.error("The parquet output backend requires the pyarrow package, which is not installed. "
+                     "Program aborted.")
+        exit(1)
+
+    location = os.path.join(catalog_folder, f"results_{test_name}" + (".sqlite" if backend_name == "sqlite" else ""))
+
+    if clear_if_exists and os.path.exists(location):
+        if os.path.isdir(location):
+            shutil.rmtree(location)
+        else:
+            for file_name in [location, location + "-wal", location + "-shm"]:
+                if os.path.exists(file_name):
+                    os.remove(file_name)
+
+    logger.info(f"Executions' outputs are saved with the {backend_name} backend in: {location}")
+
+    return OutputBackend(backend_name, location)
+
+
+def get_output_writer(output_backend):
+    """ Returns the writer of the current process for the backend, opening it if needed.
+        Writers are closed at the exit of the process, including worker processes. """
+
+    writer_key = (os.getpid(), output_backend.location)
+
+    if writer_key not in open_writers:
+        if output_backend.backend_name == "sqlite":
+            open_writers[writer_key] = SQLiteOutputWriter(output_backend.location)
+        else:
+            open_writers[writer_key] = ParquetOutputWriter(output_backend.location)
+        if os.getpid() not in finalized_processes:
+            finalized_processes.add(os.getpid())
+            Finalize(None, close_output_writers, exitpriority=10)
+
+    return open_writers[writer_key]
+
+
+def close_output_writers():
+    """ Writes all buffered rows and closes the writers opened by the current process. """
+
+    for writer_key in list(open_writers):
+        if writer_key[0] == os.getpid():
+            open_writers.pop(writer_key).close()
+
+
+def reconcile_output_backend(output_backend, checkpoint_journal):
+    """ Removes from the SQLite backend's tables the rows of units that are not completed according to the checkpoint
+        journal (i.e., that were being executed when the run was interrupted), as these units are executed again when
+        the test run is resumed. """
+
+    key_names = ", ".join(name for (name, _) in KEY_COLUMNS)
+
+    if not os.path.exists(output_backend.location):
+        return
+
+    connection = sqlite3.connect(output_backend.location, timeout=600)
+    with connection:
+        tables_names = [row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type='table'")]
+        for table_name in tables_names:
+            keys = connection.execute(f'SELECT DISTINCT {key_names} FROM "{table_name}"').fetchall()
+            not_completed_keys = [key for key in keys if not checkpoint_journal.is_completed(*key)]
+            if not_completed_keys:
+                connection.executemany(f'DELETE FROM "{table_name}" '
+                                       f'WHERE taxonomy_name = ? AND percentage IS ? AND execution_number = ?',
+                                       not_completed_keys)
+                logger.info(f"Rows of {len(not_completed_keys)} not completed executions removed from table "
+                            f"{table_name} of {output_backend.location}.")
+    connection.close()
@@ -0,0 +1,156 @@
+""" Stage-level profiling of the build and run modes.
+
+    When enabled, the wall and CPU times of every stage (e.g., parse, Scior call, result writing) are accumulated per
+    dataset and taxonomy. Stages can be nested, and the time of a stage never includes the time of the stages nested
+    in it, so the times of all stages add up to the profiled total. Worker processes return their records with their
+    results, which are merged into the main process' records and saved in a single aggregate CSV file.
+
+    When disabled, profile_stage returns a shared context manager that does nothing.
+"""
+import cProfile
+import csv
+import os
+import time
+
+from contextlib import contextmanager, nullcontext
+
+PROFILE_HEADER = ["dataset_name", "taxonomy_name", "stage", "calls", "wall_time", "cpu_time"]
+
+NO_PROFILING = nullcontext()
+
+profiling_enabled = False
+cprofile_folder = None
+
+# Records of the current process, indexed by (dataset_name, taxonomy_name, stage), with [calls, wall, cpu] values.
+# Forked worker processes inherit the records of their parent, which are discarded.
+profile_records = {}
+profile_records_pid = os.getpid()
+profiling_context = ("", "")
+# Times of the stages nested in each of the active stages
+nested_stages_times = []
+cprofile_profilers = {}
+
+
+def configure_profiling(enabled, cprofile_dumps_folder=None):
+    """ Enables or disables the profiling. If a folder is informed, a cProfile dump is also saved per dataset.
+        Must be called before the creation of worker processes, which inherit the configuration. """
+
+    global profiling_enabled, cprofile_folder
+
+    profiling_enabled = enabled
+    cprofile_folder = cprofile_dumps_folder if enabled else None
+
+    if cprofile_folder:
+        os.makedirs(cprofile_folder, exist_ok=True)
+
+
+def is_profiling_enabled() -> bool:
+    return profiling_enabled
+
+
+def set_profiling_context(dataset_name, taxonomy_name=""):
+    """ Sets the dataset and taxonomy to which the next stages' times are attributed. """
+
+    global profiling_context
+
+    if profiling_enabled:
+        profiling_context = (dataset_name, taxonomy_name)
+
+
+def profile_stage(stage_name):
+    """ Returns a context manager that measures the stage executed inside it. """
+
+    if not profiling_enabled:
+        return NO_PROFILING
+
+    return measure_stage(stage_name)
+
+
+@contextmanager
+def measure_stage(stage_name):
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    nested_stages_times.append([0.0, 0.0])
+    try:
+        yield
+    finally:
+        wall_time = time.perf_counter() - wall_start
+        cpu_time = time.process_time() - cpu_start
+        nested_wall_time, nested_cpu_time = nested_stages_times.pop()
+        if nested_stages_times:
+            nested_stages_times[-1][0] += wall_time
+            nested_stages_times[-1][1] += cpu_time
+
+        record = get_profile_records().setdefault(profiling_context + (stage_name,), [0, 0.0, 0.0])
+        record[0] += 1
+        record[1] += wall_time - nested_wall_time
+        record[2] += cpu_time - nested_cpu_time
+
+
+def profile_dataset(file_prefix, dataset_name):
+    """ Returns a context manager in which the dataset's cProfile profiler is enabled, if cProfile dumps were
+        requested. The accumulated statistics of the dataset are saved in the file {file_prefix}_{dataset_name}.prof
+        whenever the context is exited. """
+
+    if cprofile_folder is None:
+        return NO_PROFILING
+
+    return run_cprofile(os.path.join(cprofile_folder, f"{file_prefix}_{dataset_name}.prof"))
+
+
+@contextmanager
+def run_cprofile(dump_file_name):
+    if dump_file_name not in cprofile_profilers:
+        cprofile_profilers[dump_file_name] = cProfile.Profile()
+
+    profiler = cprofile_profilers[dump_file_name]
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.dump_stats(dump_file_name)
+
+
+def get_profile_records():
+    """ Returns the records of the current process. """
+
+    global profile_records_pid
+
+    if profile_records_pid != os.getpid():
+        profile_records.clear()
+        profile_records_pid = os.getpid()
+
+    return profile_records
+
+
+def collect_profile_records():
+    """ Returns the records of the current process as rows and clears them. Called by functions that may be executed
+        in worker processes, which return the rows to the main process. """
+
+    rows = [list(record_key) + record_values for (record_key, record_values) in get_profile_records().items()]
+    profile_records.clear()
+
+    return rows
+
+
+def merge_profile_records(rows):
+    """ Adds the rows returned by collect_profile_records to the records of the current process. """
+
+    for row in rows:
+        record = get_profile_records().setdefault(tuple(row[:3]), [0, 0.0, 0.0])
+        record[0] += row[3]
+        record[1] += row[4]
+        record[2] += row[5]
+
+
+def save_profile_records(file_name):
+    """ Saves the records of the current process in the aggregate CSV file, with one row per dataset, taxonomy, and
+        stage, and clears them. """
+
+    rows = collect_profile_records()
+
+    with open(file_name, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(PROFILE_HEADER)
+        writer.writerows(row[:4] + [f"{row[4]:.6f}", f"{row[5]:.6f}"] for row in rows)
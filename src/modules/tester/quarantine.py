@@ -0,0 +1,103 @@
+""" Persisted quarantine of the datasets and taxonomies that are too slow or that fail.
+
+    The quarantine file (QUARANTINE_FILE_NAME, in the internal catalog folder) complements the hand-maintained
+    EXCEPTIONS_LIST. Entries are added automatically when a dataset's build or a taxonomy's executions fail or
+    exceed their time budgets (QUARANTINE_BUILD_TIME_BUDGET and QUARANTINE_RUN_TIME_BUDGET, in seconds, where 0 means
+    no budget), with the reason and the measured time. The build skips quarantined datasets and the test runs skip
+    quarantined datasets and taxonomies, before any work is done on them.
+
+    An entry without a taxonomy name quarantines the whole dataset. Quarantined entries are retried by lifting their
+    quarantine (argument --retry-quarantined), after which they are quarantined again if they still fail.
+"""
+import csv
+import os
+import shutil
+import tempfile
+
+from src import QUARANTINE_FILE_NAME
+from src.modules.tester.logger_config import get_logger
+from src.modules.tester.utils_general import get_date_time
+
+logger = get_logger()
+
+QUARANTINE_HEADER = ["dataset_name", "taxonomy_name", "stage", "reason", "measured_time", "details", "date"]
+
+
+class Quarantine(object):
+    """ Entries of the quarantine file, indexed by (dataset_name, taxonomy_name). Every change is saved at once. """
+
+    def __init__(self, file_name):
+        self.file_name: str = file_name
+        self.entries: dict = {}
+
+        if os.path.exists(file_name):
+            with open(file_name, 'r', newline='', encoding='utf-8') as f:
+                for row in list(csv.reader(f))[1:]:
+                    if row:
+                        self.entries[(row[0], row[1])] = row
+
+    def is_quarantined(self, dataset_name, taxonomy_name="") -> bool:
+        """ Verifies if the dataset or (if informed) the taxonomy of the dataset is quarantined. """
+
+        return ((dataset_name, "") in self.entries) or \
+            (bool(taxonomy_name) and ((dataset_name, taxonomy_name) in self.entries))
+
+    def add_entry(self, dataset_name, taxonomy_name, stage, reason, measured_time, details):
+        # Kept in a single line, as error messages (e.g., parsing errors) may span several lines
+        details = " ".join(details.split())
+        logger.warning(f"{taxonomy_name or dataset_name} quarantined during {stage} ({reason}: {details}). "
+                       f"It is skipped until it is retried.")
+        self.entries[(dataset_name, taxonomy_name)] = [dataset_name, taxonomy_name, stage, reason,
+                                                       f"{measured_time:.3f}", details, get_date_time()]
+        self.save()
+
+    def remove_entries(self, names):
+        """ Removes the entries whose dataset or taxonomy name is in names or, if names is empty, all entries.
+            Returns the removed entries. """
+
+        removed_entries = [entry_key for entry_key in self.entries
+                           if (not names) or (entry_key[0] in names) or (entry_key[1] in names)]
+        for entry_key in removed_entries:
+            del self.entries[entry_key]
+        self.save()
+
+        return removed_entries
+
+    def save(self):
+        # Written in a temporary file and then renamed, so that an interruption does not leave an invalid file
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=os.path.dirname(self.file_name))
+        with os.fdopen(file_descriptor, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(QUARANTINE_HEADER)
+            writer.writerows(self.entries.values())
+        if os.path.exists(self.file_name):
+            shutil.copymode(self.file_name, temporary_path)
+        os.replace(temporary_path, self.file_name)
+
+
+def open_quarantine(internal_catalog_folder) -> Quarantine:
+    return Quarantine(os.path.join(internal_catalog_folder, QUARANTINE_FILE_NAME))
+
+
+def lift_quarantine(internal_catalog_folder, names):
+    """ Removes from the quarantine file the entries of the named datasets and taxonomies (or all entries, if no
+        names are informed), so that they are built and tested again. """
+
+    if not os.path.exists(os.path.join(internal_catalog_folder, QUARANTINE_FILE_NAME)):
+        logger.info("There are no quarantined datasets or taxonomies to be retried.\n")
+        return
+
+    for (dataset_name, taxonomy_name) in open_quarantine(internal_catalog_folder).remove_entries(names):
+        logger.info(f"Quarantine lifted for retrying {taxonomy_name or dataset_name}.")
+
+
+def check_quarantine_criteria(quarantine, dataset_name, taxonomy_name, stage, measured_time, time_budget,
+                              failure_details=None):
+    """ Quarantines the dataset or taxonomy if it failed (i.e., if failure details are informed) or if its measured
+        time (in seconds) exceeds the time budget. A non-positive budget is never exceeded. """
+
+    if failure_details:
+        quarantine.add_entry(dataset_name, taxonomy_name, stage, "failure", measured_time, failure_details)
+    elif (time_budget > 0) and (measured_time > time_budget):
+        quarantine.add_entry(dataset_name, taxonomy_name, stage, "time_budget", measured_time,
+                             f"{measured_time:.3f}s exceeded the budget of {time_budget}s")
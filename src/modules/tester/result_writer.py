@@ -0,0 +1,167 @@
+""" Buffered writing of the CSV result files that receive one row per execution.
+
+    While a result writer session is active (e.g., during the executions of a taxonomy), the files written with
+    write_csv_row and write_dictionary are kept open and their rows are buffered. Rows are written to the files when
+    the buffer size or the flush interval is exceeded and when the session is closed.
+
+    Only complete rows are ever written. Hence, a killed run loses at most the rows still in the buffer and never
+    leaves a partial row at the end of a file. A partial last row left by any other cause is removed when the file is
+    opened again.
+"""
+import atexit
+import csv
+import os
+import time
+
+from contextlib import contextmanager
+
+from src import RESULT_WRITER_BUFFER_ROWS, RESULT_WRITER_FLUSH_INTERVAL
+from src.modules.tester.logger_config import get_logger
+
+logger = get_logger()
+
+# Maximum number of files kept open by a session (e.g., TEST_2 creates times and statistics files per execution)
+MAXIMUM_OPEN_FILES = 64
+
+active_session = None
+
+
+class ResultWriterSession(object):
+    """ Keeps the handles of the written files open and buffers their rows. """
+
+    def __init__(self, buffer_rows=RESULT_WRITER_BUFFER_ROWS, flush_interval=RESULT_WRITER_FLUSH_INTERVAL):
+        self.buffer_rows: int = buffer_rows
+        self.flush_interval: float = flush_interval
+        # Sessions are bound to the process that opened them, as forked worker processes inherit this object
+        self.pid: int = os.getpid()
+
+        self.files: dict = {}
+        self.writers: dict = {}
+        self.buffers: dict = {}
+        # Files whose rows are only written after the rows of all other files (e.g., a checkpoint journal)
+        self.flush_last_files: set = set()
+        self.buffered_rows: int = 0
+        self.last_flush: float = time.monotonic()
+
+    def open_file(self, file_name, header_row):
+        """ Opens the file for appending, writing its header if it does not exist or is empty. """
+
+        if len(self.files) >= MAXIMUM_OPEN_FILES:
+            self.close()
+
+        repair_torn_tail(file_name)
+        is_new_file = (not os.path.exists(file_name)) or (os.path.getsize(file_name) == 0)
+
+        self.files[file_name] = open(file_name, 'a', newline='', encoding='utf-8')
+        self.writers[file_name] = csv.writer(self.files[file_name])
+        self.buffers[file_name] = [header_row] if is_new_file else []
+
+    def write_row(self, file_name, header_row, row, flush_last=False):
+        if file_name not in self.files:
+            self.open_file(file_name, header_row)
+        if flush_last:
+            self.flush_last_files.add(file_name)
+
+        self.buffers[file_name].append(row)
+        self.buffered_rows += 1
+
+        if (self.buffered_rows >= self.buffer_rows) or \
+                (time.monotonic() - self.last_flush >= self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        """ Writes all buffered rows into their files. """
+
+        files_order = [file_name for file_name in self.buffers if file_name not in self.flush_last_files] + \
+            [file_name for file_name in self.buffers if file_name in self.flush_last_files]
+
+        for file_name in files_order:
+            rows = self.buffers[file_name]
+            if rows:
+                self.writers[file_name].writerows(rows)
+                self.files[file_name].flush()
+                rows.clear()
+
+        self.buffered_rows = 0
+        self.last_flush = time.monotonic()
+
+    def close(self):
+        self.flush()
+
+        for file in self.files.values():
+            file.close()
+
+        self.files.clear()
+        self.writers.clear()
+        self.buffers.clear()
+        self.flush_last_files.clear()
+
+
+def repair_torn_tail(file_name):
+    """ Removes a partially written last line of a file (i.e., a last line without its line terminator). """
+
+    if (not os.path.exists(file_name)) or (os.path.getsize(file_name) == 0):
+        return
+
+    with open(file_name, 'rb+') as f:
+        f.seek(-1, os.SEEK_END)
+        if f.read(1) == b"\n":
+            return
+
+        # Searching backwards, block by block, for the end of the last complete line
+        position = f.tell()
+        while position > 0:
+            block_start = max(0, position - 4096)
+            f.seek(block_start)
+            last_line_end = f.read(position - block_start).rfind(b"\n")
+            if last_line_end >= 0:
+                position = block_start + last_line_end + 1
+                break
+            position = block_start
+
+        f.truncate(position)
+
+    logger.warning(f"Partially written last line removed from file {file_name}.")
+
+
+def get_active_result_writer():
+    """ Returns the result writer session active in the current process or None if there is no active session. """
+
+    if (active_session is not None) and (active_session.pid == os.getpid()):
+        return active_session
+
+    return None
+
+
+def open_result_writer_session():
+    global active_session
+
+    close_result_writer_session()
+    active_session = ResultWriterSession()
+
+    return active_session
+
+
+def close_result_writer_session():
+    """ Flushes and closes the active session. Called at the end of a taxonomy's run and at the program's exit. """
+
+    global active_session
+
+    if get_active_result_writer() is not None:
+        active_session.close()
+
+    active_session = None
+
+
+@contextmanager
+def result_writer_session():
+    """ Context manager for a result writer session. The buffered rows are flushed even if an exception occurs. """
+
+    open_result_writer_session()
+    try:
+        yield active_session
+    finally:
+        close_result_writer_session()
+
+
+atexit.register(close_result_writer_session)
@@ -0,0 +1,153 @@
+""" Size-aware scheduling of the executions of a test run across the worker processes.
+
+    The time of every execution is estimated from the number of classes of its taxonomy, as
+    SCHEDULER_EXECUTION_OVERHEAD + SCHEDULER_CLASS_TIME * number_classes ** SCHEDULER_COST_EXPONENT (in seconds).
+    The executions are dispatched to the worker processes in the longest processing time first (LPT) order, i.e.,
+    the executions of the largest taxonomies first, so that no large taxonomy is left to the end of the run while the
+    other workers are idle. Consecutive executions whose estimated times are short (e.g., of tiny taxonomies) are
+    grouped in batches of about SCHEDULER_BATCH_TIME seconds, which are executed by a worker as a single task.
+
+    The dispatch order only affects when the executions are performed. Their results are always recorded in the
+    taxonomies' order, so the generated files do not depend on the schedule.
+"""
+import csv
+import heapq
+
+from src import SCHEDULER_EXECUTION_OVERHEAD, SCHEDULER_CLASS_TIME, SCHEDULER_COST_EXPONENT, SCHEDULER_BATCH_TIME
+
+SCHEDULE_HEADER = ["dispatch_order", "taxonomy_name", "dataset_name", "number_classes", "pending_executions",
+                   "tasks", "estimated_execution_time", "estimated_start", "estimated_finish"]
+
+
+class ScheduledTaxonomy(object):
+    """ Pending executions of a taxonomy in a test run, each one represented by the arguments of the function that
+        performs it, and their estimated times (in seconds, since the start of the executions). """
+
+    def __init__(self, taxonomy_name, dataset_name, number_classes, executions_arguments):
+        self.taxonomy_name: str = taxonomy_name
+        self.dataset_name: str = dataset_name
+        self.number_classes: int = number_classes
+        self.executions_arguments: list = executions_arguments
+        self.execution_time: float = estimate_execution_time(number_classes)
+        self.number_tasks: int = 0
+        self.estimated_start: float = 0.0
+        self.estimated_finish: float = 0.0
+        # Future of the task that performs each execution and the execution's position in the task
+        self.executions_futures: list = []
+        # Measured while the executions' results are recorded
+        self.measured_time: float = 0.0
+        self.failures: list = []
+
+
+def estimate_execution_time(number_classes) -> float:
+    """ Returns the estimated time (in seconds) of a single execution on a taxonomy with the number of classes. """
+
+    return SCHEDULER_EXECUTION_OVERHEAD + SCHEDULER_CLASS_TIME * number_classes ** SCHEDULER_COST_EXPONENT
+
+
+def create_schedule(scheduled_taxonomies, jobs):
+    """ Returns the tasks to be dispatched to the workers, in dispatch order. Every task is a list of
+        (scheduled_taxonomy, execution_position) pairs. The estimated start and finish times of the taxonomies are
+        calculated by simulating the dispatch of the tasks to the informed number of workers.
+        A single job executes the taxonomies in their order, one execution at a time. """
+
+    if jobs <= 1:
+        dispatch_order = list(scheduled_taxonomies)
+        batch_time = 0.0
+    else:
+        # Largest first. Python's sort is stable, so taxonomies of the same size keep their order.
+        dispatch_order = sorted(scheduled_taxonomies, key=lambda scheduled_taxonomy: -scheduled_taxonomy.execution_time)
+        batch_time = SCHEDULER_BATCH_TIME
+
+    tasks = []
+    current_batch = []
+    current_batch_time = 0.0
+    for scheduled_taxonomy in dispatch_order:
+        for execution_position in range(len(scheduled_taxonomy.executions_arguments)):
+            current_batch.append((scheduled_taxonomy, execution_position))
+            current_batch_time += scheduled_taxonomy.execution_time
+            if current_batch_time >= batch_time:
+                tasks.append(current_batch)
+                current_batch = []
+                current_batch_time = 0.0
+    if current_batch:
+        tasks.append(current_batch)
+
+    estimate_schedule_times(tasks, max(jobs, 1))
+
+    return tasks
+
+
+def estimate_schedule_times(tasks, number_workers):
+    """ Sets the estimated start and finish times of the taxonomies, considering that every task is executed by the
+        first worker to become idle. """
+
+    started_taxonomies = set()
+    workers_idle_times = [0.0] * number_workers
+
+    for task in tasks:
+        task_start = heapq.heappop(workers_idle_times)
+        task_finish = task_start
+        for (scheduled_taxonomy, _) in task:
+            if id(scheduled_taxonomy) not in started_taxonomies:
+                started_taxonomies.add(id(scheduled_taxonomy))
+                scheduled_taxonomy.estimated_start = task_finish
+            task_finish += scheduled_taxonomy.execution_time
+            scheduled_taxonomy.estimated_finish = max(scheduled_taxonomy.estimated_finish, task_finish)
+        for scheduled_taxonomy in {id(scheduled_taxonomy): scheduled_taxonomy
+                                   for (scheduled_taxonomy, _) in task}.values():
+            scheduled_taxonomy.number_tasks += 1
+        heapq.heappush(workers_idle_times, task_finish)
+
+
+def get_estimated_makespan(scheduled_taxonomies) -> float:
+    """ Returns the estimated time (in seconds) for performing all scheduled executions. """
+
+    return max([scheduled_taxonomy.estimated_finish for scheduled_taxonomy in scheduled_taxonomies], default=0.0)
+
+
+def save_schedule(tasks, file_name):
+    """ Saves the scheduled taxonomies, in dispatch order, with their estimated times in the CSV file. """
+
+    dispatch_order = list({id(scheduled_taxonomy): scheduled_taxonomy
+                           for task in tasks for (scheduled_taxonomy, _) in task}.values())
+
+    with open(file_name, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(SCHEDULE_HEADER)
+        for (position, scheduled_taxonomy) in enumerate(dispatch_order, start=1):
+            writer.writerow([position, scheduled_taxonomy.taxonomy_name, scheduled_taxonomy.dataset_name,
+                             scheduled_taxonomy.number_classes, len(scheduled_taxonomy.executions_arguments),
+                             scheduled_taxonomy.number_tasks, f"{scheduled_taxonomy.execution_time:.3f}",
+                             f"{scheduled_taxonomy.estimated_start:.3f}", f"{scheduled_taxonomy.estimated_finish:.3f}"])
+
+
+def execute_batch(function, executions_arguments):
+    """ Performs a task (i.e., a batch of executions) in a worker process and returns the executions' results. """
+
+    return [function(*execution_arguments) for execution_arguments in executions_arguments]
+
+
+def dispatch_schedule(process_pool, function, tasks):
+    """ Submits the tasks to the process pool, in dispatch order, and keeps the future of every execution.
+        If process_pool is None, nothing is submitted and the executions are performed when their results are read. """
+
+    if process_pool is None:
+        return
+
+    for task in tasks:
+        future = process_pool.submit(execute_batch, function,
+                                     [scheduled_taxonomy.executions_arguments[execution_position]
+                                      for (scheduled_taxonomy, execution_position) in task])
+        for (task_position, (scheduled_taxonomy, _)) in enumerate(task):
+            scheduled_taxonomy.executions_futures.append((future, task_position))
+
+
+def get_scheduled_results(scheduled_taxonomy, function):
+    """ Returns an iterator over the results of the taxonomy's executions, in execution order. Waits for the results
+        of the dispatched executions or, if they were not dispatched, performs them in the current process. """
+
+    if not scheduled_taxonomy.executions_futures:
+        return (function(*execution_arguments) for execution_arguments in scheduled_taxonomy.executions_arguments)
+
+    return (future.result()[task_position] for (future, task_position) in scheduled_taxonomy.executions_futures)
@@ -4,6 +4,8 @@ import csv
 
 from datetime import datetime
 
+from src.modules.tester.result_writer import get_active_result_writer
+
 
 def remove_duplicates(input_list):
     """ Remove duplicated elements from a list. """
@@ -27,6 +29,14 @@ def get_date_time():
 
 
 def write_csv_row(file_name, header_row, row):
+    """ Appends the row to the CSV file, creating it with the header row if it does not exist.
+        If a result writer session is active, the row is buffered by it. """
+
+    result_writer = get_active_result_writer()
+    if result_writer is not None:
+        result_writer.write_row(file_name, header_row, row)
+        return
+
     if os.path.exists(file_name):
         with open(file_name, 'a', newline='', encoding='utf-8') as f:
             writer = csv.writer(f)
@@ -39,6 +49,14 @@ def write_csv_row(file_name, header_row, row):
 
 
 def write_dictionary(file_name, keys, register):
+    """ Appends the register to the CSV file, creating it with the keys as header if it does not exist.
+        If a result writer session is active, the register is buffered by it. """
+
+    result_writer = get_active_result_writer()
+    if result_writer is not None:
+        result_writer.write_row(file_name, keys, [register.get(key, "") for key in keys])
+        return
+
     if os.path.exists(file_name):
         with open(file_name, 'a', newline='', encoding='utf-8') as f:
             writer = csv.DictWriter(f, fieldnames=keys)
@@ -1,9 +1,11 @@
 """ Auxiliary functions for extending and complementing RDFLib's graph functions """
-from rdflib import RDFS, URIRef, RDF, OWL
+from rdflib import RDFS, URIRef, RDF, OWL, BNode
 
-from src.modules.tester.logger_config import initialize_logger
+from src.modules.tester.logger_config import get_logger
 from src.modules.tester.utils_general import remove_duplicates, lists_subtraction
 
+logger = get_logger()
+
 
 def get_superclasses(graph, all_classes, element: str):
     """ Returns a list of all direct superclasses of the given element of a graph.
@@ -67,27 +69,24 @@ def get_list_leaf_classes(graph, all_classes):
 
 def get_list_of_all_classes(ontology_graph, exceptions_list: list = []):
     """ Returns a list of all classes as URI strings without repetitions available in a Graph.
-        Classes that have namespaces included in the exception_list parameter are not included in the returned list. """
+        Classes that have namespaces included in the exception_list parameter are not included in the returned list.
+        Only the subjects of the rdf:type owl:Class triples are read, hence in time proportional to the number of classes.
+    """
 
+    # Tuple of prefixes, so that all exceptions are checked by a single startswith call
+    exceptions_prefixes = tuple(exceptions_list)
     classes_list = []
 
-    for sub, pred, obj in ontology_graph:
-        if (sub, RDF.type, OWL.Class) in ontology_graph:
-            # Eliminating BNodes
-            if type(sub).__name__ != "BNode":
-                # N3 necessary for returning string and [1:-1] necessary for removing <>
-                classes_list.append(sub.n3()[1:-1])
-        if (obj, RDF.type, OWL.Class) in ontology_graph:
-            # Eliminating BNodes
-            if type(obj).__name__ != "BNode":
-                # N3 necessary for returning string and [1:-1] necessary for removing <>
-                classes_list.append(obj.n3()[1:-1])
-
-    # Removing repetitions
-    no_rep_classes_list = remove_duplicates(classes_list)
-
-    # Removing classes that have namespace in the exceptions_list
-    classes_list = [x for x in no_rep_classes_list if not any(x.startswith(y) for y in exceptions_list)]
+    # Each class is the subject of a single (class, rdf:type, owl:Class) triple, so there are no repetitions
+    for sub in ontology_graph.subjects(RDF.type, OWL.Class):
+        # Eliminating BNodes
+        if isinstance(sub, BNode):
+            continue
+        class_uri = str(sub)
+        if exceptions_prefixes and class_uri.startswith(exceptions_prefixes):
+            continue
+        classes_list.append(class_uri)
+
     return classes_list
 
 
@@ -120,52 +119,247 @@ def get_all_subclasses(graph, nodes_list, element):
 
     for sc in subclasses:
         all_subclasses.append(sc)
-        if subclasses not in nodes_list["leaves"]:
+        if sc not in nodes_list["leaves"]:
             temp = get_all_subclasses(graph, nodes_list, sc)
             all_subclasses.extend(temp)
 
     return remove_duplicates(all_subclasses)
 
 
-def _get_all_related_nodes(graph, nodes_list, node, visited):
-    """ Implements the BFS algorithm to return the list of all nodes of the given graph that are directly or indirectly
-        related to the given element. I.e., return all nodes that are reachable from the ontology's node (element).
-        The return list DOES INCLUDE the own element.
-    """
-    if not visited:
-        visited = []
-
-    neighbours = get_subclasses(graph, nodes_list["all"], node) + get_superclasses(graph, nodes_list["all"], node)
-    visited.append(node)
-
-    while neighbours:
-        neighbour = neighbours.pop(0)
-        if neighbour not in visited:
-            neighbours.extend(_get_all_related_nodes(graph, nodes_list, neighbour, visited))
+class TaxonomyIndex(object):
+    """ Adjacency index of the classes of a taxonomy graph, built once per graph.
 
-    return visited
-
-
-def get_all_related_nodes(graph, nodes_list, node, remove_itself: bool = True):
-    """ Return the list of all nodes of the given graph that are directly or indirectly
-        related to the given element. I.e., return all nodes that are reachable from the ontology's node (element).
-
-        The return list DOES NOT INCLUDE the element itself IF remove_itself is not set to False
+        Each class URI is mapped to an integer id and the direct superclasses (parents) and subclasses (children) of
+        every class are kept as lists of ids. Membership tests are performed in constant time and traversals in time
+        linear to the size of the taxonomy, without querying the RDFLib store.
+        Roots and leaves are defined as in the functions get_list_root_classes and get_list_leaf_classes.
     """
-    result = _get_all_related_nodes(graph, nodes_list, node, None)
-    return result[1:] if remove_itself else result
 
-
-def generates_nodes_lists(graph) -> dict:
+    def __init__(self, graph, exceptions_list: list = []):
+        self.classes: list = get_list_of_all_classes(graph, exceptions_list)
+        self.ids: dict = {class_uri: class_id for class_id, class_uri in enumerate(self.classes)}
+        self.parents: list = [[] for _ in self.classes]
+        self.children: list = [[] for _ in self.classes]
+
+        has_superclass = [False] * len(self.classes)
+        has_subclass = [False] * len(self.classes)
+
+        for subj, _, obj in graph.triples((None, RDFS.subClassOf, None)):
+            subj_id = self.ids.get(str(subj))
+            obj_id = self.ids.get(str(obj))
+            if subj_id is not None:
+                has_superclass[subj_id] = True
+            if obj_id is not None:
+                has_subclass[obj_id] = True
+            if subj_id is not None and obj_id is not None:
+                self.parents[subj_id].append(obj_id)
+                self.children[obj_id].append(subj_id)
+
+        self.roots: set = {self.classes[class_id] for class_id in range(len(self.classes))
+                           if not has_superclass[class_id]}
+        self.leaves: set = {self.classes[class_id] for class_id in range(len(self.classes))
+                            if not has_subclass[class_id]}
+
+    def __contains__(self, class_uri):
+        return class_uri in self.ids
+
+    def __len__(self):
+        return len(self.classes)
+
+    def _traverse(self, class_uri, adjacencies_lists):
+        """ Returns the ids of all classes reachable from the given class through the received adjacencies lists.
+            The returned list includes the own class as its first element. """
+
+        start_id = self.ids[class_uri]
+        visited = [False] * len(self.classes)
+        visited[start_id] = True
+        reachable_ids = [start_id]
+
+        # reachable_ids also works as the BFS queue: its elements after position idx are still to be expanded
+        idx = 0
+        while idx < len(reachable_ids):
+            for adjacencies_list in adjacencies_lists:
+                for neighbour_id in adjacencies_list[reachable_ids[idx]]:
+                    if not visited[neighbour_id]:
+                        visited[neighbour_id] = True
+                        reachable_ids.append(neighbour_id)
+            idx += 1
+
+        return reachable_ids
+
+    def get_superclasses(self, class_uri) -> list:
+        """ Returns a list of all direct superclasses of the given class. """
+        return [self.classes[parent_id] for parent_id in self.parents[self.ids[class_uri]]]
+
+    def get_subclasses(self, class_uri) -> list:
+        """ Returns a list of all direct subclasses of the given class. """
+        return [self.classes[child_id] for child_id in self.children[self.ids[class_uri]]]
+
+    def get_all_superclasses(self, class_uri) -> list:
+        """ Returns a list of all direct or indirect superclasses of the given class, not including the own class. """
+        return [self.classes[class_id] for class_id in self._traverse(class_uri, [self.parents])[1:]]
+
+    def get_all_subclasses(self, class_uri) -> list:
+        """ Returns a list of all direct or indirect subclasses of the given class, not including the own class. """
+        return [self.classes[class_id] for class_id in self._traverse(class_uri, [self.children])[1:]]
+
+    def get_all_related_nodes(self, class_uri, remove_itself: bool = True) -> list:
+        """ Returns the list of all classes that are directly or indirectly related to the given class.
+            The returned list DOES NOT INCLUDE the class itself IF remove_itself is not set to False.
+        """
+        related_nodes = [self.classes[class_id]
+                         for class_id in self._traverse(class_uri, [self.parents, self.children])]
+        return related_nodes[1:] if remove_itself else related_nodes
+
+    def get_strongly_connected_components(self) -> list:
+        """ Returns the strongly connected components of the specialization relation as lists of class ids, using an
+            iterative version of Tarjan's algorithm. Classes that are not part of a cycle are components on their own.
+            Every component is returned after the components of all its (direct or indirect) superclasses.
+        """
+
+        next_index = 0
+        indexes = [None] * len(self.classes)
+        lowlinks = [0] * len(self.classes)
+        on_stack = [False] * len(self.classes)
+        stack = []
+        components = []
+
+        for start_id in range(len(self.classes)):
+            if indexes[start_id] is not None:
+                continue
+
+            # Each work item is a class id and the position of the next parent to be visited
+            work = [(start_id, 0)]
+            while work:
+                class_id, position = work.pop()
+                if position == 0:
+                    indexes[class_id] = lowlinks[class_id] = next_index
+                    next_index += 1
+                    stack.append(class_id)
+                    on_stack[class_id] = True
+
+                parents = self.parents[class_id]
+                while position < len(parents):
+                    parent_id = parents[position]
+                    position += 1
+                    if indexes[parent_id] is None:
+                        work.append((class_id, position))
+                        work.append((parent_id, 0))
+                        break
+                    if on_stack[parent_id]:
+                        lowlinks[class_id] = min(lowlinks[class_id], indexes[parent_id])
+                else:
+                    # All parents visited
+                    if lowlinks[class_id] == indexes[class_id]:
+                        component = []
+                        while True:
+                            member_id = stack.pop()
+                            on_stack[member_id] = False
+                            component.append(member_id)
+                            if member_id == class_id:
+                                break
+                        components.append(component)
+                    if work:
+                        caller_id = work[-1][0]
+                        lowlinks[caller_id] = min(lowlinks[caller_id], lowlinks[class_id])
+
+        return components
+
+    def get_closure_counts(self):
+        """ Returns two lists, indexed by class id, with the number of direct or indirect superclasses and subclasses
+            of every class. The own class is never counted.
+
+            All counts are calculated together by dynamic programming over the strongly connected components in
+            topological order, where the classes reachable from each component are kept as an integer bitset.
+            Classes that are part of a cycle count all other classes of the cycle.
+        """
+
+        components = self.get_strongly_connected_components()
+        component_of_class = [0] * len(self.classes)
+        components_members = []
+        components_cyclic = []
+
+        for component_label, component in enumerate(components):
+            members = 0
+            for class_id in component:
+                component_of_class[class_id] = component_label
+                members |= 1 << class_id
+            components_members.append(members)
+            components_cyclic.append(len(component) > 1 or component[0] in self.parents[component[0]])
+
+        def calculate_reachable(components_order, adjacencies):
+            reachable = [0] * len(components)
+            for label in components_order:
+                reachable_bits = components_members[label] if components_cyclic[label] else 0
+                for class_id in components[label]:
+                    for neighbour_id in adjacencies[class_id]:
+                        neighbour_label = component_of_class[neighbour_id]
+                        if neighbour_label != label:
+                            reachable_bits |= components_members[neighbour_label] | reachable[neighbour_label]
+                reachable[label] = reachable_bits
+            return reachable
+
+        # Components are ordered from superclasses to subclasses
+        ancestors = calculate_reachable(range(len(components)), self.parents)
+        descendants = calculate_reachable(reversed(range(len(components))), self.children)
+
+        numbers_superclasses = []
+        numbers_subclasses = []
+        for class_id in range(len(self.classes)):
+            label = component_of_class[class_id]
+            numbers_superclasses.append(ancestors[label].bit_count() - components_cyclic[label])
+            numbers_subclasses.append(descendants[label].bit_count() - components_cyclic[label])
+
+        return numbers_superclasses, numbers_subclasses
+
+    def get_connected_components(self, start_classes: list = None) -> list:
+        """ Labels all classes with their connected components (i.e., their separated taxonomies) in a single pass.
+            Returns a list of components, each one being a list of class URIs.
+
+            Components are numbered in the order their first class appears in start_classes. Components without any
+            class in start_classes are numbered afterwards, in the order of the classes of the index.
+        """
+
+        component_labels = [None] * len(self.classes)
+        components = []
+
+        start_ids = [self.ids[class_uri] for class_uri in start_classes] if start_classes else []
+        for start_id in start_ids + list(range(len(self.classes))):
+            if component_labels[start_id] is not None:
+                continue
+
+            component_label = len(components)
+            component_labels[start_id] = component_label
+            component_ids = [start_id]
+
+            # Iterative BFS, where component_ids also works as the queue
+            idx = 0
+            while idx < len(component_ids):
+                current_id = component_ids[idx]
+                for neighbour_id in self.parents[current_id] + self.children[current_id]:
+                    if component_labels[neighbour_id] is None:
+                        component_labels[neighbour_id] = component_label
+                        component_ids.append(neighbour_id)
+                idx += 1
+
+            components.append([self.classes[class_id] for class_id in component_ids])
+
+        return components
+
+
+def generates_nodes_lists(graph, taxonomy_index: TaxonomyIndex = None) -> dict:
     """ Return lists of different types of classes (string with the class URI) for the ontologies ontology to be used
         in other functions. This lists of classes must be initializated and, after that, not be edited anymore.
+        The lists are obtained from the taxonomy_index, which is built from the graph if not provided.
     """
-    logger = initialize_logger()
     logger.debug("Initializing list of Taxonomy nodes...")
 
-    prefixed_node_list = {"all": get_list_of_all_classes(graph), "roots": [], "leaves": []}
-    prefixed_node_list["roots"] = get_list_root_classes(graph, prefixed_node_list["all"])
-    prefixed_node_list["leaves"] = get_list_leaf_classes(graph, prefixed_node_list["all"])
+    if taxonomy_index is None:
+        taxonomy_index = TaxonomyIndex(graph)
+
+    prefixed_node_list = {"all": list(taxonomy_index.classes),
+                          "roots": list(taxonomy_index.roots),
+                          "leaves": list(taxonomy_index.leaves)}
 
     logger.debug("List of Taxonomy nodes successfully initialized.")
 
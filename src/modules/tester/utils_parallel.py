@@ -0,0 +1,25 @@
+""" Functions for distributing independent units of work across a pool of worker processes. """
+from concurrent.futures import ProcessPoolExecutor
+
+
+def create_process_pool(jobs):
+    """ Returns a process pool with the given number of workers.
+        Returns None when a single job is requested, meaning that the work must run in the current process.
+    """
+
+    if jobs is None or jobs <= 1:
+        return None
+
+    return ProcessPoolExecutor(max_workers=jobs)
+
+
+def map_ordered(process_pool, function, *iterables):
+    """ Applies the function to every item of the received iterables and returns an iterator over the results.
+        The results are always returned in submission order, even when the workers finish out of order.
+        If process_pool is None, the function is lazily executed in the current process.
+    """
+
+    if process_pool is None:
+        return map(function, *iterables)
+
+    return process_pool.map(function, *iterables)
@@ -1,19 +1,30 @@
 """ Auxiliary functions for extending and complementing RDFLib's RDF treatment functions """
 import time
 
-from owlrl import DeductiveClosure, RDFS_Semantics
+from functools import lru_cache
 from rdflib import RDF, OWL, Graph
+from rdflib.store import Store
 
-from src.modules.tester.logger_config import initialize_logger
+from src.modules.tester.graph_cache import is_graph_cache_enabled, load_cached_graph, save_cached_graph
+from src.modules.tester.hash_functions import generate_sha256_hash
+from src.modules.tester.logger_config import get_logger
 
+logger = get_logger()
 
-def load_graph_safely(ontology_file):
-    """ Safely load graph from file to working memory. """
 
-    logger = initialize_logger()
+def load_graph_safely(ontology_file):
+    """ Safely load graph from file to working memory.
+        If the graph cache is enabled, a file already parsed before (i.e., with the same hash) is loaded from the cache.
+    """
 
-    ontology_graph = Graph()
     try:
+        file_hash = generate_sha256_hash(ontology_file) if is_graph_cache_enabled() else None
+        ontology_graph = load_cached_graph(file_hash) if file_hash else None
+        if ontology_graph is not None:
+            logger.debug(f"Ontology file {ontology_file} successfully loaded from the graph cache.")
+            return ontology_graph
+
+        ontology_graph = Graph()
         ontology_graph.parse(ontology_file, encoding='utf-8')
     except OSError as error:
         logger.error(f"Could not load {ontology_file} file. Exiting program.\n"
@@ -22,9 +33,88 @@ def load_graph_safely(ontology_file):
 
     logger.debug(f"Ontology file {ontology_file} successfully loaded to working memory.")
 
+    if file_hash:
+        save_cached_graph(ontology_graph, file_hash)
+
     return ontology_graph
 
 
+@lru_cache(maxsize=2)
+def load_graph_once(ontology_file):
+    """ Loads the graph from file only once per process and returns the same graph in later calls.
+        Used by executions that may run in worker processes, where the graph cannot be received from the caller.
+        The returned graph is shared and must not be modified (see create_overlay_graph).
+    """
+
+    return load_graph_safely(ontology_file)
+
+
+class OverlayStore(Store):
+    """ RDFLib store composed of an immutable base graph and a small delta of changes.
+
+        Added triples are kept in a separate delta graph and removed base triples are only masked, hence the base
+        graph is never modified and can be shared by all executions performed on the same taxonomy.
+    """
+
+    context_aware = False
+    formula_aware = False
+    transaction_aware = False
+    graph_aware = False
+
+    def __init__(self, base_graph):
+        super().__init__()
+        self.base_graph = base_graph
+        self.delta_graph = Graph()
+        self.removed_triples = set()
+
+        for prefix, namespace in base_graph.namespaces():
+            self.delta_graph.bind(prefix, namespace, override=True)
+
+    def add(self, triple, context, quoted=False):
+        if triple in self.removed_triples:
+            self.removed_triples.discard(triple)
+        elif triple not in self.base_graph:
+            self.delta_graph.add(triple)
+
+    def remove(self, triple_pattern, context=None):
+        for triple in list(self.base_graph.triples(triple_pattern)):
+            self.removed_triples.add(triple)
+        self.delta_graph.remove(triple_pattern)
+
+    def triples(self, triple_pattern, context=None):
+        for triple in self.base_graph.triples(triple_pattern):
+            if not self.removed_triples or triple not in self.removed_triples:
+                yield triple, iter(())
+        for triple in self.delta_graph.triples(triple_pattern):
+            yield triple, iter(())
+
+    def __len__(self, context=None):
+        return len(self.base_graph) - len(self.removed_triples) + len(self.delta_graph)
+
+    def contexts(self, triple=None):
+        return iter(())
+
+    def bind(self, prefix, namespace, override=True):
+        self.delta_graph.store.bind(prefix, namespace, override=override)
+
+    def namespace(self, prefix):
+        return self.delta_graph.store.namespace(prefix)
+
+    def prefix(self, namespace):
+        return self.delta_graph.store.prefix(namespace)
+
+    def namespaces(self):
+        return self.delta_graph.store.namespaces()
+
+
+def create_overlay_graph(base_graph):
+    """ Returns a graph with the same content of the base graph that can be modified without copying it.
+        Used instead of deepcopy for the graphs received by each Scior execution.
+    """
+
+    return Graph(store=OverlayStore(base_graph))
+
+
 """
 ---------------------------------------------------
 The rest of the functions are not used anywhere
@@ -74,7 +164,7 @@ def get_ontology_uri(ontology_graph):
 def perform_reasoning(ontology_graph):
     """Perform reasoner and consequently expands the ontology graph. """
 
-    logger = initialize_logger()
+    from owlrl import DeductiveClosure, RDFS_Semantics
 
     logger.info("Initializing RDFS reasoning. This may take a while...")
 
@@ -0,0 +1,43 @@
+""" Serialization of the classes' results of every execution (the complete* files).
+
+    Two formats are available:
+    - "yaml": one YAML document per class. The libyaml based dumper is used when available, as it is much faster
+      than the pure-Python one.
+    - "jsonl": JSON Lines, one JSON object per class (i.e., per line), with the same fields of the YAML documents.
+"""
+import json
+
+CLASSES_OUTPUT_FORMATS = ["yaml", "jsonl"]
+
+
+def get_classes_output_extension(classes_format):
+    """ Returns the file extension (including the dot) of files in the informed format. """
+
+    return ".jsonl" if classes_format == "jsonl" else ".yaml"
+
+
+def save_classes_output(ontology_dictionary_list, file_path, classes_format="yaml"):
+    """ Saves the ontology_dictionary_list (as returned by convert_dataclass_index_to_dictionary_list)
+        in the informed format. """
+
+    with open(file_path, 'w', encoding='utf-8') as file:
+        if classes_format == "jsonl":
+            for ontology_dictionary in ontology_dictionary_list:
+                file.write(json.dumps(ontology_dictionary, sort_keys=True) + "\n")
+        else:
+            import yaml
+            yaml.dump_all(ontology_dictionary_list, file, sort_keys=True,
+                          Dumper=getattr(yaml, "CDumper", yaml.Dumper))
+
+
+def load_classes_output(file_path):
+    """ Loads a file saved by save_classes_output, in any of the formats (identified by the file's extension).
+        Returns a list of dictionaries, each one with a single key (the class name) whose value is the dictionary with
+        the class' fields: input, is_type, can_type, not_type, is_incomplete, and detected_in. """
+
+    with open(file_path, 'r', encoding='utf-8') as file:
+        if file_path.endswith(".jsonl"):
+            return [json.loads(line) for line in file if line.strip()]
+        import yaml
+        return [document for document in yaml.load_all(file, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+                if document is not None]
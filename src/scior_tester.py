@@ -1,63 +1,181 @@
-""" Main module for the OntoCatOWL-Catalog Tester. """
+""" Main module for the OntoCatOWL-Catalog Tester.
+
+    The modules that depend on rdflib and Scior are only imported by the functions of the modes that use them, so that
+    the program starts fast (e.g., for printing its version or in short worker processes).
+"""
 import os
-import pandas as pd
 import random
-
-from copy import deepcopy
-from rdflib import URIRef, RDF
-
-from src import *
-from modules.run.test1 import *
-from modules.run.test2 import *
-from src.modules.build.build_classes_stereotypes_information import collect_stereotypes_classes_information
-from src.modules.build.build_directories_structure import get_list_ttl_files, \
-    create_test_directory_folders_structure, create_test_results_folder, create_internal_catalog_path
-from src.modules.build.build_information_classes import saves_dataset_csv_classes_data
-from src.modules.build.build_taxonomy_classes_information import collect_taxonomies_information
-from src.modules.build.build_taxonomy_files import create_taxonomy_ttl_files
-from scior import run_scior_tester
-from src.modules.tester.hash_functions import write_sha256_hash_register
+import time
+
+from datetime import datetime, timedelta
+from importlib import import_module
+from itertools import repeat
+
+from src import SOFTWARE_ACRONYM, SOFTWARE_NAME, SOFTWARE_VERSION, SOFTWARE_URL, CATALOG_FOLDER, HASH_FILE_NAME, \
+    CLASSES_DATA_FILE_NAME, EXCEPTIONS_LIST, MINIMUM_ALLOWED_NUMBER_CLASSES, QUARANTINE_BUILD_TIME_BUDGET, \
+    QUARANTINE_RUN_TIME_BUDGET
+from src.modules.build.build_directories_structure import get_list_ttl_files, create_test_results_folder, \
+    create_internal_catalog_path, remove_dataset_build_files, remove_dataset_folder
+from src.modules.build.build_information_classes import saves_catalog_csv_taxonomies_data, \
+    read_dataset_taxonomies_rows
+from src.modules.tester.checkpoint import CheckpointJournal, open_checkpoint_journal, \
+    reconcile_catalog_result_files, reconcile_csv_file
+from src.modules.tester.hash_functions import write_sha256_hash_register, merge_sha256_hash_registers, \
+    read_sha256_hash_register, create_sha256_hash_register
 from src.modules.tester.input_arguments import treat_arguments
-from src.modules.tester.logger_config import initialize_logger
-from src.modules.tester.utils_rdf import load_graph_safely
-
-
-def build_scior_tester(catalog_path):
-    """ Build function for the Scior-Catalog Tester. Generates all the needed data."""
+from src.modules.tester.isolation import configure_isolation
+from src.modules.tester.logger_config import get_logger, initialize_logger, configure_logger
+from src.modules.tester.memory_metrics import configure_memory_metrics
+from src.modules.tester.quarantine import open_quarantine, lift_quarantine, check_quarantine_criteria
+from src.modules.tester.profiling import configure_profiling, is_profiling_enabled, set_profiling_context, \
+    profile_stage, profile_dataset, merge_profile_records, save_profile_records
+from src.modules.tester.output_backends import create_output_backend, close_output_writers, \
+    reconcile_output_backend
+from src.modules.tester.result_writer import result_writer_session
+from src.modules.tester.scheduler import ScheduledTaxonomy, create_schedule, save_schedule, \
+    get_estimated_makespan, dispatch_schedule, get_scheduled_results
+from src.modules.tester.utils_parallel import create_process_pool, map_ordered
+
+logger = get_logger()
+
+
+def build_scior_tester(catalog_path, jobs=1, incremental=False):
+    """ Build function for the Scior-Catalog Tester. Generates all the needed data.
+        When more than one job is requested, datasets are built in worker processes. Their shared outputs (the
+        taxonomies.csv file and the hash register) are merged here in the datasets' order, so that the generated
+        files are identical to the ones of a serial build.
+        In incremental mode, only datasets whose source file changed (or that were never built) are built again,
+        the folders of datasets that are no longer in the catalog are removed, and the hash register is rewritten.
+        Datasets that are still in the catalog but are not built (i.e., exceptions and quarantined datasets) keep their
+        files and their entries in the hash register.
+        Quarantined datasets are not built. A dataset whose build fails (or exceeds QUARANTINE_BUILD_TIME_BUDGET) is
+        quarantined, and the build continues without the files of the failed dataset.
+        When profiling is enabled, the stages' times of all datasets are saved in the file profile_build.csv.
+    """
+
+    from src.modules.build.build_dataset import build_dataset_measured, get_dataset_hash_register, \
+        is_dataset_up_to_date
 
     # Building directories structure
     datasets = get_list_ttl_files(catalog_path, name="ontology")  # returns all ttl files we have with full path
     catalog_size = len(datasets)
     logger.info(f"The catalog contains {catalog_size} datasets.\n")
     internal_catalog_folder = os.path.join(os.getcwd(), CATALOG_FOLDER) + os.path.sep
+    hash_register_file_path = internal_catalog_folder + HASH_FILE_NAME
     create_internal_catalog_path(internal_catalog_folder)
-    hash_register = pd.DataFrame(columns=["file_name", "file_hash", "source_file_name", "source_file_hash"])
-
-    for (current, dataset) in enumerate(datasets):
-        dataset_name = dataset.split(os.path.sep)[-2]
-        if dataset_name not in EXCEPTIONS_LIST:
-            dataset_folder = internal_catalog_folder + dataset_name
-            logger.info(f"### Starting dataset {current}/{catalog_size}: {dataset_name} ###\n")
-
-            create_test_directory_folders_structure(dataset_folder, catalog_size, current)
-
-            # Building taxonomies files and collecting information from classes
-            taxonomy_files, hash_register = create_taxonomy_ttl_files(dataset, dataset_folder, hash_register)
-            # Builds dataset_classes_information and collects attributes name, prefixed_name, and all taxonomic information
-            dataset_classes_information = collect_taxonomies_information(taxonomy_files, catalog_size, current)
-            # Collects stereotype_original and stereotype_gufo for dataset_classes_information
-            collect_stereotypes_classes_information(dataset, dataset_classes_information, catalog_size, current)
 
-            hash_register = saves_dataset_csv_classes_data(dataset_classes_information, dataset_folder,
-                                                           catalog_size, current, dataset, hash_register)
+    quarantine = open_quarantine(internal_catalog_folder)
+    for dataset in datasets:
+        if quarantine.is_quarantined(dataset.split(os.path.sep)[-2]):
+            logger.info(f"Dataset {dataset.split(os.path.sep)[-2]} is quarantined and will not be built.")
 
-    write_sha256_hash_register(hash_register, internal_catalog_folder + HASH_FILE_NAME)
+    selected_datasets = [(current, dataset) for (current, dataset) in enumerate(datasets)
+                         if (dataset.split(os.path.sep)[-2] not in EXCEPTIONS_LIST)
+                         and not quarantine.is_quarantined(dataset.split(os.path.sep)[-2])]
 
+    previous_hash_register = read_sha256_hash_register(hash_register_file_path) if incremental \
+        else create_sha256_hash_register()
 
-def run_scior(is_automatic: bool, is_complete: bool, tname: str):
+    unchanged_datasets_registers = {}
+    datasets_to_build = []
+    for (current, dataset) in selected_datasets:
+        dataset_name = dataset.split(os.path.sep)[-2]
+        dataset_hash_register = get_dataset_hash_register(previous_hash_register, dataset_name)
+        if incremental and is_dataset_up_to_date(dataset, dataset_hash_register):
+            logger.info(f"Dataset {current}/{catalog_size} is unchanged and will not be built again: {dataset_name}")
+            unchanged_datasets_registers[current] = dataset_hash_register
+            continue
+        if incremental:
+            remove_dataset_build_files(internal_catalog_folder + dataset_name)
+        datasets_to_build.append((current, dataset))
+
+    # The rewritten hash register keeps the entries of the datasets that are not built
+    selected_datasets_positions = {current for (current, _) in selected_datasets}
+    skipped_datasets_registers = [get_dataset_hash_register(previous_hash_register, dataset.split(os.path.sep)[-2])
+                                  for (current, dataset) in enumerate(datasets)
+                                  if incremental and (current not in selected_datasets_positions)]
+
+    if incremental:
+        # Only the datasets whose source file disappeared are removed. The ones that are not built (e.g., exceptions)
+        # keep their files.
+        catalog_datasets_names = {dataset.split(os.path.sep)[-2] for dataset in datasets}
+        previous_datasets_names = {file_name.split(os.path.sep)[-2]
+                                   for (file_name, _, _, _) in previous_hash_register}
+        for dataset_name in sorted(previous_datasets_names - catalog_datasets_names):
+            remove_dataset_folder(internal_catalog_folder + dataset_name)
+
+    process_pool = create_process_pool(jobs)
+    datasets_results = map_ordered(process_pool, build_dataset_measured,
+                                   [dataset for (_, dataset) in datasets_to_build],
+                                   repeat(internal_catalog_folder), repeat(catalog_size),
+                                   [current for (current, _) in datasets_to_build])
+    built_datasets_results = dict(zip([current for (current, _) in datasets_to_build], datasets_results))
+
+    if process_pool:
+        process_pool.shutdown()
+
+    hash_registers = []
+    with result_writer_session():
+        for (current, dataset) in selected_datasets:
+            set_profiling_context(dataset.split(os.path.sep)[-2])
+            if current in built_datasets_results:
+                dataset_results, measured_time, failure_details = built_datasets_results[current]
+                check_quarantine_criteria(quarantine, dataset.split(os.path.sep)[-2], "", "build", measured_time,
+                                          QUARANTINE_BUILD_TIME_BUDGET, failure_details)
+                if dataset_results is None:
+                    remove_dataset_build_files(internal_catalog_folder + dataset.split(os.path.sep)[-2])
+                    continue
+                hash_register, taxonomies_rows, profile_records = dataset_results
+                merge_profile_records(profile_records)
+            else:
+                hash_register = unchanged_datasets_registers[current]
+                taxonomies_rows = read_dataset_taxonomies_rows(
+                    internal_catalog_folder + dataset.split(os.path.sep)[-2])
+            with profile_stage("csv_write"):
+                saves_catalog_csv_taxonomies_data(taxonomies_rows, internal_catalog_folder)
+            hash_registers.append(hash_register)
+
+    write_sha256_hash_register(merge_sha256_hash_registers(hash_registers + skipped_datasets_registers),
+                               hash_register_file_path, append=not incremental)
+
+    if is_profiling_enabled():
+        save_profile_records(internal_catalog_folder + "profile_build.csv")
+
+
+def run_scior(is_automatic: bool, is_complete: bool, tname: str, jobs: int = 1, seed: int = None,
+              output_backend_name: str = "files", classes_format: str = "yaml", resume: bool = False):
+    """ Executes the test for all taxonomies of the internal catalog.
+        In resume mode, the units (i.e., executions) registered as completed in the run's checkpoint journal are
+        skipped, the rows of the units that were interrupted are removed from the result files, and the remaining
+        units' rows are appended to the existing files.
+        All taxonomies' executions are prepared before the first one is performed, and they are dispatched to the
+        worker processes as planned by the scheduler (i.e., largest taxonomies first), whose planned order and
+        estimated times are saved in the file schedule_{test_name}.csv. Their results are recorded in the taxonomies'
+        order, so the generated files do not depend on the jobs or on the schedule.
+        Quarantined taxonomies are not tested. A taxonomy with failed isolated executions (or whose executions'
+        times exceed QUARANTINE_RUN_TIME_BUDGET) is quarantined after its results are recorded.
+        When profiling is enabled, the stages' times of all taxonomies are saved in the file profile_{test_name}.csv.
+    """
+
+    from src.modules.run.test1 import load_baseline_dictionary
+
+    # Imported before any work, so that a missing Scior aborts the run instead of being reported as inconsistencies.
+    # Worker processes inherit the imported package.
+    try:
+        import_module("scior")
+    except ImportError as error:
+        logger.error(f"Scior could not be imported. Program aborted.\nReported error: {error}")
+        exit(1)
 
     # Creating list of taxonomies
     taxonomies = get_list_ttl_files(os.path.join(os.getcwd(), CATALOG_FOLDER))
+
+    quarantine = open_quarantine(os.path.join(os.getcwd(), CATALOG_FOLDER))
+    for taxonomy in taxonomies:
+        if quarantine.is_quarantined(taxonomy.split(os.path.sep)[-2], taxonomy.split(os.path.sep)[-1]):
+            logger.info(f"Taxonomy {taxonomy.split(os.path.sep)[-1]} is quarantined and will not be tested.")
+    taxonomies = [taxonomy for taxonomy in taxonomies
+                  if not quarantine.is_quarantined(taxonomy.split(os.path.sep)[-2], taxonomy.split(os.path.sep)[-1])]
     total_taxonomies_number = len(taxonomies)
 
     global_configurations = {"is_automatic": is_automatic, "is_complete": is_complete}
@@ -66,162 +184,308 @@ def run_scior(is_automatic: bool, is_complete: bool, tname: str):
     test_name = f"{tname}_{l1}{l2}"
     inconsistencies_file_name = os.path.join(os.getcwd(), CATALOG_FOLDER, f"inconsistencies_{test_name}.csv")
     divergences_file_name = os.path.join(os.getcwd(), CATALOG_FOLDER, f"divergences_{test_name}.csv")
-    if os.path.exists(inconsistencies_file_name):
-        os.remove(inconsistencies_file_name)
-    if os.path.exists(divergences_file_name):
-        os.remove(divergences_file_name)
-
+    failures_file_name = os.path.join(os.getcwd(), CATALOG_FOLDER, f"failures_{test_name}.csv")
+
+    if resume and output_backend_name == "parquet":
+        # Parquet rows are buffered in the workers' memory, so completed units may have lost their rows
+        logger.error("The resume mode is not available for the parquet output backend. Program aborted.")
+        exit(1)
+
+    checkpoint_journal = open_checkpoint_journal(os.path.join(os.getcwd(), CATALOG_FOLDER), test_name, resume)
+
+    if resume:
+        reconcile_catalog_result_files(checkpoint_journal, inconsistencies_file_name, divergences_file_name,
+                                       failures_file_name)
+    else:
+        for file_name in [inconsistencies_file_name, divergences_file_name, failures_file_name]:
+            if os.path.exists(file_name):
+                os.remove(file_name)
+    output_backend = create_output_backend(output_backend_name, os.path.join(os.getcwd(), CATALOG_FOLDER), test_name,
+                                           clear_if_exists=not resume)
+    if resume and output_backend is not None:
+        reconcile_output_backend(output_backend, checkpoint_journal)
+
+    if tname.endswith("2"):
+        # The samples of the resumed units must be the same ones of the interrupted run
+        if (checkpoint_journal.seed is not None) and (seed is not None) and (seed != checkpoint_journal.seed):
+            logger.warning(f"Informed seed {seed} ignored. The seed {checkpoint_journal.seed} of the resumed run "
+                           f"is used.")
+        if checkpoint_journal.seed is not None:
+            seed = checkpoint_journal.seed
+        elif seed is None:
+            seed = random.SystemRandom().randrange(2 ** 32)
+        checkpoint_journal.seed = seed
+        logger.info(f"Seed used for sampling the TEST_2 input classes: {seed}\n")
+
+    # Preparation of all taxonomies' executions, in the taxonomies' order, before any of them is performed
+    scheduled_taxonomies = []
     prev_dataset_folder = ""
-    for (current, taxonomy) in enumerate(taxonomies):
-        logger.info(f"Executing Scior for taxonomy {current + 1}/{total_taxonomies_number}: {taxonomy}\n")
-
+    for taxonomy in taxonomies:
         taxonomy_filename = taxonomy.split(os.path.sep)[-1]
         data_filename = CLASSES_DATA_FILE_NAME + "_" + taxonomy_filename.replace(".ttl", ".csv")
         input_classes = load_baseline_dictionary(taxonomy.replace(taxonomy_filename, data_filename))
-        input_graph = load_graph_safely(taxonomy)
 
         dataset_folder = taxonomy.rsplit(os.path.sep, 1)[0]
         draft_file_name = data_filename[4:-10] + "_" + test_name + data_filename[-10:]
         test_results_folder = os.path.join(dataset_folder, test_name)
-        create_test_results_folder(test_results_folder, dataset_folder != prev_dataset_folder)
+        create_test_results_folder(test_results_folder, (dataset_folder != prev_dataset_folder) and not resume)
+        prev_dataset_folder = dataset_folder
 
         if tname.endswith("1"):
-            run_scior_test1(global_configurations, input_classes, input_graph, test_results_folder,
-                            draft_file_name, inconsistencies_file_name, divergences_file_name)
+            executions_arguments = prepare_scior_test1(global_configurations, input_classes, taxonomy,
+                                                       test_results_folder, draft_file_name, output_backend,
+                                                       classes_format, checkpoint_journal)
+        else:
+            executions_arguments = prepare_scior_test2(global_configurations, input_classes, taxonomy,
+                                                       test_results_folder, draft_file_name, seed, output_backend,
+                                                       classes_format, checkpoint_journal)
+
+        scheduled_taxonomies.append(ScheduledTaxonomy(taxonomy_filename, dataset_folder.split(os.path.sep)[-1],
+                                                      len(input_classes), executions_arguments))
+
+    # The executions are dispatched to the workers largest taxonomies first, and recorded in the taxonomies' order
+    schedule_tasks = create_schedule(scheduled_taxonomies, jobs)
+    schedule_file_name = os.path.join(os.getcwd(), CATALOG_FOLDER, f"schedule_{test_name}.csv")
+    save_schedule(schedule_tasks, schedule_file_name)
+    estimated_makespan = get_estimated_makespan(scheduled_taxonomies)
+    logger.info(f"{sum(len(scheduled_taxonomy.executions_arguments) for scheduled_taxonomy in scheduled_taxonomies)} "
+                f"executions scheduled in {len(schedule_tasks)} tasks for {max(jobs, 1)} job(s). Estimated time: "
+                f"{estimated_makespan:.1f}s (finish at {get_finish_time(estimated_makespan)}). "
+                f"Planned order saved in {schedule_file_name}\n")
+
+    process_pool = create_process_pool(jobs)
+    executions_start = time.perf_counter()
+    execute_function = get_execute_function(tname)
+    dispatch_schedule(process_pool, execute_function, schedule_tasks)
 
-        if tname.endswith("2"):
-            run_scior_test2(global_configurations, input_classes, input_graph, test_results_folder,
-                            draft_file_name, inconsistencies_file_name, divergences_file_name, taxonomy_filename)
+    prev_dataset_folder = ""
+    for (current, (taxonomy, scheduled_taxonomy)) in enumerate(zip(taxonomies, scheduled_taxonomies)):
+        logger.info(f"Executing Scior for taxonomy {current + 1}/{total_taxonomies_number}: {taxonomy}\n")
+
+        taxonomy_filename = taxonomy.split(os.path.sep)[-1]
+        data_filename = CLASSES_DATA_FILE_NAME + "_" + taxonomy_filename.replace(".ttl", ".csv")
+        dataset_folder = taxonomy.rsplit(os.path.sep, 1)[0]
+        draft_file_name = data_filename[4:-10] + "_" + test_name + data_filename[-10:]
+        test_results_folder = os.path.join(dataset_folder, test_name)
+        executions_results = get_scheduled_results(scheduled_taxonomy, execute_function)
+
+        # The shared result files are kept open and their rows buffered during the taxonomy's executions
+        set_profiling_context(dataset_folder.split(os.path.sep)[-1], taxonomy_filename)
+        with profile_dataset(test_name, dataset_folder.split(os.path.sep)[-1]), result_writer_session():
+            if tname.endswith("1"):
+                run_scior_test1(scheduled_taxonomy, executions_results, taxonomy, test_results_folder,
+                                draft_file_name, inconsistencies_file_name, divergences_file_name,
+                                failures_file_name, checkpoint_journal)
+
+            if tname.endswith("2"):
+                run_scior_test2(scheduled_taxonomy, executions_results, taxonomy, test_results_folder,
+                                draft_file_name, inconsistencies_file_name, divergences_file_name,
+                                failures_file_name, seed, checkpoint_journal)
+
+        check_quarantine_criteria(quarantine, scheduled_taxonomy.dataset_name, taxonomy_filename, test_name,
+                                  scheduled_taxonomy.measured_time, QUARANTINE_RUN_TIME_BUDGET,
+                                  "; ".join(scheduled_taxonomy.failures))
+
+        # The taxonomy's results are no longer needed
+        scheduled_taxonomy.executions_arguments = []
+        scheduled_taxonomy.executions_futures = []
 
         if dataset_folder != prev_dataset_folder:
             if prev_dataset_folder:
                 logger.info(f"TEST{tname[-1]} is finished for {prev_dataset_folder}\n")
             prev_dataset_folder = dataset_folder
 
+    if process_pool:
+        process_pool.shutdown()
+    # The worker processes' writers were closed at their exit
+    close_output_writers()
+
+    logger.info(f"Executions finished in {time.perf_counter() - executions_start:.1f}s "
+                f"(estimated: {estimated_makespan:.1f}s).\n")
+
+    if is_profiling_enabled():
+        save_profile_records(os.path.join(os.getcwd(), CATALOG_FOLDER, f"profile_{test_name}.csv"))
+
 
-def run_scior_test1(global_configurations, input_classes, input_graph, test_results_folder,
-                    draft_file_name, inconsistencies_file_name, divergences_file_name):
+def get_execute_function(tname):
+    """ Returns the function that performs a single execution of the test. """
+
+    if tname.endswith("1"):
+        from src.modules.run.test1 import execute_scior_test1
+        return execute_scior_test1
+
+    from src.modules.run.test2 import execute_scior_test2
+    return execute_scior_test2
+
+
+def get_finish_time(seconds_from_now) -> str:
+    """ Returns the wall-clock time after the informed number of seconds, as HH:MM:SS. """
+
+    return (datetime.now() + timedelta(seconds=seconds_from_now)).strftime("%H:%M:%S")
+
+
+def prepare_scior_test1(global_configurations, input_classes, taxonomy, test_results_folder, draft_file_name,
+                        output_backend=None, classes_format="yaml", checkpoint_journal=None):
+    """ Returns the arguments of the taxonomy's pending executions of Test 1. In resume mode, the rows of the
+        interrupted executions are removed from the taxonomy's result files. """
+
+    taxonomy_filename = taxonomy.split(os.path.sep)[-1]
+    if checkpoint_journal is None:
+        checkpoint_journal = CheckpointJournal()
+
+    pending_executions = [(execution_number, input_class)
+                          for (execution_number, input_class) in enumerate(input_classes, start=1)
+                          if not checkpoint_journal.is_completed(taxonomy_filename, None, execution_number)]
+
+    if checkpoint_journal.resume and pending_executions:
+        for prefix in ["summary", "times", "statistics"]:
+            reconcile_csv_file(os.path.join(test_results_folder, f"{prefix}{draft_file_name}"),
+                               lambda row: checkpoint_journal.is_completed(taxonomy_filename, None, int(row[0])))
+
+    return [(global_configurations, taxonomy, input_class, execution_number, input_classes, test_results_folder,
+             draft_file_name, output_backend, classes_format)
+            for (execution_number, input_class) in pending_executions]
+
+
+def run_scior_test1(scheduled_taxonomy, executions_results, taxonomy, test_results_folder, draft_file_name,
+                    inconsistencies_file_name, divergences_file_name, failures_file_name, checkpoint_journal=None):
     # Test 1 for Scior - described in: https://github.com/unibz-core/Scior-Dataset
-    tests_total = len(input_classes)
-
-    # Executions of the test
-    for idx, input_class in enumerate(input_classes):
-        execution_number = idx + 1
-
-        working_graph = deepcopy(input_graph)
-        triple_subject = URIRef(NAMESPACE_TAXONOMY + input_class.name)
-        class_gufo_type = remaps_to_gufo(input_class.name, input_class.stereotype)
-        triple_object = URIRef(class_gufo_type)
-        working_graph.add((triple_subject, RDF.type, triple_object))
-        working_graph.bind("gufo", NAMESPACE_GUFO)
-
-        try:
-            ontology_dataclass_list, time_register, consolidated_statistics, knowledge_matrix, software_version = \
-                run_scior_tester(global_configurations, working_graph)
-        except:
-            logger.error(f"INCONSISTENCY found! Test {execution_number}/{tests_total} "
-                         f"for input class {input_class.name} interrupted.")
-            create_inconsistency_csv_output(inconsistencies_file_name, draft_file_name, execution_number, input_class)
-        else:
-            logger.info(f"Test {execution_number}/{tests_total} "
-                        f"for input class {input_class.name} successfully executed.")
-            # Creating resulting files
-            if execution_number == 1:
-                save_platform_information(test_results_folder,
-                                          f"settings{draft_file_name[:-10]}.csv", software_version)
-            create_classes_yaml_output(input_class, ontology_dataclass_list, test_results_folder,
-                                       file_name=f"complete{draft_file_name[:-4]}_ex{execution_number:03d}.yaml")
-            create_classes_results_csv_output(input_classes, ontology_dataclass_list,
-                                              test_results_folder, divergences_file_name,
-                                              file_name=f"simple{draft_file_name[:-4]}_ex{execution_number:03d}.csv")
-            create_matrix_output(knowledge_matrix, test_results_folder,
-                                 file_name=f"matrix{draft_file_name[:-4]}_ex{execution_number:03d}.csv")
-            create_times_csv_output(time_register, test_results_folder, draft_file_name, execution_number)
-            create_statistics_csv_output(ontology_dataclass_list, consolidated_statistics, test_results_folder,
-                                         draft_file_name, execution_number)
-            create_summary_csv_output(test_results_folder, draft_file_name, execution_number, input_class)
-
-
-def run_scior_test2(global_configurations, input_classes, input_graph, test_results_folder,
-                    draft_file_name, inconsistencies_file_name, divergences_file_name, taxonomy_filename):
+    from src.modules.run.test1 import record_scior_test1
+
+    taxonomy_filename = taxonomy.split(os.path.sep)[-1]
+    tests_total = scheduled_taxonomy.number_classes
+    if checkpoint_journal is None:
+        checkpoint_journal = CheckpointJournal()
+
+    if checkpoint_journal.resume and not scheduled_taxonomy.executions_arguments:
+        logger.info(f"All executions of {taxonomy_filename} were already completed.\n")
+        return
+
+    # The executions may have been performed concurrently in worker processes, in any order, while their results
+    # are recorded here in execution order.
+    for execution_result in executions_results:
+        merge_profile_records(execution_result.profile_records)
+        scheduled_taxonomy.measured_time += execution_result.elapsed_time
+        if execution_result.failure is not None:
+            scheduled_taxonomy.failures.append(f"{execution_result.failure.outcome} in execution "
+                                               f"{execution_result.execution_number}")
+        with profile_stage("result_writing"):
+            record_scior_test1(execution_result, tests_total, test_results_folder, draft_file_name,
+                               inconsistencies_file_name, divergences_file_name, failures_file_name)
+        checkpoint_journal.register_completed(taxonomy_filename, None, execution_result.execution_number)
+
+
+def prepare_scior_test2(global_configurations, input_classes, taxonomy, test_results_folder, draft_file_name, seed,
+                        output_backend=None, classes_format="yaml", checkpoint_journal=None):
+    """ Creates and saves the taxonomy's Test 2 plan and returns the arguments of its pending executions. Taxonomies
+        with less than the minimum number of classes have no executions. In resume mode, the files of the interrupted
+        executions are removed. """
+
+    from src.modules.run.test2 import create_test2_plan, save_test2_plan
+
+    taxonomy_filename = taxonomy.split(os.path.sep)[-1]
+    if len(input_classes) < MINIMUM_ALLOWED_NUMBER_CLASSES:
+        return []
+
+    if checkpoint_journal is None:
+        checkpoint_journal = CheckpointJournal()
+
+    # All samples are created before the executions, so that they do not depend on the executions' order
+    test2_plan = create_test2_plan(input_classes, taxonomy_filename, seed)
+    save_test2_plan(test2_plan, seed, test_results_folder, draft_file_name)
+
+    pending_plan = [(percentage_number, execution_number, sample_list)
+                    for (percentage_number, execution_number, sample_list) in test2_plan
+                    if not checkpoint_journal.is_completed(taxonomy_filename, percentage_number, execution_number)]
+
+    if checkpoint_journal.resume:
+        # Files of interrupted units, which would receive their rows again
+        for (percentage_number, execution_number, _) in pending_plan:
+            execution_suffix = f"_ex{execution_number:03d}_pc{percentage_number:03d}"
+            for prefix in ["times", "statistics"]:
+                file_path = os.path.join(test_results_folder, f"{prefix}{draft_file_name[:-4]}{execution_suffix}.csv")
+                if os.path.exists(file_path):
+                    os.remove(file_path)
+
+    return [(global_configurations, taxonomy, test2_plan_item, input_classes, test_results_folder, draft_file_name,
+             output_backend, classes_format) for test2_plan_item in pending_plan]
+
+
+def run_scior_test2(scheduled_taxonomy, executions_results, taxonomy, test_results_folder, draft_file_name,
+                    inconsistencies_file_name, divergences_file_name, failures_file_name, seed,
+                    checkpoint_journal=None):
     # Test 2 for Scior - described in: https://github.com/unibz-core/Scior-Dataset
-    model_size = len(input_classes)
+    from src.modules.run.test2 import record_scior_test2
+
+    taxonomy_filename = taxonomy.split(os.path.sep)[-1]
+    model_size = scheduled_taxonomy.number_classes
     # Consider only datasets that have at least 20 classes. If less, skip.
     if model_size < MINIMUM_ALLOWED_NUMBER_CLASSES:
         logger.warning(f"The dataset has only {model_size} classes (less than minimum number) and was skipped.\n")
         return
 
-    current_percentage = PERCENTAGE_INITIAL
-    while current_percentage <= PERCENTAGE_FINAL:
-        number_of_input_classes = round(model_size * current_percentage / 100)
-
-        current_execution = 1
-        while current_execution <= NUMBER_OF_EXECUTIONS_PER_DATASET_PER_PERCENTAGE:
-            end = "\n" if current_execution == NUMBER_OF_EXECUTIONS_PER_DATASET_PER_PERCENTAGE else ""
-            working_graph = deepcopy(input_graph)
-            working_graph.bind("gufo", NAMESPACE_GUFO)
-
-            sample_list = random.sample(input_classes, number_of_input_classes)
-            for input_class in sample_list:
-                triple_subject = URIRef(NAMESPACE_TAXONOMY + input_class.name)
-                class_gufo_type = remaps_to_gufo(input_class.name, input_class.stereotype)
-                triple_object = URIRef(class_gufo_type)
-                working_graph.add((triple_subject, RDF.type, triple_object))
-
-            try:
-                ontology_dataclass_list, time_register, consolidated_statistics, knowledge_matrix, software_version =\
-                    run_scior_tester(global_configurations, working_graph)
-            except:
-                logger.error(f"INCONSISTENCY found: {taxonomy_filename} "
-                             f"- percentage {current_percentage} - excecution {current_execution}. "
-                             f"Current execution interrupted.{end}")
-                create_inconsistency_csv_output_t2(inconsistencies_file_name, draft_file_name, current_percentage,
-                                                   current_execution)
-            else:
-                logger.info(f"Test dataset {taxonomy_filename} - percentage {current_percentage} - "
-                            f"excecution {current_execution} successfully executed "
-                            f"({number_of_input_classes} input classes).{end}")
-                # Creating resulting files
-                if (current_execution == 1) and (current_percentage == PERCENTAGE_INITIAL):
-                    save_platform_information(test_results_folder, f"settings{draft_file_name[:-10]}.csv",
-                                              software_version, env_vars=True)
-                create_classes_yaml_output_t2(sample_list, ontology_dataclass_list, test_results_folder,
-                  file_name=f"complete{draft_file_name[:-4]}_ex{current_execution:03d}_pc{current_percentage:03d}.yaml")
-                create_classes_results_csv_output(input_classes, ontology_dataclass_list,
-                                                  test_results_folder, divergences_file_name,
-                    file_name=f"simple{draft_file_name[:-4]}_ex{current_execution:03d}_pc{current_percentage:03d}.csv")
-                create_matrix_output(knowledge_matrix, test_results_folder,
-                    file_name=f"matrix{draft_file_name[:-4]}_ex{current_execution:03d}_pc{current_percentage:03d}.csv")
-                create_times_csv_output_t2(time_register, test_results_folder, draft_file_name,
-                                           current_percentage, current_execution)
-                create_statistics_csv_output_t2(ontology_dataclass_list, consolidated_statistics,
-                                                test_results_folder, draft_file_name, current_percentage,
-                                                current_execution)
-            current_execution += 1
-
-        current_percentage += PERCENTAGE_RATE
+    if checkpoint_journal is None:
+        checkpoint_journal = CheckpointJournal()
+
+    if checkpoint_journal.resume and not scheduled_taxonomy.executions_arguments:
+        logger.info(f"All executions of {taxonomy_filename} were already completed.\n")
+        return
+
+    for execution_result in executions_results:
+        merge_profile_records(execution_result.profile_records)
+        scheduled_taxonomy.measured_time += execution_result.elapsed_time
+        if execution_result.failure is not None:
+            scheduled_taxonomy.failures.append(f"{execution_result.failure.outcome} in execution "
+                                               f"{execution_result.execution_number}")
+        with profile_stage("result_writing"):
+            record_scior_test2(execution_result, seed, taxonomy_filename, test_results_folder, draft_file_name,
+                               inconsistencies_file_name, divergences_file_name, failures_file_name)
+        checkpoint_journal.register_completed(taxonomy_filename, execution_result.percentage_number,
+                                              execution_result.execution_number)
 
 
 if __name__ == '__main__':
 
-    logger = initialize_logger()
+    initialize_logger()
 
     arguments = treat_arguments(SOFTWARE_ACRONYM, SOFTWARE_NAME, SOFTWARE_VERSION, SOFTWARE_URL)
 
+    configure_logger(arguments["console_log_level"], arguments["file_log_level"], arguments["json_log"])
+
+    if not arguments["graph_cache"]:
+        from src.modules.tester.graph_cache import configure_graph_cache
+        configure_graph_cache(enabled=False)
+
+    if arguments["profile"]:
+        configure_profiling(enabled=True, cprofile_dumps_folder=os.path.join(os.getcwd(), CATALOG_FOLDER, "profiles")
+                            if arguments["cprofile"] else None)
+
+    if arguments["memory"]:
+        configure_memory_metrics(enabled=True, number_allocation_sites=arguments["tracemalloc"])
+
+    if arguments["retry_quarantined"] is not None:
+        lift_quarantine(os.path.join(os.getcwd(), CATALOG_FOLDER), arguments["retry_quarantined"])
+
+    if arguments["isolate"]:
+        configure_isolation(enabled=True, timeout=arguments["timeout"], memory_limit_mb=arguments["memory_limit"])
+
     # Execute in BUILD mode.
     if arguments["build"]:
-        build_scior_tester(arguments["catalog_path"])
+        build_scior_tester(arguments["catalog_path"], arguments["jobs"], arguments["incremental"])
 
     # Execute in RUN mode.
     if arguments["run1"]:
-        run_scior(arguments["is_automatic"], arguments["is_complete"], tname="tt001")
+        run_scior(arguments["is_automatic"], arguments["is_complete"], tname="tt001", jobs=arguments["jobs"],
+                  output_backend_name=arguments["output_backend"], classes_format=arguments["classes_format"],
+                  resume=arguments["resume"])
 
     if arguments["run2"]:
-        run_scior(arguments["is_automatic"], arguments["is_complete"], tname="tt002")
+        run_scior(arguments["is_automatic"], arguments["is_complete"], tname="tt002", jobs=arguments["jobs"],
+                  seed=arguments["seed"], output_backend_name=arguments["output_backend"],
+                  classes_format=arguments["classes_format"], resume=arguments["resume"])
 
 # TODO (@pedropaulofb): VERIFY
 # Are there any classes with more than one stereotype?
 # Try to clean garbage classes for creating better statistics
 # The following datasets don't have any taxonomy and were removed by hand:
 # - chartered-service, experiment2013, gailly2016value, pereira2020ontotrans, zhou2017hazard-ontology-robotic-strolling, zhou2017hazard-ontology-train-control
-# van-ee2021modular - RecursionError: maximum recursion depth exceeded while calling a Python object
@@ -0,0 +1,89 @@
+""" Regression tests of the superclasses and subclasses counts of TaxonomyIndex against hand-computed values. """
+from rdflib import Graph, Namespace, RDF, RDFS, OWL
+
+import src.modules.tester.utils_graph as utils_graph
+from src.modules.tester.utils_graph import TaxonomyIndex, generates_nodes_lists
+
+TAXONOMY = Namespace("http://taxonomy.model/")
+
+
+def create_taxonomy_graph(specializations, isolated_classes=()):
+    """ Returns a graph in which every (subclass, superclass) pair of names is a rdfs:subClassOf relation. """
+
+    graph = Graph()
+    for (subclass_name, superclass_name) in specializations:
+        graph.add((TAXONOMY[subclass_name], RDF.type, OWL.Class))
+        graph.add((TAXONOMY[superclass_name], RDF.type, OWL.Class))
+        graph.add((TAXONOMY[subclass_name], RDFS.subClassOf, TAXONOMY[superclass_name]))
+    for class_name in isolated_classes:
+        graph.add((TAXONOMY[class_name], RDF.type, OWL.Class))
+
+    return graph
+
+
+def get_named_closure_counts(graph):
+    """ Returns the numbers of superclasses and subclasses of every class, indexed by the class' name. """
+
+    taxonomy_index = TaxonomyIndex(graph)
+    numbers_superclasses, numbers_subclasses = taxonomy_index.get_closure_counts()
+
+    return {class_uri.removeprefix(str(TAXONOMY)): (numbers_superclasses[class_id], numbers_subclasses[class_id])
+            for (class_uri, class_id) in taxonomy_index.ids.items()}
+
+
+def test_diamond_with_multiple_inheritance():
+    # B and C specialize A, D specializes both B and C, and E specializes D
+    graph = create_taxonomy_graph([("B", "A"), ("C", "A"), ("D", "B"), ("D", "C"), ("E", "D")], ["F"])
+
+    assert get_named_closure_counts(graph) == {"A": (0, 4), "B": (1, 2), "C": (1, 2), "D": (3, 1), "E": (4, 0),
+                                               "F": (0, 0)}
+
+
+def test_three_cycle():
+    # X, Y, and Z specialize each other in a cycle, and W specializes X
+    graph = create_taxonomy_graph([("X", "Y"), ("Y", "Z"), ("Z", "X"), ("W", "X")])
+
+    assert get_named_closure_counts(graph) == {"X": (2, 3), "Y": (2, 3), "Z": (2, 3), "W": (3, 0)}
+
+
+def test_two_cycle():
+    graph = create_taxonomy_graph([("P", "Q"), ("Q", "P"), ("R", "Q")])
+
+    assert get_named_closure_counts(graph) == {"P": (1, 2), "Q": (1, 2), "R": (2, 0)}
+
+
+def test_self_loop():
+    # S specializes itself, which is never counted, and T specializes S
+    graph = create_taxonomy_graph([("S", "S"), ("T", "S")])
+
+    assert get_named_closure_counts(graph) == {"S": (0, 1), "T": (1, 0)}
+
+
+def test_strongly_connected_components_order():
+    graph = create_taxonomy_graph([("X", "Y"), ("Y", "Z"), ("Z", "X"), ("W", "X"), ("V", "W")])
+    taxonomy_index = TaxonomyIndex(graph)
+
+    components = [sorted(taxonomy_index.classes[class_id].removeprefix(str(TAXONOMY)) for class_id in component)
+                  for component in taxonomy_index.get_strongly_connected_components()]
+
+    assert components == [["X", "Y", "Z"], ["W"], ["V"]]
+
+
+def test_all_subclasses_do_not_expand_leaves(monkeypatch):
+    # B and C specialize A, D specializes B. C and D are leaves.
+    graph = create_taxonomy_graph([("B", "A"), ("C", "A"), ("D", "B")])
+    nodes_list = generates_nodes_lists(graph)
+
+    expanded_classes = []
+    original_get_subclasses = utils_graph.get_subclasses
+
+    def get_subclasses(graph, all_classes, element):
+        expanded_classes.append(element.removeprefix(str(TAXONOMY)))
+        return original_get_subclasses(graph, all_classes, element)
+
+    monkeypatch.setattr(utils_graph, "get_subclasses", get_subclasses)
+
+    all_subclasses = utils_graph.get_all_subclasses(graph, nodes_list, str(TAXONOMY["A"]))
+
+    assert sorted(subclass.removeprefix(str(TAXONOMY)) for subclass in all_subclasses) == ["B", "C", "D"]
+    assert sorted(expanded_classes) == ["A", "B"]